@@ -121,18 +121,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Set up all persistent stores BEFORE first_refresh so the coordinator's
     # first poll cycle has access to persisted data (toggle counters, VPD band
-    # history, MPC results). If stores are attached after first_refresh the
-    # first cycle silently skips recording and restores stale sensor values.
+    # history, MPC results, RLS estimators, number values). If stores are
+    # attached after first_refresh the first cycle silently skips recording
+    # and restores stale sensor values.  Loading the parameter bus here also
+    # means the first poll already sees the saved number values rather than
+    # defaults — the number entities are only added after first_refresh.
     from .notes import (
         async_setup_notes_store,
         async_setup_mpc_results_store,
         async_setup_toggle_counter_store,
         async_setup_vpd_band_store,
+        async_setup_rls_store,
     )
+    await coordinator.params.async_load()
     await async_setup_notes_store(hass, entry)
     await async_setup_mpc_results_store(hass, entry)
     await async_setup_toggle_counter_store(hass, entry)
     await async_setup_vpd_band_store(hass, entry)
+    await async_setup_rls_store(hass, entry)
 
     # Fire a one-time persistent notification on first install pointing the user
     # to the example dashboard. The notes store records whether its storage file
@@ -162,6 +168,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     await coordinator.async_config_entry_first_refresh()
+    # From here on fresh sensor readings drive the control loop; the 10 s
+    # update interval only covers sensors that stop reporting
+    coordinator.async_track_sensors()
+    coordinator.async_track_light_schedule()
+    coordinator.safety.async_start()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
@@ -170,5 +181,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        # Flush the throttled RLS and parameter writes so a reload does not
+        # lose the last few minutes of adaptation
+        if coordinator is not None and getattr(coordinator, "_rls_store", None):
+            await coordinator._rls_store.async_flush(coordinator.control)
+        if coordinator is not None:
+            await coordinator.params.async_flush()
     return unload_ok
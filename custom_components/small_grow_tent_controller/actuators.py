@@ -0,0 +1,234 @@
+"""
+Actuator command tracking — commanded versus reported switch state.
+
+Decisions are re-derived every cycle, so the same command can come out of
+them poll after poll (circulation auto is "on" whenever it is configured).
+Sending each one again floods Zigbee / Wi-Fi meshes and the log, and also
+re-runs the hold-time and toggle bookkeeping for a change that did not
+happen.  The tracker sits between the decisions and the switch services:
+
+  * a command matching the device's reported state is dropped;
+  * a command already sent and not yet confirmed is not repeated until its
+    confirmation timeout has passed, then it is retried with exponential
+    backoff;
+  * a device that has not confirmed after several attempts is reported as
+    unresponsive until it next reports the commanded state.
+
+The commands themselves go out through SwitchDispatcher, which bounds how
+long the control cycle can wait on a device.  Every service call runs as its
+own task under a timeout; the cycle waits at most CALL_WAIT_S for the ones it
+must see complete (safety trips), a call still running then carries on in the
+background, and a call that fails or hangs past CALL_TIMEOUT_S goes to a
+retry queue with exponential backoff.  A later command for the same device
+replaces its queued retry, and so does a decision that needs no command
+because the device already reports the decided state.  Per-device latency of every completed call is
+kept for the diagnostics.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long a device gets to report the commanded state before a retry
+CONFIRM_TIMEOUT_S = 15.0
+# Retry delays double from CONFIRM_TIMEOUT_S up to this cap
+MAX_BACKOFF_S     = 600.0
+# Unconfirmed attempts before the device is flagged unresponsive
+UNRESPONSIVE_AFTER = 3
+
+# Longest a control cycle waits on a blocking switch call
+CALL_WAIT_S    = 5.0
+# A call still running after this is abandoned and retried
+CALL_TIMEOUT_S = 30.0
+# Retry queue: first delay, cap, and attempts before giving up — the
+# tracker's confirmation retries take over from there
+RETRY_BASE_S     = 2.0
+RETRY_MAX_S      = 60.0
+RETRY_ATTEMPTS   = 5
+
+
+class Command(Enum):
+    SKIP  = "skip"    # nothing to send — already in state, or in flight
+    SEND  = "send"    # a new command
+    RETRY = "retry"   # the previous command again, after its backoff
+
+
+@dataclass(slots=True)
+class _Pending:
+    on:       bool
+    sent_at:  datetime
+    retry_at: datetime
+    attempts: int = 1
+
+
+class ActuatorTracker:
+    __slots__ = ("_pending", "unresponsive")
+
+    def __init__(self) -> None:
+        self._pending: dict[str, _Pending] = {}
+        # entity_ids that have exhausted their attempts without confirming
+        self.unresponsive: set[str] = set()
+
+    def request(self, entity_id: str, on: bool, reported: bool | None, now: datetime) -> Command:
+        """Decide whether a decided command needs to go out."""
+        if reported is on:
+            self._confirm(entity_id)
+            return Command.SKIP
+        pending = self._pending.get(entity_id)
+        if pending is None or pending.on is not on:
+            self.sent(entity_id, on, now)
+            return Command.SEND
+        if now < pending.retry_at:
+            return Command.SKIP
+        pending.attempts += 1
+        pending.sent_at   = now
+        backoff = min(MAX_BACKOFF_S, CONFIRM_TIMEOUT_S * 2 ** (pending.attempts - 1))
+        pending.retry_at  = now + timedelta(seconds=backoff)
+        return Command.RETRY
+
+    def sent(self, entity_id: str, on: bool, now: datetime) -> None:
+        """Record a command that went out without request() (safety trips)."""
+        self._pending[entity_id] = _Pending(
+            on, now, now + timedelta(seconds=CONFIRM_TIMEOUT_S),
+        )
+
+    def observe(self, entity_id: str, reported: bool | None, now: datetime) -> bool:
+        """Match a reported state against the outstanding command, if any.
+
+        True when this confirmed the command.
+        """
+        pending = self._pending.get(entity_id)
+        if pending is None:
+            return False
+        if reported is pending.on:
+            self._confirm(entity_id)
+            return True
+        if (
+            pending.attempts >= UNRESPONSIVE_AFTER
+            and (now - pending.sent_at).total_seconds() >= CONFIRM_TIMEOUT_S
+        ):
+            self.unresponsive.add(entity_id)
+        return False
+
+    def _confirm(self, entity_id: str) -> None:
+        self._pending.pop(entity_id, None)
+        self.unresponsive.discard(entity_id)
+
+
+class SwitchDispatcher:
+    """Sends switch commands with bounded waiting and a background retry queue."""
+
+    def __init__(self, hass: HomeAssistant, title: str) -> None:
+        self._hass  = hass
+        self._title = title
+        # entity_id → cancel callback of its queued retry
+        self._retries: dict[str, CALLBACK_TYPE] = {}
+        # entity_id → token of its latest command; a failed call whose token
+        # is no longer current was superseded and is not retried
+        self._latest: dict[str, object] = {}
+        # entity_id → duration of its last completed call, ms
+        self.latency_ms: dict[str, float] = {}
+
+    async def async_send(self, turn_on: bool, entity_ids: list[str], wait: bool) -> None:
+        """Switch the devices with one service call.
+
+        With wait=True the caller waits for completion, but no longer than
+        CALL_WAIT_S; otherwise it returns straight away.  Either way the call
+        finishes, fails into the retry queue or times out in the background.
+        """
+        token = object()
+        for eid in entity_ids:
+            self._cancel_retry(eid)
+            self._latest[eid] = token
+        task = self._hass.async_create_task(self._async_call(turn_on, list(entity_ids), token))
+        if not wait:
+            return
+        done, _ = await asyncio.wait({task}, timeout=CALL_WAIT_S)
+        if not done:
+            _LOGGER.warning(
+                "%s: switch.%s for %s still running after %.0fs — continuing in the background",
+                self._title, _service(turn_on), ", ".join(entity_ids), CALL_WAIT_S,
+            )
+
+    async def _async_call(
+        self, turn_on: bool, entity_ids: list[str], token: object, attempt: int = 0,
+    ) -> None:
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                self._hass.services.async_call(
+                    "switch", _service(turn_on), {"entity_id": entity_ids}, blocking=True,
+                ),
+                CALL_TIMEOUT_S,
+            )
+        except Exception as err:
+            if len(entity_ids) > 1:
+                # Isolate the failure: each device on its own, concurrently
+                await asyncio.gather(*(
+                    self._async_call(turn_on, [eid], token, attempt) for eid in entity_ids
+                ))
+                return
+            self._schedule_retry(entity_ids[0], turn_on, token, attempt, err)
+            return
+        elapsed_ms = (time.monotonic() - start) * 1000.0
+        for eid in entity_ids:
+            self.latency_ms[eid] = round(elapsed_ms, 1)
+
+    def _schedule_retry(
+        self, entity_id: str, turn_on: bool, token: object, attempt: int, err: Exception,
+    ) -> None:
+        if self._latest.get(entity_id) is not token:
+            return   # a newer command for the device went out meanwhile
+        reason = "timed out" if isinstance(err, asyncio.TimeoutError) else f"failed: {err}"
+        if attempt + 1 >= RETRY_ATTEMPTS:
+            _LOGGER.warning(
+                "%s: switch.%s for %s %s — giving up after %d attempts",
+                self._title, _service(turn_on), entity_id, reason, attempt + 1,
+            )
+            return
+        delay = min(RETRY_MAX_S, RETRY_BASE_S * 2 ** attempt)
+        _LOGGER.warning(
+            "%s: switch.%s for %s %s — retrying in %.0fs",
+            self._title, _service(turn_on), entity_id, reason, delay,
+        )
+
+        @callback
+        def _retry(_now: datetime) -> None:
+            self._retries.pop(entity_id, None)
+            self._hass.async_create_task(self._async_call(turn_on, [entity_id], token, attempt + 1))
+
+        self._retries[entity_id] = async_call_later(self._hass, delay, _retry)
+
+    @callback
+    def supersede(self, entity_id: str) -> None:
+        """Drop the device's queued retry without sending anything.
+
+        For a decision the device already matches: the failed call must not
+        fire later against it.  A call still running is not retried either.
+        """
+        self._cancel_retry(entity_id)
+        self._latest[entity_id] = object()
+
+    def _cancel_retry(self, entity_id: str) -> None:
+        cancel = self._retries.pop(entity_id, None)
+        if cancel is not None:
+            cancel()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop every queued retry (entry unload)."""
+        for eid in list(self._retries):
+            self._cancel_retry(eid)
+
+
+def _service(turn_on: bool) -> str:
+    return "turn_on" if turn_on else "turn_off"
@@ -0,0 +1,90 @@
+"""
+Ambient tracker — the effective outside-the-tent climate MPC plans against.
+
+The lung-room / weather blend is recomputed every cycle.  It used to be
+written back into the MPC Ambient Temp / RH numbers whenever it moved
+0.05 °C or 0.5 %RH, which with a noisy lung-room sensor was most cycles:
+a number state write, a change notification and a queued params save each
+time, for a value only the coordinator reads.
+
+The tracker keeps the effective ambient as coordinator state instead.  Each
+channel runs through a first-order low-pass filter (time constant in
+minutes, 0 passes readings through) so sensor noise does not reach the MPC
+rollout.  When the sources drop out, the filtered value is held for
+STALE_AFTER_S and then the channel falls back to the number, which is now
+only the static setting (and what identification estimates).
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime
+
+# A filtered value with no fresh input for this long is not used
+STALE_AFTER_S = 1800.0
+
+
+class _Channel:
+    __slots__ = ("value", "updated_at")
+
+    def __init__(self) -> None:
+        self.value: float | None = None
+        self.updated_at: datetime | None = None
+
+    def update(self, reading: float | None, now: datetime, tau_s: float) -> None:
+        if reading is None:
+            return
+        if self.value is None or self.updated_at is None or tau_s <= 0:
+            self.value = reading
+        else:
+            dt = max(0.0, (now - self.updated_at).total_seconds())
+            self.value += (reading - self.value) * (1.0 - math.exp(-dt / tau_s))
+        self.updated_at = now
+
+    def current(self, now: datetime) -> float | None:
+        if self.value is None or self.updated_at is None:
+            return None
+        if (now - self.updated_at).total_seconds() > STALE_AFTER_S:
+            return None
+        return self.value
+
+
+class AmbientTracker:
+    def __init__(self) -> None:
+        self._temp = _Channel()
+        self._rh   = _Channel()
+        # Source of the last fresh reading, kept while the value is held
+        self._source = "static_slider"
+
+    def update(
+        self,
+        temp_c: float | None,
+        rh: float | None,
+        source: str | None,
+        now: datetime,
+        filter_min: float,
+    ) -> None:
+        """Feed this cycle's blended readings; None leaves a channel holding."""
+        tau_s = max(0.0, filter_min) * 60.0
+        self._temp.update(temp_c, now, tau_s)
+        self._rh.update(rh, now, tau_s)
+        if source is not None:
+            self._source = source
+
+    def effective(
+        self, now: datetime, fallback_temp_c: float, fallback_rh: float
+    ) -> tuple[float, float, str]:
+        """(temp, rh, source) — the filtered values, or the fallbacks once stale."""
+        temp = self._temp.current(now)
+        rh   = self._rh.current(now)
+        if temp is None and rh is None:
+            return fallback_temp_c, fallback_rh, "static_slider"
+        source = self._source
+        if temp is None or rh is None:
+            source += "+static_slider"
+        if self._temp.updated_at != now and self._rh.updated_at != now:
+            source += " (held)"
+        return (
+            fallback_temp_c if temp is None else temp,
+            fallback_rh     if rh   is None else rh,
+            source,
+        )
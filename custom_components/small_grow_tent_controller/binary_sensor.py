@@ -52,6 +52,8 @@ async def async_setup_entry(
     entities.append(SensorsUnavailableBinarySensor(entry, coordinator))
     # Disturbance hold indicator
     entities.append(DisturbanceActiveBinarySensor(entry, coordinator))
+    # Device switches not confirming commands
+    entities.append(ActuatorUnresponsiveBinarySensor(entry, coordinator))
 
     async_add_entities(entities)
 
@@ -126,3 +128,33 @@ class DisturbanceActiveBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         return bool((self.coordinator.data or {}).get("disturbance_active", False))
+
+
+class ActuatorUnresponsiveBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """
+    Binary sensor that turns ON while a device switch is not confirming
+    commands — it has not reported the commanded state after several
+    attempts with backoff.
+
+    ON  = problem (attribute `entities` lists the switches)
+    OFF = every commanded switch has confirmed
+    """
+
+    _attr_has_entity_name  = True
+    _attr_device_class     = BinarySensorDeviceClass.PROBLEM
+    _attr_icon             = "mdi:power-plug-off-outline"
+
+    def __init__(self, entry: ConfigEntry, coordinator) -> None:
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_unique_id   = f"{entry.entry_id}_actuator_unresponsive"
+        self._attr_name        = "Actuator Unresponsive"
+        self._attr_device_info = device_info_for_entry(entry)
+
+    @property
+    def is_on(self) -> bool:
+        return bool((self.coordinator.data or {}).get("actuators_unresponsive"))
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {"entities": list((self.coordinator.data or {}).get("actuators_unresponsive", []))}
@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, time
+from operator import mul, sub
 from typing import Any
 
 from homeassistant.components import persistent_notification
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_time, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
-from .climate_math import safe_float, avg, dew_point_c, vpd_leaf_kpa, sat_vapor_pressure_kpa
+from .climate_math import avg, dew_point_c, safe_float, vpd_leaf_kpa, sat_vapor_pressure_kpa
+from .cycle import CycleData
+from .actuators import ActuatorTracker, Command, SwitchDispatcher
+from .ambient import AmbientTracker
+from .model import ModelParams, RolloutTable
+from .params import ParameterBus
+from .reasons import AUTO, Code, Reason, Tag
+from .settings import Settings
+from .safety import SafetyWatchdog
+from .scheduler import WakeScheduler
+from .snapshot import StateSnapshot
+from .timing import CycleTimer
+from .rls import InnovationCusum, RLSBank
 from .const import (
     DOMAIN,
     DEFAULT_STAGE,
@@ -19,13 +38,13 @@ from .const import (
     STAGE_NIGHT_TARGET_TEMP_C,
     STAGE_NIGHT_TARGET_VPD_KPA,
     STAGE_NIGHT_TARGET_RH,
-    CONF_NIGHT_MODE,
+    NIGHT_MODE_DEW,
     NIGHT_MODE_VPD,
     NIGHT_MODE_VPD_NO_HEATER,
     NIGHT_MODE_MPC,
     EXHAUST_MODE_DAY_ON,
     EXHAUST_MODE_NIGHT_ON,
-    CONF_DAY_MODE,
+    DAY_MODE_VPD,
     DAY_MODE_MPC,
     DAY_MODE_LIMITS,
     STAGE_TARGET_TEMP_C,
@@ -48,14 +67,11 @@ from .const import (
     CONF_RH_SENSOR_1,
     CONF_RH_SENSOR_2,
     CONF_RH_SENSOR_3,
-    CONF_EXHAUST_SAFETY_OVERRIDE,
     CONF_EXHAUST_SAFETY_MAX_TEMP_C,
     CONF_EXHAUST_SAFETY_MAX_RH,
     CONF_AMBIENT_TEMP,
     CONF_AMBIENT_RH,
     CONF_WEATHER_ENTITY,
-    CONF_RLS_ENABLED,
-    CONF_MPC_AUTO_IDENTIFY_WEEKLY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -73,7 +89,60 @@ STAGE_NIGHT_PROFILE: dict[str, dict[str, Any]] = {
     "Drying":            {"exhaust_mode": "on",   "dew_margin_add_c": 1.0},
 }
 
-# Light schedule defaults — must match time.py defaults exactly
+# The model, RLS, lag history, ramp and disturbance deltas all step on a
+# fixed 10-second grid.  Sensor events can run extra control cycles in
+# between; those act on fresh readings but do not advance the grid.
+_SAMPLE_PERIOD_S = 10.0
+# A sensor rejected as a spike for this long is treated as failed — five
+# 10-second steps, whatever the poll interval
+_ANOMALY_FAILURE_S = 50.0
+# A timer cycle may land a little early; still count it as on the grid
+_SAMPLE_SLACK_S = 0.5
+# Sensor reports arriving within this window share one control cycle (a
+# temperature and RH pair from the same device lands milliseconds apart)
+_EVENT_DEBOUNCE_S = 1.0
+
+# Adaptive watchdog interval (see _next_poll_interval).  Fast near the hard
+# limits, during a disturbance hold and right after actuation; slow once
+# VPD has held its band for a while, unless RLS is learning.
+_POLL_FAST_S  = 3.0
+_POLL_CALM_S  = 30.0
+_POLL_IDLE_S  = 60.0
+_FAST_AFTER_ACTUATION_S = 30.0
+_CALM_AFTER_S = 15 * 60
+_IDLE_AFTER_S = 60 * 60
+# "Near" a hard limit
+_LIMIT_MARGIN_C  = 0.5
+_LIMIT_MARGIN_RH = 3.0
+# While calm, a sensor report only runs a cycle if it moved at least this
+# far from the reading the last cycle used
+_CALM_EVENT_DELTA_C  = 0.3
+_CALM_EVENT_DELTA_RH = 1.5
+
+# Longest heater / exhaust dead time the ARX model supports, in polls —
+# must match the max of the mpc_*_lag number entities
+_MAX_INPUT_LAG = 12
+
+# RLS sanity clamps — keep every bank member's parameters physically plausible
+_RLS_BOUNDS_T = (
+    (-1.0, 2.0),    # a_heater:  must be positive
+    (-0.5, 0.5),    # a_exhaust: expected negative, clamped to prevent over-attribution
+    (0.005, 0.5),   # a_passive: floor at 0.005 (zero collapses thermal mass term)
+    (-0.5, 0.5),    # a_bias
+)
+_RLS_BOUNDS_R = (
+    (-3.0, 0.5),    # b_exhaust: expected negative, clamped to prevent wet-towel corruption
+    (0.003, 0.5),   # b_passive: floor at 0.003 (zero collapses humidity mass term)
+    (-2.0, 2.0),    # b_bias
+)
+
+# Minimum spacing of RLS change-detector alarms (journal note, action and
+# re-identification).  While RLS converges after a real change the detector
+# re-fires every few samples; one alarm covers it, and if a fresh fit does
+# not remove the mismatch, refitting every few minutes will not either
+_CHANGE_ALARM_COOLDOWN_S = 86400
+
+# Light schedule defaults — must match time.py and settings.py defaults exactly
 _DEFAULT_LIGHT_ON  = time(9,  0, 0)
 _DEFAULT_LIGHT_OFF = time(21, 0, 0)
 
@@ -115,27 +184,40 @@ class ControlState:
     # Effective ramped temperature target (°C) — slides toward actual target at ramp rate
     ramped_target_temp_c: float | None = None
 
-    # RLS state — persists across poll cycles
+    # RLS state — persists across poll cycles.  One estimator bank per model
+    # and period, keyed "temp_day" / "temp_night" / "rh_day" / "rh_night":
     # Temperature model: θ_t = [a_heater, a_exhaust, a_passive, a_bias]
-    rls_theta_t: list | None = None   # 4-element parameter vector
-    rls_P_t:     list | None = None   # 4x4 covariance matrix (flattened)
-    # Humidity model: θ_r = [b_exhaust, b_passive, b_bias]
-    rls_theta_r: list | None = None   # 3-element parameter vector
-    rls_P_r:     list | None = None   # 3x3 covariance matrix (flattened)
+    # Humidity model:    θ_r = [b_exhaust, b_passive, b_bias]
+    rls_banks: dict = field(default_factory=dict)
+    # Plant-change detectors on the active member's innovation, same keys
+    rls_detectors: dict = field(default_factory=dict)
+    # Model snapshot version the banks were seeded from / last published —
+    # any other writer moving it (identification, manual edit) reseeds them
+    rls_model_version: int | None = None
     # Previous observations (needed to compute delta for next update)
     rls_prev_temp:   float | None = None
     rls_prev_rh:     float | None = None
     rls_prev_heater: int   | None = None
     rls_prev_exhaust:int   | None = None
+    # Humidifier / dehumidifier are not RLS regressors; their identified
+    # effect is taken off the observed step instead (see _apply_rls_update)
+    rls_prev_humidifier:   int = 0
+    rls_prev_dehumidifier: int = 0
     rls_prev_amb_t:  float | None = None
     rls_prev_amb_r:  float | None = None
+    # Heater / exhaust state applied at each recent poll, oldest first — the
+    # ARX dead time reads inputs from here (MPC lead-in and RLS regressors)
+    heater_history:  list = field(default_factory=list)
+    exhaust_history: list = field(default_factory=list)
 
     # MPC model identification results
     mpc_r2_temp:         float | None = None
     mpc_r2_rh:           float | None = None
     mpc_last_identified: str   | None = None
-    # Weekly auto-identification scheduling
+    # Auto-identification scheduling — weekly fallback when RLS is off, and
+    # the cooldown for change-detector alarms
     last_auto_identify:  datetime | None = None
+    last_change_alarm:   datetime | None = None
 
     # RLS transition guard — suppresses RLS updates for N polls after a
     # day/night transition to avoid the grow light heat corrupting a_heater.
@@ -150,17 +232,34 @@ class ControlState:
     # Keyed by sensor index 0/1/2 for temp and rh separately
     last_good_temp: dict = field(default_factory=dict)  # {0: float, 1: float, 2: float}
     last_good_rh:   dict = field(default_factory=dict)  # {0: float, 1: float, 2: float}
-    # Consecutive anomaly counter per sensor — if too many in a row it's a
-    # real failure, not a spike, and we let the normal unavailability logic handle it
-    anomaly_streak_temp: dict = field(default_factory=dict)  # {0: int, 1: int, 2: int}
-    anomaly_streak_rh:   dict = field(default_factory=dict)  # {0: int, 1: int, 2: int}
+    # ... and when it was accepted — the allowed jump grows with the gap
+    last_good_at_temp: dict = field(default_factory=dict)  # {0: datetime, ...}
+    last_good_at_rh:   dict = field(default_factory=dict)  # {0: datetime, ...}
+    # Start of the current anomalous run per sensor — if it lasts too long it's
+    # a real failure, not a spike, and we let the normal unavailability logic handle it
+    anomaly_since_temp: dict = field(default_factory=dict)  # {0: datetime, ...}
+    anomaly_since_rh:   dict = field(default_factory=dict)  # {0: datetime, ...}
 
     # Previous averaged readings — used for disturbance detection delta
     prev_avg_temp: float | None = None
     prev_avg_rh:   float | None = None
 
+    # When the next cycle on the 10-second model grid is due
+    next_sample_at: datetime | None = None
+    # When prev_avg_* were taken — disturbance deltas are per grid step
+    prev_avg_at: datetime | None = None
+    # When the temperature ramp last advanced
+    ramp_updated_at: datetime | None = None
+    # Last time a switch command went out — polls run fast for a while after
+    last_actuation_at: datetime | None = None
+    # Current in-band streak — None when VPD is out of band
+    vpd_in_band_since: datetime | None = None
+
     # Last action recorded by the controller
     last_action: str = "none"
+    # Switch commands per device and reason code, persisted with the toggle
+    # counters — {"heater": Counter({"dew_floor": 3, ...}), ...}
+    action_counts: dict = field(default_factory=dict)
 
     # ── Observability ────────────────────────────────────────────────────────
     # VPD deadband performance tracking — counts 10-second polls
@@ -194,7 +293,7 @@ class ControlState:
 #   - override_source records which layer set the decision (for logging)
 #   - blocking flag marks safety-critical trips that must use blocking=True
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ControlDecision:
     heater:       bool | None = None
     exhaust:      bool | None = None
@@ -203,98 +302,314 @@ class ControlDecision:
     circ:         bool | None = None
     light:        bool | None = None
     mode:         str = ""
-    heater_reason:       str = ""
-    exhaust_reason:      str = ""
-    humidifier_reason:   str = ""
-    dehumidifier_reason: str = ""
-    circ_reason:         str = ""
-    light_reason:        str = ""
-    # When True, _apply_decision uses blocking=True for ALL switches in this
-    # decision (reserved for safety trips that must complete before returning).
+    heater_reason:       Reason | None = None
+    exhaust_reason:      Reason | None = None
+    humidifier_reason:   Reason | None = None
+    dehumidifier_reason: Reason | None = None
+    circ_reason:         Reason | None = None
+    light_reason:        Reason | None = None
+    # When True, the cycle's command batch is sent with blocking=True so these
+    # switches have completed before the cycle returns (reserved for safety
+    # trips such as disturbance neutral).
     blocking: bool = False
 
 
 # ---------------------------------------------------------------------------
-# Runtime context — passed between the focused sub-methods each cycle
+# Runtime context — passed between the focused sub-methods each cycle.
+# Keyword-only with defaults, so paths that only actuate (controller
+# disabled) pass just the entity ids.
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class _Ctx:
-    data:               dict[str, Any]
+    data:               CycleData
     now:                datetime
-    stage:              str
-    drying:             bool
-    is_day:             bool
-    avg_temp:           float
-    avg_rh:             float
-    dew:                float
-    vpd:                float
-    min_temp:           float
-    max_temp:           float
-    min_rh:             float
-    max_rh:             float
-    dew_margin:         float
-    heater_hold:        float
-    exhaust_hold:       float
-    humidifier_hold:    float
-    dehumidifier_hold:  float
-    exhaust_eid:        str | None
-    heater_eid:         str | None
-    humidifier_eid:     str | None
-    dehumidifier_eid:   str | None
-    circ_eid:           str | None
-    heater_on:          bool
-    exhaust_on:         bool
-    humidifier_on:      bool
-    dehumidifier_on:    bool
-    circ_on:            bool
-    exhaust_safety_on:  bool
-    exhaust_safety_max_temp: float
-    exhaust_safety_max_rh:   float
-    heater_max_run_s:   float
-    night_mode:         str
-    night_vpd_target:   float
-    night_target_temp:  float
-    night_target_rh:    float
-    temp_ramp_rate:     float
-    day_mode:           str
+    # Model snapshot taken at the start of the cycle — immutable, versioned
+    model:              ModelParams
+    stage:              str   = DEFAULT_STAGE
+    drying:             bool  = False
+    is_day:             bool  = True
+    avg_temp:           float = 0.0
+    avg_rh:             float = 0.0
+    dew:                float = 0.0
+    vpd:                float = 0.0
+    min_temp:           float = 20.0
+    max_temp:           float = 30.0
+    min_rh:             float = 40.0
+    max_rh:             float = 70.0
+    dew_margin:         float = 1.0
+    heater_hold:        float = 60.0
+    exhaust_hold:       float = 45.0
+    humidifier_hold:    float = 45.0
+    dehumidifier_hold:  float = 45.0
+    exhaust_eid:        str | None = None
+    heater_eid:         str | None = None
+    humidifier_eid:     str | None = None
+    dehumidifier_eid:   str | None = None
+    circ_eid:           str | None = None
+    heater_on:          bool = False
+    exhaust_on:         bool = False
+    humidifier_on:      bool = False
+    dehumidifier_on:    bool = False
+    circ_on:            bool = False
+    exhaust_safety_on:  bool = False
+    exhaust_safety_max_temp: float = 30.0
+    exhaust_safety_max_rh:   float = 75.0
+    heater_max_run_s:   float = 0.0
+    night_mode:         str   = NIGHT_MODE_DEW
+    night_vpd_target:   float = 1.00
+    night_target_temp:  float = 20.0
+    night_target_rh:    float = 55.0
+    temp_ramp_rate:     float = 1.0
+    day_mode:           str   = DAY_MODE_VPD
     # MPC model parameters
-    mpc_horizon:        int
-    mpc_temp_amb:       float
-    mpc_rh_amb:         float
-    mpc_a_heater:       float
-    mpc_a_exhaust:      float
-    mpc_a_passive:      float
-    mpc_a_bias:         float
-    mpc_a_bias_day:     float
-    mpc_b_exhaust:      float
-    mpc_b_passive:      float
-    mpc_b_bias:         float
-    mpc_w_vpd:          float
-    mpc_w_temp:         float
-    mpc_w_rh:           float
-    mpc_w_switch:       float
-
-
-class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    mpc_horizon:        int   = 3
+    mpc_temp_amb:       float = 20.0
+    mpc_rh_amb:         float = 55.0
+    mpc_w_vpd:          float = 5.0
+    mpc_w_temp:         float = 2.0
+    mpc_w_rh:           float = 1.0
+    mpc_w_switch:       float = 0.5
+
+
+class GrowTentCoordinator(DataUpdateCoordinator[CycleData]):
 
     def __init__(self, hass: HomeAssistant, entry):
         self.hass  = hass
         self.entry = entry
         self.control = ControlState()
+        # Number entity values — read every poll, written by RLS /
+        # identification / ambient tracking / stage resets
+        self.params  = ParameterBus(hass, entry.entry_id)
+        # Switch / select / time values, pushed by their entities
+        self.settings = Settings(on_change=self._on_setting_changed)
+        # In-flight identification — concurrent requests share it
+        self._identify_task: asyncio.Task | None = None
+        # Current model snapshot.  A new version is published for every
+        # parameter-bus batch that touches a model key; each poll cycle reads
+        # it once so a write landing mid-cycle cannot mix coefficients.
+        self.model = ModelParams()
+        self.params.add_change_listener(self._on_params_changed)
+        # MPC rollout table, rebuilt only when the model version moves
+        self._rollout_table: RolloutTable | None = None
+        # (domain, key) → entity_id of this entry's own entities, built on
+        # first use and dropped when the registry changes one of them
+        self._entity_map: dict[tuple[str, str], str] | None = None
+        entry.async_on_unload(
+            hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_registry_updated)
+        )
+        # External entity states for the running cycle — replaced at the
+        # start of every poll, see snapshot.py
+        self._snapshot = StateSnapshot(hass)
+        # Switch commands decided this cycle, entity_id → on; sent together
+        # by _async_flush_switches once all decisions are in
+        self._pending_switches: dict[str, bool] = {}
+        self._pending_blocking = False
+        # Commanded vs reported switch state — drops redundant commands and
+        # retries unconfirmed ones, see actuators.py
+        self._actuators = ActuatorTracker()
+        # Sends them: bounded waits, background retries, per-device latency
+        self._dispatcher = SwitchDispatcher(hass, entry.title)
+        entry.async_on_unload(self._dispatcher.async_shutdown)
+        # One cycle at a time: the snapshot, pending switch batch, grid
+        # bookkeeping and timer below are per-cycle state on the instance,
+        # and a cycle awaits (MPC executor, switch flush, stores) long enough
+        # for an event, timer or wake-up to start another
+        self._cycle_lock = asyncio.Lock()
+        # Set when an exact-time trigger arrived mid-cycle — one more cycle
+        # runs as soon as the current one finishes
+        self._rerun = False
+        # Grid steps the running cycle advances the model by — 0 between
+        # ticks, more than 1 when polls were slower than the grid
+        self._sample_steps = 1
+        self._sample_tick  = True
+        # Sensor readings the last cycle used, for the calm-mode event filter
+        self._cycle_readings: dict[str, float | None] = {}
+        # Heater max-run, sensor-dropout and exhaust-safety rules evaluated
+        # on events and timers, outside the cycle — see safety.py
+        self.safety = SafetyWatchdog(self)
+        # Runs a cycle exactly when a pulse, cooldown, lockout or hold ends —
+        # see scheduler.py
+        self._wake = WakeScheduler(hass, self._handle_wake)
+        entry.async_on_unload(self._wake.async_shutdown)
+        # Next light on/off transition — see async_track_light_schedule
+        self._light_unsub: CALLBACK_TYPE | None = None
+        entry.async_on_unload(self._cancel_light_schedule)
+        # Per-phase cycle timing — see timing.py
+        self.timing = CycleTimer(entry.title)
+        # Filtered effective ambient for MPC — see ambient.py
+        self.ambient = AmbientTracker()
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=timedelta(seconds=10),
+            # Watchdog only: sensor events drive control (async_track_sensors)
+            # and every refresh pushes this timer back, so it fires when the
+            # sensors have gone quiet for a whole period
+            update_interval=timedelta(seconds=_SAMPLE_PERIOD_S),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=_EVENT_DEBOUNCE_S, immediate=False
+            ),
+        )
+
+    def _on_params_changed(self, changed: dict[str, float]) -> None:
+        self.model = self.model.evolve(changed)
+
+    def _on_setting_changed(self, key: str) -> None:
+        if key in ("light_on", "light_off"):
+            self.async_track_light_schedule()
+        # Stage, mode and schedule changes act now rather than on the next
+        # poll; the refresh debouncer coalesces bursts (e.g. restores at setup)
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_track_light_schedule(self) -> None:
+        """(Re)arm a trigger for the next light on / off time.
+
+        The transition runs its own cycle at that instant, so the light and
+        everything keyed to day / night (targets, ramp reset, RLS guard)
+        switch on time rather than at the next poll.  Re-armed after each
+        transition and whenever the light schedule changes.
+        """
+        self._cancel_light_schedule()
+        now_local = dt_util.as_local(self._now())
+        upcoming = []
+        for t in (self.settings.light_on, self.settings.light_off):
+            at = now_local.replace(hour=t.hour, minute=t.minute, second=t.second, microsecond=0)
+            if at <= now_local:
+                at = (now_local + timedelta(days=1)).replace(
+                    hour=t.hour, minute=t.minute, second=t.second, microsecond=0,
+                )
+            upcoming.append(at)
+        self._light_unsub = async_track_point_in_time(
+            self.hass, self._handle_light_transition, min(upcoming)
+        )
+
+    @callback
+    def _cancel_light_schedule(self) -> None:
+        if self._light_unsub is not None:
+            self._light_unsub()
+            self._light_unsub = None
+
+    @callback
+    def _handle_light_transition(self, _now: datetime) -> None:
+        self._light_unsub = None
+        self.async_track_light_schedule()
+        # Straight to a cycle (or a rerun of the running one), like wake-ups
+        self._async_refresh_now()
+
+    @callback
+    def _handle_wake(self) -> None:
+        # Not through the debouncer: its delay would undo the timing
+        self._async_refresh_now()
+
+    def _arm_wakeups(self) -> None:
+        """Sync the heater's pulse / cooldown / lockout ends into the scheduler."""
+        ctrl = self.control
+        now  = self._now()
+        for key, when in (
+            ("heater_pulse",    ctrl.heater_pulse_until),
+            ("heater_cooldown", ctrl.heater_cooldown_until),
+            ("heater_lockout",  ctrl.heater_max_lockout_until),
+        ):
+            if when is None or when <= now:
+                self._wake.cancel(key)
+            else:
+                self._wake.schedule(key, when)
+
+    @callback
+    def async_track_sensors(self) -> None:
+        """Run a control cycle whenever a temperature or RH sensor reports.
+
+        Called once the first refresh has run, so events never race the
+        store setup.  The refresh debouncer coalesces a burst of reports into
+        one cycle.
+        """
+        temp_eids, rh_eids = self._sensor_eids()
+        eids = temp_eids + rh_eids
+        if eids:
+            self.entry.async_on_unload(
+                async_track_state_change_event(self.hass, eids, self._handle_sensor_event)
+            )
+
+    @callback
+    def _handle_sensor_event(self, event: Event) -> None:
+        old, new = event.data.get("old_state"), event.data.get("new_state")
+        # Attribute-only updates carry no new reading
+        if new is None or (old is not None and old.state == new.state):
+            return
+        if self.update_interval.total_seconds() > _SAMPLE_PERIOD_S:
+            # Calm: only a reading that moved meaningfully is worth a cycle
+            # (an unavailable sensor always is)
+            eid   = event.data.get("entity_id")
+            value = safe_float(new.state)
+            last  = self._cycle_readings.get(eid)
+            delta = _CALM_EVENT_DELTA_C if eid in self._sensor_eids()[0] else _CALM_EVENT_DELTA_RH
+            if value is not None and last is not None and abs(value - last) < delta:
+                return
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _take_sample_steps(self, now: datetime) -> int:
+        """Grid steps this cycle advances the 10-second model by.
+
+        0 between ticks, 1 on a tick, k when the last k − 1 ticks passed
+        without a cycle (slow polling).  The grid is kept in absolute time
+        rather than restarted from each cycle, so event-driven cycles landing
+        between ticks do not stretch the model's step.
+        """
+        ctrl = self.control
+        due  = ctrl.next_sample_at
+        if due is None:
+            ctrl.next_sample_at = now + timedelta(seconds=_SAMPLE_PERIOD_S)
+            return 1
+        late = (now - due).total_seconds()
+        if late < -_SAMPLE_SLACK_S:
+            return 0
+        steps = 1 + max(0, int(late // _SAMPLE_PERIOD_S))
+        ctrl.next_sample_at = due + timedelta(seconds=steps * _SAMPLE_PERIOD_S)
+        return steps
+
+    def _next_poll_interval(self, data: CycleData) -> float:
+        """Watchdog interval for the next cycle, in seconds.
+
+        Sensor events still run cycles in between; this sets how soon a
+        cycle runs without one.  With RLS on it never slows past the sample
+        period: RLS, its bank and the change detector learn from one-step
+        pairs, and a slower watchdog would leave them idle for most of a
+        settled day.
+        """
+        ctrl = self.control
+        now  = self._now()
+        avg_t, avg_r = data.avg_temp_c, data.avg_rh
+        if avg_t is None or avg_r is None:
+            return _SAMPLE_PERIOD_S
+        near_limit = (
+            avg_t <= data.min_temp_c + _LIMIT_MARGIN_C
+            or avg_t >= data.max_temp_c - _LIMIT_MARGIN_C
+            or avg_r <= data.min_rh + _LIMIT_MARGIN_RH
+            or avg_r >= data.max_rh - _LIMIT_MARGIN_RH
+        )
+        recently_actuated = (
+            ctrl.last_actuation_at is not None
+            and (now - ctrl.last_actuation_at).total_seconds() < _FAST_AFTER_ACTUATION_S
         )
+        if near_limit or ctrl.disturbance_active or recently_actuated:
+            return _POLL_FAST_S
+        if data.rls_enabled:
+            return _SAMPLE_PERIOD_S
+        if ctrl.vpd_in_band_since is not None:
+            in_band_s = (now - ctrl.vpd_in_band_since).total_seconds()
+            if in_band_s >= _IDLE_AFTER_S:
+                return _POLL_IDLE_S
+            if in_band_s >= _CALM_AFTER_S:
+                return _POLL_CALM_S
+        return _SAMPLE_PERIOD_S
 
     # ------------------------------------------------------------------ #
     #  Generic helpers                                                     #
     # ------------------------------------------------------------------ #
 
     def _get_state_float(self, entity_id: str) -> float | None:
-        st = self.hass.states.get(entity_id)
-        return None if st is None else safe_float(st.state)
+        return self._snapshot.get_float(entity_id)
 
     def _get_option(self, key: str) -> Any:
         # options take priority; both False and "" are legitimate values
@@ -307,11 +622,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return bool(v) if v is not None else True
 
     def _get_mode(self, mode_key: str) -> str:
-        eid = self._entity_id("select", mode_key)
-        st  = self.hass.states.get(eid)
-        if st is None:
-            return "Auto"
-        return st.state if st.state in ("Auto", "On", "Off", "Day On", "Night On") else "Auto"
+        return getattr(self.settings, mode_key)
 
     def _now(self) -> datetime:
         return dt_util.now()
@@ -328,7 +639,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         state attributes: temperature (°C) and humidity (%).
         Returns (temp, rh) — either may be None if unavailable.
         """
-        state = self.hass.states.get(weather_eid)
+        state = self._snapshot.get(weather_eid)
         if state is None or state.state in ("unavailable", "unknown"):
             return None, None
         attrs = state.attributes
@@ -345,78 +656,239 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return temp, rh
 
     def _entity_id(self, domain: str, key: str) -> str:
-        registry  = er.async_get(self.hass)
-        unique_id = f"{self.entry.entry_id}_{key}"
-        eid = registry.async_get_entity_id(domain, DOMAIN, unique_id)
+        if self._entity_map is None:
+            self._entity_map = self._build_entity_map()
+        eid = self._entity_map.get((domain, key))
         return eid or f"{domain}.{self.entry.entry_id}_{key}"
 
-    def _switch_is_on(self, entity_id: str | None) -> bool | None:
-        if not entity_id:
-            return None
-        st = self.hass.states.get(entity_id)
-        return None if st is None else st.state == "on"
+    def _build_entity_map(self) -> dict[tuple[str, str], str]:
+        """Resolve every entity this entry owns in one registry pass."""
+        registry = er.async_get(self.hass)
+        prefix   = f"{self.entry.entry_id}_"
+        return {
+            (reg.domain, reg.unique_id[len(prefix):]): reg.entity_id
+            for reg in er.async_entries_for_config_entry(registry, self.entry.entry_id)
+            if reg.platform == DOMAIN and reg.unique_id.startswith(prefix)
+        }
 
-    def _can_toggle(self, last_change: datetime | None, hold_seconds: float) -> bool:
-        return last_change is None or (self._now() - last_change).total_seconds() >= hold_seconds
+    @callback
+    def _handle_registry_updated(self, event: Event) -> None:
+        """Drop the entity map when one of this entry's entities changes.
 
-    def _get_entity_state(self, entity_id: str) -> str | None:
-        st = self.hass.states.get(entity_id)
-        return None if st is None else st.state
+        Creates and renames are matched by the entity's config entry;
+        removals (no longer in the registry) by the IDs already mapped.
+        """
+        if self._entity_map is None:
+            return
+        mapped = self._entity_map.values()
+        eid    = event.data.get("entity_id")
+        if eid in mapped or event.data.get("old_entity_id") in mapped:
+            self._entity_map = None
+            return
+        reg = er.async_get(self.hass).async_get(eid) if eid else None
+        if reg is not None and reg.config_entry_id == self.entry.entry_id:
+            self._entity_map = None
 
-    def _num(self, entity_id: str, default: float) -> float:
-        val = safe_float(self._get_entity_state(entity_id))
-        return default if val is None else val
+    def _sensor_eids(self) -> tuple[list[str], list[str]]:
+        """Configured temperature and RH sensor entity IDs."""
+        temp_eids = [
+            eid for eid in map(self._get_option, (CONF_TEMP_SENSOR_1, CONF_TEMP_SENSOR_2, CONF_TEMP_SENSOR_3))
+            if eid
+        ]
+        rh_eids = [
+            eid for eid in map(self._get_option, (CONF_RH_SENSOR_1, CONF_RH_SENSOR_2, CONF_RH_SENSOR_3))
+            if eid
+        ]
+        return temp_eids, rh_eids
 
-    def _parse_time(self, s: str | None, default: time) -> time:
-        if not s:
-            return default
-        try:
-            parts = s.split(":")
-            return time(int(parts[0]), int(parts[1]) if len(parts) > 1 else 0, int(parts[2]) if len(parts) > 2 else 0)
-        except Exception:
-            return default
+    def _switch_eids(self) -> list[str]:
+        """Configured device switch entity IDs."""
+        keys = (
+            CONF_LIGHT_SWITCH, CONF_CIRC_SWITCH, CONF_EXHAUST_SWITCH,
+            CONF_HEATER_SWITCH, CONF_HUMIDIFIER_SWITCH, CONF_DEHUMIDIFIER_SWITCH,
+        )
+        return [eid for eid in map(self._get_option, keys) if eid]
+
+    def _watched_entity_ids(self) -> list[str]:
+        """Every configured external entity the cycle reads."""
+        temp_eids, rh_eids = self._sensor_eids()
+        ambient = (CONF_AMBIENT_TEMP, CONF_AMBIENT_RH, CONF_WEATHER_ENTITY)
+        return (
+            temp_eids + rh_eids + self._switch_eids()
+            + [eid for eid in map(self._get_option, ambient) if eid]
+        )
+
+    def _switch_is_on(self, entity_id: str | None) -> bool | None:
+        return self._snapshot.is_on(entity_id)
+
+    def _can_toggle(self, last_change: datetime | None, hold_seconds: float) -> bool:
+        if last_change is None:
+            return True
+        eligible = last_change + timedelta(seconds=hold_seconds)
+        if self._now() >= eligible:
+            return True
+        # Blocked by the hold — re-evaluate the moment it expires.  Keyed by
+        # the change, so a device asking again every cycle keeps one wake-up.
+        self._wake.schedule(("hold", last_change, hold_seconds), eligible)
+        return False
 
     async def _async_switch(self, entity_id: str, turn_on: bool, blocking: bool = False) -> None:
-        """Switch a device. blocking=True reserved for safety-critical trips."""
-        await self.hass.services.async_call(
-            "switch",
-            "turn_on" if turn_on else "turn_off",
-            {"entity_id": entity_id},
-            blocking=blocking,
+        """Switch a device now. blocking=True reserved for safety-critical trips.
+
+        Supersedes any command already queued for the device this cycle.
+        blocking=True waits for the call, but never longer than the
+        dispatcher's bound (actuators.CALL_WAIT_S).
+        """
+        self._pending_switches.pop(entity_id, None)
+        self._snapshot.command(entity_id, turn_on)
+        self.control.last_actuation_at = self._now()
+        self._actuators.sent(entity_id, turn_on, self.control.last_actuation_at)
+        await self._dispatcher.async_send(turn_on, [entity_id], blocking)
+
+    def _command(self, entity_id: str, turn_on: bool, blocking: bool) -> bool:
+        """Queue a decided command unless the device is already there.
+
+        Returns True only for a new command — the caller's change bookkeeping
+        (hold timers, toggle counters, action log) runs for that alone, not
+        for a redundant or retried one.
+        """
+        cmd = self._actuators.request(
+            entity_id, turn_on, self._snapshot.reported(entity_id), self._now(),
         )
+        if cmd is Command.SKIP:
+            # Drop anything queued earlier this cycle in the other direction
+            self._pending_switches.pop(entity_id, None)
+            self._snapshot.command(entity_id, turn_on)
+            if self._snapshot.reported(entity_id) is turn_on:
+                # Already there — a retry of an older failed call must not
+                # switch it back
+                self._dispatcher.supersede(entity_id)
+            return False
+        self._queue_switch(entity_id, turn_on, blocking)
+        if cmd is Command.RETRY:
+            _LOGGER.info(
+                "%s: %s has not reported %s — retrying",
+                self.entry.title, entity_id, "on" if turn_on else "off",
+            )
+            return False
+        return True
+
+    def _observe_actuators(self, data: CycleData) -> None:
+        """Match the switches' reported states against outstanding commands."""
+        now    = self._now()
+        before = set(self._actuators.unresponsive)
+        for eid in self._switch_eids():
+            if self._actuators.observe(eid, self._snapshot.reported(eid), now):
+                self._dispatcher.supersede(eid)
+        for eid in self._actuators.unresponsive - before:
+            _LOGGER.warning(
+                "%s: %s is not responding to switch commands", self.entry.title, eid,
+            )
+        for eid in before - self._actuators.unresponsive:
+            _LOGGER.info("%s: %s is responding again", self.entry.title, eid)
+        data.actuators_unresponsive = sorted(self._actuators.unresponsive)
+        for name, key in (
+            ("heater",       CONF_HEATER_SWITCH),
+            ("exhaust",      CONF_EXHAUST_SWITCH),
+            ("humidifier",   CONF_HUMIDIFIER_SWITCH),
+            ("dehumidifier", CONF_DEHUMIDIFIER_SWITCH),
+            ("circulation",  CONF_CIRC_SWITCH),
+            ("light",        CONF_LIGHT_SWITCH),
+        ):
+            data[f"debug_{name}_latency_ms"] = self._dispatcher.latency_ms.get(self._get_option(key))
+
+    def _queue_switch(self, entity_id: str, turn_on: bool, blocking: bool) -> None:
+        """Queue a command for the end-of-cycle batch; a later one for the
+        same device replaces it."""
+        self._pending_switches[entity_id] = turn_on
+        self._pending_blocking |= blocking
+        self._snapshot.command(entity_id, turn_on)
+
+    async def _async_flush_switches(self) -> None:
+        """Send the cycle's queued commands.
+
+        Commands in the same direction share one switch service call with
+        several entity_ids; the turn_on and turn_off calls run concurrently.
+        The dispatcher bounds the wait and retries failures in the background,
+        isolating each device of a failed group.
+        """
+        pending, blocking = self._pending_switches, self._pending_blocking
+        self._pending_switches, self._pending_blocking = {}, False
+        if not pending:
+            return
+        self.control.last_actuation_at = self._now()
+        groups = (
+            (True,  [eid for eid, on in pending.items() if on]),
+            (False, [eid for eid, on in pending.items() if not on]),
+        )
+        await asyncio.gather(*(
+            self._dispatcher.async_send(turn_on, eids, blocking)
+            for turn_on, eids in groups if eids
+        ))
 
     def _record_action(self, description: str) -> None:
         """Store the last action with a timestamp for the last_action sensor."""
         ts = dt_util.as_local(self._now()).strftime("%H:%M:%S")
         self.control.last_action = f"{description} @ {ts}"
 
+    def _count_action(self, device: str, reason: Reason) -> None:
+        """Count a switch command under its reason code (last_action attributes).
+
+        Persisted with the toggle counters, so the counts survive restarts.
+        A command the exhaust safety turned from off into on counts as an
+        exhaust safety event, not under the override that asked for off.
+        """
+        counts = self.control.action_counts.get(device)
+        if counts is None:
+            counts = self.control.action_counts[device] = Counter()
+        code = Code.EXHAUST_SAFETY if Tag.SAFETY_BLOCKED_OFF in reason.tags else reason.code
+        counts[str(code)] += 1
+        if hasattr(self, '_toggle_store') and self._toggle_store:
+            self._toggle_store.schedule_save()
+
     # ------------------------------------------------------------------ #
     #  Sensor anomaly filter                                               #
     # ------------------------------------------------------------------ #
 
+    @staticmethod
+    def _spike_allowance(
+        max_delta: float, last_good_at: datetime | None, now: datetime,
+    ) -> tuple[float, float]:
+        """(gap_s, allowed jump) since a last good reading accepted at last_good_at.
+
+        max_delta per 10-second grid step, never less than one step.  Shared
+        with the safety watchdog, which reads the same last-good state.
+        """
+        gap_s = 0.0 if last_good_at is None else (now - last_good_at).total_seconds()
+        return gap_s, max_delta * max(1.0, gap_s / _SAMPLE_PERIOD_S)
+
     def _filter_sensor_readings(
         self,
         raw_temps: list[float | None],
         raw_rhs:   list[float | None],
         max_delta_temp: float,
         max_delta_rh:   float,
-        max_streak: int = 5,
+        now: datetime,
+        max_anomaly_s: float = _ANOMALY_FAILURE_S,
     ) -> tuple[list[float | None], list[float | None]]:
         """Per-sensor spike filter using last-known-good fallback.
 
         For each sensor slot, if the new reading deviates from the last good
-        value by more than max_delta, the reading is rejected and the last
-        good value is substituted instead.  If a sensor stays anomalous for
-        more than max_streak consecutive polls it is treated as a genuine
-        sensor failure and None is returned so the normal unavailability
-        logic takes over.
+        value by more than max_delta per 10-second grid step since that value
+        was accepted, the reading is rejected and the last good value is
+        substituted instead.  Polls are not evenly spaced, so the allowance
+        scales with the gap (never below one step): a slow poll does not
+        reject ordinary drift, and a real step change is accepted once
+        enough time has passed to explain it.  If a sensor stays anomalous
+        for more than max_anomaly_s it is treated as a genuine sensor failure
+        and None is returned so the normal unavailability logic takes over.
 
         Returns (filtered_temps, filtered_rhs).
         """
         ctrl = self.control
 
 
-        def _filter(values, last_good, streaks, max_delta):
+        def _filter(values, last_good, last_good_at, anomaly_since, max_delta):
             filtered = []
             for i, val in enumerate(values):
                 if val is None:
@@ -426,42 +898,49 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 prev = last_good.get(i)
                 if prev is None:
                     # No previous reading — accept and store
-                    last_good[i] = val
-                    streaks[i]   = 0
+                    last_good[i]    = val
+                    last_good_at[i] = now
+                    anomaly_since.pop(i, None)
                     filtered.append(val)
                     continue
 
-                delta = abs(val - prev)
-                if delta > max_delta:
-                    streak = streaks.get(i, 0) + 1
-                    streaks[i] = streak
-                    if streak >= max_streak:
-                        # Too many consecutive anomalies — genuine failure
+                gap_s, allowed = self._spike_allowance(max_delta, last_good_at.get(i), now)
+                delta   = abs(val - prev)
+                if delta > allowed:
+                    since = anomaly_since.setdefault(i, now)
+                    anomalous_s = (now - since).total_seconds()
+                    if anomalous_s >= max_anomaly_s:
+                        # Anomalous for too long — genuine failure
                         # Clear last good so we don't hold a stale value forever
                         last_good.pop(i, None)
+                        last_good_at.pop(i, None)
+                        anomaly_since.pop(i, None)
                         filtered.append(None)
                         _LOGGER.warning(
-                            "%s: sensor slot %d anomalous for %d consecutive polls "
+                            "%s: sensor slot %d anomalous for %.0f s "
                             "— treating as unavailable",
-                            self.entry.title, i, streak,
+                            self.entry.title, i, anomalous_s,
                         )
                     else:
                         # Spike — substitute last good value
                         _LOGGER.debug(
                             "%s: sensor slot %d spike rejected "
-                            "(delta=%.2f > max=%.2f), using last good value %.2f",
-                            self.entry.title, i, delta, max_delta, prev,
+                            "(delta=%.2f > allowed=%.2f over %.0f s), using last good value %.2f",
+                            self.entry.title, i, delta, allowed, gap_s, prev,
                         )
                         filtered.append(prev)
                 else:
-                    # Normal reading — update last good and reset streak
-                    last_good[i] = val
-                    streaks[i]   = 0
+                    # Normal reading — update last good and end any anomalous run
+                    last_good[i]    = val
+                    last_good_at[i] = now
+                    anomaly_since.pop(i, None)
                     filtered.append(val)
             return filtered
 
-        filtered_temps = _filter(raw_temps, ctrl.last_good_temp, ctrl.anomaly_streak_temp, max_delta_temp)
-        filtered_rhs   = _filter(raw_rhs,   ctrl.last_good_rh,   ctrl.anomaly_streak_rh,   max_delta_rh)
+        filtered_temps = _filter(raw_temps, ctrl.last_good_temp, ctrl.last_good_at_temp,
+                                 ctrl.anomaly_since_temp, max_delta_temp)
+        filtered_rhs   = _filter(raw_rhs,   ctrl.last_good_rh,   ctrl.last_good_at_rh,
+                                 ctrl.anomaly_since_rh,   max_delta_rh)
         return filtered_temps, filtered_rhs
 
     # ------------------------------------------------------------------ #
@@ -479,7 +958,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     ) -> str | None:
         """Detect a physical disturbance (e.g. tent door opening).
 
-        Compares the current averaged readings against the previous poll.
+        Compares the current averaged readings against the previous grid
+        sample.  The thresholds are per 10-second step; when polls were slower
+        they scale with the steps elapsed, so a slow drift over a long poll is
+        not mistaken for a swing.
         Returns a reason string if a new disturbance is detected, None otherwise.
         The caller is responsible for updating disturbance_until.
         """
@@ -492,6 +974,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         delta_t = abs(avg_temp - ctrl.prev_avg_temp)
         delta_r = abs(avg_rh   - ctrl.prev_avg_rh)
+        if ctrl.prev_avg_at is not None:
+            steps = max(1.0, (now - ctrl.prev_avg_at).total_seconds() / _SAMPLE_PERIOD_S)
+            dist_temp_delta *= steps
+            dist_rh_delta   *= steps
 
         reason = None
         if delta_t >= dist_temp_delta and delta_r >= dist_rh_delta:
@@ -525,62 +1011,239 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _ols_fit(X_rows: list[list[float]], y: list[float]) -> tuple[list[float], float]:
+    def _gram(columns: list[array], y: array) -> tuple[list[list[float]], list[float], float]:
+        """Normal-equation sums XᵀX, Xᵀy and yᵀy from column-major arrays.
+
+        Every entry is one sum(map(mul, ...)) over two array('d') columns, so
+        the accumulation runs in C rather than in a per-sample Python loop.
+        """
+        k = len(columns)
+        XtX = [[0.0] * k for _ in range(k)]
+        for i in range(k):
+            for j in range(i, k):
+                XtX[i][j] = XtX[j][i] = sum(map(mul, columns[i], columns[j]))
+        Xty = [sum(map(mul, col, y)) for col in columns]
+        return XtX, Xty, sum(map(mul, y, y))
+
+    @staticmethod
+    def _solve_normal(XtX: list[list[float]], Xty: list[float]) -> list[float] | None:
+        """Gaussian elimination with partial pivoting.  None when singular."""
+        k = len(Xty)
+        aug = [XtX[i][:] + [Xty[i]] for i in range(k)]
+        for col in range(k):
+            pivot = max(range(col, k), key=lambda r: abs(aug[r][col]))
+            aug[col], aug[pivot] = aug[pivot], aug[col]
+            if abs(aug[col][col]) < 1e-12:
+                return None
+            for row in range(k):
+                if row == col:
+                    continue
+                factor = aug[row][col] / aug[col][col]
+                for j in range(col, k + 1):
+                    aug[row][j] -= factor * aug[col][j]
+        return [aug[i][k] / aug[i][i] for i in range(k)]
+
+    @staticmethod
+    def _ols_fit(columns: list[array], y: array) -> tuple[list[float], float]:
         """Ordinary least squares via normal equations.  Pure Python, no numpy.
 
         Solves: theta = (X^T X)^-1 X^T y
+        columns holds X column-major — one array('d') per regressor.
         Returns (theta, r2).
 
         Returns ([0.0]*k, 0.0) for degenerate inputs: too few samples, or any
         predictor column with zero variance (e.g. exhaust always on or always off),
-        which makes XtX singular regardless of the pivot threshold.
+        which makes XtX singular regardless of the pivot threshold.  An all-ones
+        intercept column is expected to be constant and is not rejected.
         """
         n = len(y)
-        k = len(X_rows[0])
+        k = len(columns)
         if n < k + 1:
             return [0.0] * k, 0.0
 
+        XtX, Xty, yy = GrowTentCoordinator._gram(columns, y)
+
         # Reject zero-variance columns before attempting the solve — a column with
         # no variation (e.g. exhaust was never toggled) makes XtX exactly singular
         # and the Gaussian elimination pivot check alone is not reliable enough to
-        # catch it cleanly with floating-point arithmetic.
-        for col in range(k):
-            col_vals = [X_rows[r][col] for r in range(n)]
-            col_mean = sum(col_vals) / n
-            col_var  = sum((v - col_mean) ** 2 for v in col_vals) / n
+        # catch it cleanly with floating-point arithmetic.  sum == sumsq == n only
+        # holds for a column of ones, i.e. the bias term.
+        for c, col in enumerate(columns):
+            col_sum = sum(col)
+            if col_sum == n and XtX[c][c] == n:
+                continue
+            col_var = XtX[c][c] / n - (col_sum / n) ** 2
             if col_var < 1e-10:
                 return [0.0] * k, 0.0
 
-        # X^T X  (k x k)
-        XtX = [[sum(X_rows[r][i] * X_rows[r][j] for r in range(n))
-                for j in range(k)] for i in range(k)]
+        theta = GrowTentCoordinator._solve_normal(XtX, Xty)
+        if theta is None:
+            return [0.0] * k, 0.0
 
-        # X^T y  (k,)
-        Xty = [sum(X_rows[r][i] * y[r] for r in range(n)) for i in range(k)]
+        return theta, GrowTentCoordinator._r2_from_sums(theta, Xty, yy, sum(y), n)
 
-        # Gaussian elimination with partial pivoting
-        aug = [XtX[i][:] + [Xty[i]] for i in range(k)]
-        for col in range(k):
-            # Find pivot
-            pivot = max(range(col, k), key=lambda r: abs(aug[r][col]))
-            aug[col], aug[pivot] = aug[pivot], aug[col]
-            if abs(aug[col][col]) < 1e-12:
-                return [0.0] * k, 0.0
-            for row in range(k):
-                if row == col:
-                    continue
-                factor = aug[row][col] / aug[col][col]
-                for j in range(col, k + 1):
-                    aug[row][j] -= factor * aug[col][j]
-        theta = [aug[i][k] / aug[i][i] for i in range(k)]
+    @staticmethod
+    def _r2_from_sums(theta: list[float], Xty: list[float], yy: float, y_sum: float, n: int) -> float:
+        """R² from the normal-equation sums, without revisiting the samples.
+
+        At the solution XᵀXθ = Xᵀy, so the residual sum of squares reduces
+        to yᵀy − θᵀXᵀy.
+        """
+        ss_tot = yy - y_sum * y_sum / n
+        ss_res = max(0.0, yy - sum(map(mul, theta, Xty)))
+        return 1.0 - ss_res / ss_tot if ss_tot > 1e-10 else 0.0
 
-        # R²
-        y_mean = sum(y) / n
-        y_pred = [sum(theta[j] * X_rows[r][j] for j in range(k)) for r in range(n)]
-        ss_res = sum((y[r] - y_pred[r]) ** 2 for r in range(n))
-        ss_tot = sum((y[r] - y_mean) ** 2 for r in range(n))
-        r2 = 1.0 - ss_res / ss_tot if ss_tot > 1e-10 else 0.0
-        return theta, r2
+    @staticmethod
+    def _select_lags(
+        temps: array,
+        rhs: array,
+        temp_amb: float,
+        rh_amb: float,
+        inputs: dict[str, array],
+        max_lag: int,
+    ) -> tuple[int, int]:
+        """Pick the heater and exhaust dead time (in polls) for the ARX fit.
+
+        Every (heater lag, exhaust lag) pair in 0..max_lag is fitted on the
+        same rows (from max_lag onwards) and the pair with the highest
+        R²(temp) + R²(RH) wins; ties go to the shorter lag.  The cross
+        products that do not involve a lagged column are shared by every
+        candidate, so each candidate only costs a small k×k solve rather than
+        a pass over the samples.
+        """
+        L = max_lag
+        m = len(inputs["heater"])
+        n = m - L
+        d_t    = array("d", map(sub, temps[L + 1:m + 1], temps[L:m]))
+        d_r    = array("d", map(sub, rhs[L + 1:m + 1],   rhs[L:m]))
+        pass_t = array("d", (temp_amb - t for t in temps[L:m]))
+        pass_r = array("d", (rh_amb - r for r in rhs[L:m]))
+        ones   = array("d", [1.0]) * n
+        extra  = [col[L:] for name, col in inputs.items() if name not in ("heater", "exhaust")]
+        base_t = [pass_t, ones] + extra
+        base_r = [pass_r, ones] + extra
+        H = [inputs["heater"][L - d:m - d]  for d in range(L + 1)]
+        E = [inputs["exhaust"][L - d:m - d] for d in range(L + 1)]
+
+        dot = lambda a, b: sum(map(mul, a, b))
+        Bt, Bty, yy_t = GrowTentCoordinator._gram(base_t, d_t)
+        Br, Bry, yy_r = GrowTentCoordinator._gram(base_r, d_r)
+        hBt  = [[dot(h, c) for c in base_t] for h in H]
+        eBt  = [[dot(e, c) for c in base_t] for e in E]
+        eBr  = [[dot(e, c) for c in base_r] for e in E]
+        hh   = [dot(h, h) for h in H]
+        ee   = [dot(e, e) for e in E]
+        he   = [[dot(h, e) for e in E] for h in H]
+        hy_t = [dot(h, d_t) for h in H]
+        ey_t = [dot(e, d_t) for e in E]
+        ey_r = [dot(e, d_r) for e in E]
+        sum_t, sum_r = sum(d_t), sum(d_r)
+
+        def score(XtX: list[list[float]], Xty: list[float], yy: float, y_sum: float) -> float:
+            theta = GrowTentCoordinator._solve_normal(XtX, Xty)
+            if theta is None:
+                return float("-inf")
+            return GrowTentCoordinator._r2_from_sums(theta, Xty, yy, y_sum, n)
+
+        r2_r = [
+            score(
+                [[ee[de]] + eBr[de]] + [[eBr[de][j]] + Br[j] for j in range(len(base_r))],
+                [ey_r[de]] + Bry, yy_r, sum_r,
+            )
+            for de in range(L + 1)
+        ]
+
+        best = (float("-inf"), 0, 0)
+        for dh in range(L + 1):
+            for de in range(L + 1):
+                XtX = (
+                    [[hh[dh], he[dh][de]] + hBt[dh], [he[dh][de], ee[de]] + eBt[de]]
+                    + [[hBt[dh][j], eBt[de][j]] + Bt[j] for j in range(len(base_t))]
+                )
+                total = score(XtX, [hy_t[dh], ey_t[de]] + Bty, yy_t, sum_t) + r2_r[de]
+                if total > best[0]:
+                    best = (total, dh, de)
+        return best[1], best[2]
+
+    @staticmethod
+    def _fit_models(
+        temp0: array,
+        temp1: array,
+        rh0: array,
+        rh1: array,
+        temp_amb: array,
+        rh_amb: array,
+        inputs: dict[str, array],
+    ) -> dict:
+        """Fit the one-step temperature and humidity models.
+
+        Row i is one transition temp0[i] -> temp1[i] (and rh0 -> rh1); temp_amb,
+        rh_amb and every column in inputs hold the value driving that row.  heater and
+        exhaust are required; every other input (humidifier, dehumidifier,
+        light) enters both models with its own coefficient:
+
+            dT  = a_heater*H + a_exhaust*E + a_passive*(T_amb - T)  + a_bias + Σ a_x*X
+            dRH =              b_exhaust*E + b_passive*(RH_amb - RH) + b_bias + Σ b_x*X
+
+        Returns the raw coefficients keyed a_* / b_* plus r2_temp and r2_rh.
+        """
+        d_t    = array("d", map(sub, temp1, temp0))
+        d_r    = array("d", map(sub, rh1,   rh0))
+        pass_t = array("d", map(sub, temp_amb, temp0))
+        pass_r = array("d", map(sub, rh_amb,   rh0))
+        ones   = array("d", [1.0]) * len(d_t)
+        extra  = [name for name in inputs if name not in ("heater", "exhaust")]
+
+        X_t = [inputs["heater"], inputs["exhaust"], pass_t, ones] + [inputs[x] for x in extra]
+        X_r = [inputs["exhaust"], pass_r, ones] + [inputs[x] for x in extra]
+        theta_t, r2_t = GrowTentCoordinator._ols_fit(X_t, d_t)
+        theta_r, r2_r = GrowTentCoordinator._ols_fit(X_r, d_r)
+
+        coeffs = {
+            "a_heater":  theta_t[0],
+            "a_exhaust": theta_t[1],
+            "a_passive": theta_t[2],
+            "a_bias":    theta_t[3],
+            "b_exhaust": theta_r[0],
+            "b_passive": theta_r[1],
+            "b_bias":    theta_r[2],
+            "r2_temp":   r2_t,
+            "r2_rh":     r2_r,
+        }
+        for i, name in enumerate(extra):
+            coeffs[f"a_{name}"] = theta_t[4 + i]
+            coeffs[f"b_{name}"] = theta_r[3 + i]
+        return coeffs
+
+    @staticmethod
+    def _model_result(coeffs: dict, temp_amb: float, rh_amb: float, n_samples: int) -> dict:
+        """Map fitted coefficients onto the MPC number entity keys.
+
+        The light column is not a device the MPC switches — its heat and
+        moisture are folded into the day biases instead.
+        """
+        result = {
+            "mpc_temp_amb":  round(temp_amb, 2),
+            "mpc_rh_amb":    round(rh_amb,   2),
+            "mpc_a_heater":  round(coeffs["a_heater"],  6),
+            "mpc_a_exhaust": round(coeffs["a_exhaust"], 6),
+            "mpc_a_passive": round(coeffs["a_passive"], 6),
+            "mpc_a_bias":    round(coeffs["a_bias"],    6),
+            "mpc_b_exhaust": round(coeffs["b_exhaust"], 6),
+            "mpc_b_passive": round(coeffs["b_passive"], 6),
+            "mpc_b_bias":    round(coeffs["b_bias"],    6),
+        }
+        for name in ("humidifier", "dehumidifier"):
+            if f"a_{name}" in coeffs:
+                result[f"mpc_a_{name}"] = round(coeffs[f"a_{name}"], 6)
+                result[f"mpc_b_{name}"] = round(coeffs[f"b_{name}"], 6)
+        if "a_light" in coeffs:
+            result["mpc_a_bias_day"] = round(coeffs["a_bias"] + coeffs["a_light"], 6)
+            result["mpc_b_bias_day"] = round(coeffs["b_bias"] + coeffs["b_light"], 6)
+        result["r2_temp"]   = round(coeffs["r2_temp"], 4)
+        result["r2_rh"]     = round(coeffs["r2_rh"],   4)
+        result["n_samples"] = n_samples
+        return result
 
     @staticmethod
     def _run_identification(
@@ -592,6 +1255,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         prefetched_history: dict,
         temp_amb_estimate: float,
         rh_amb_estimate: float,
+        extra_inputs: dict[str, str] | None = None,
+        max_lag: int = 0,
     ) -> dict:
         """Pure CPU work — runs in a thread-pool executor.
 
@@ -603,98 +1268,103 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Resamples all series to 10-second intervals, averages sensor readings,
         fits the thermal and humidity models via OLS, and returns fitted params.
 
-        Accepts 1-3 temperature sensor IDs and 1-3 RH sensor IDs.
+        Accepts 1-3 temperature sensor IDs and 1-3 RH sensor IDs.  extra_inputs
+        maps "humidifier" / "dehumidifier" / "light" to their switch entity;
+        each one that changed state in the window gets its own model column.
+
+        With max_lag > 0 this is an ARX fit: the heater and exhaust columns are
+        delayed by the dead time chosen by _select_lags, and the chosen lags
+        are returned as mpc_heater_lag / mpc_exhaust_lag.
         """
         def hass_states_getter(entity_id: str) -> list:
             return prefetched_history.get(entity_id, [])
         RESAMPLE_S = 10
+        NAN = float("nan")
 
         def parse_numeric(rows):
-            out = {}
+            out = []
             for ts, val in rows:
                 try:
-                    out[ts] = float(val)
+                    out.append((ts, float(val)))
                 except (ValueError, TypeError):
                     pass
             return out
 
         def parse_switch(rows):
-            out = {}
+            out = []
             for ts, val in rows:
                 if val == "on":
-                    out[ts] = 1.0
+                    out.append((ts, 1.0))
                 elif val == "off":
-                    out[ts] = 0.0
+                    out.append((ts, 0.0))
             return out
 
-        def resample(data_dict: dict, start_ts: float, end_ts: float, interval_s: int) -> list:
-            """Forward-fill resample to fixed grid."""
-            sorted_ts = sorted(data_dict.keys())
-            n_steps = int((end_ts - start_ts) / interval_s) + 1
-            result = []
-            last_val = None
-            ptr = 0
-            for step in range(n_steps):
-                t = start_ts + step * interval_s
-                while ptr < len(sorted_ts) and sorted_ts[ptr] <= t:
-                    last_val = data_dict[sorted_ts[ptr]]
-                    ptr += 1
-                if last_val is not None:
-                    result.append((t, last_val))
-            return result
-
         # Fetch histories for all sensors
-        raw_temp = {}  # eid -> {ts: value}
-        raw_rh   = {}
-        for eid in temp_sensor_eids:
-            raw_temp[eid] = parse_numeric(hass_states_getter(eid))
-        for eid in rh_sensor_eids:
-            raw_rh[eid] = parse_numeric(hass_states_getter(eid))
+        raw_temp = [parse_numeric(hass_states_getter(eid)) for eid in temp_sensor_eids]
+        raw_rh   = [parse_numeric(hass_states_getter(eid)) for eid in rh_sensor_eids]
 
         raw_heater  = parse_switch(hass_states_getter(entity_heater))
         raw_exhaust = parse_switch(hass_states_getter(entity_exhaust))
+        raw_extra   = {
+            name: parse_switch(hass_states_getter(eid))
+            for name, eid in (extra_inputs or {}).items() if eid
+        }
 
         # Require at least the first sensor and the heater to have data
-        if not raw_temp[temp_sensor_eids[0]] or not raw_heater:
+        if not raw_temp[0] or not raw_heater:
             return {"error": "insufficient history data"}
 
-        # Common time range across all series
-        all_ts = []
-        for d in list(raw_temp.values()) + list(raw_rh.values()):
-            all_ts.extend(d.keys())
-        all_ts.extend(raw_heater.keys())
-        all_ts.extend(raw_exhaust.keys())
+        # Common time range across all series.  Start-time states can carry a
+        # last_updated long before the window, so clamp the grid to the window.
+        required = raw_temp + raw_rh + [raw_heater, raw_exhaust]
+        all_ts = [ts for rows in required for ts, _ in rows]
         if not all_ts:
             return {"error": "no timestamps found"}
-        start_ts = min(all_ts)
         end_ts   = max(all_ts)
+        start_ts = max(min(all_ts), end_ts - history_days * 86400)
+        n_steps  = int((end_ts - start_ts) / RESAMPLE_S) + 1
+
+        def grid_index(ts: float) -> int:
+            return max(0, math.ceil((ts - start_ts) / RESAMPLE_S))
+
+        def resample(rows: list) -> array:
+            """Forward-fill resample to fixed grid — NaN before the first sample."""
+            out = array("d", [NAN]) * n_steps
+            rows = sorted(rows)
+            for idx, (ts, val) in enumerate(rows):
+                i0 = grid_index(ts)
+                i1 = grid_index(rows[idx + 1][0]) if idx + 1 < len(rows) else n_steps
+                if i1 > i0:
+                    out[i0:i1] = array("d", [val]) * (i1 - i0)
+            return out
 
-        # Resample all series onto a common grid
-        resampled_temps  = [dict(resample(raw_temp[e], start_ts, end_ts, RESAMPLE_S)) for e in temp_sensor_eids]
-        resampled_rhs    = [dict(resample(raw_rh[e],   start_ts, end_ts, RESAMPLE_S)) for e in rh_sensor_eids]
-        h = dict(resample(raw_heater,  start_ts, end_ts, RESAMPLE_S))
-        e = dict(resample(raw_exhaust, start_ts, end_ts, RESAMPLE_S))
-
-        # Timestamps where all resampled series have a value
-        common_ts = set(h.keys()) & set(e.keys())
-        for rt in resampled_temps:
-            common_ts &= set(rt.keys())
-        for rr in resampled_rhs:
-            common_ts &= set(rr.keys())
-        common_ts = sorted(common_ts)
+        # The usable window starts once every required series has a value;
+        # forward-fill keeps them all defined from there to the end.
+        if all(required):
+            first = max(grid_index(min(rows)[0]) for rows in required)
+        else:
+            first = n_steps
+        n_aligned = max(0, n_steps - first)
+        if n_aligned < 50:
+            return {"error": f"only {n_aligned} aligned samples — need at least 50"}
 
-        if len(common_ts) < 50:
-            return {"error": f"only {len(common_ts)} aligned samples — need at least 50"}
+        def window(rows: list) -> array:
+            return resample(rows)[first:]
 
         # Average across all configured sensors at each timestep
-        temps = [sum(rt[t] for rt in resampled_temps) / len(resampled_temps) for t in common_ts]
-        rhs   = [sum(rr[t] for rr in resampled_rhs)   / len(resampled_rhs)   for t in common_ts]
-        hs    = [h[t] for t in common_ts]
-        es    = [e[t] for t in common_ts]
+        def mean_series(series: list[array]) -> array:
+            if len(series) == 1:
+                return series[0]
+            return array("d", map(lambda *v: sum(v) / len(v), *series))
+
+        temps = mean_series([window(rows) for rows in raw_temp])
+        rhs   = mean_series([window(rows) for rows in raw_rh])
+        hs    = window(raw_heater)
+        es    = window(raw_exhaust)
 
         # Estimate ambient from exhaust-on periods (10th percentile)
-        exhaust_on_temps = [temps[i] for i in range(len(common_ts)) if es[i] == 1.0]
-        exhaust_on_rhs   = [rhs[i]   for i in range(len(common_ts)) if es[i] == 1.0]
+        exhaust_on_temps = [t for t, e in zip(temps, es) if e == 1.0]
+        exhaust_on_rhs   = [r for r, e in zip(rhs,   es) if e == 1.0]
         if len(exhaust_on_temps) > 10:
             exhaust_on_temps.sort()
             exhaust_on_rhs.sort()
@@ -705,82 +1375,283 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             temp_amb = temp_amb_estimate
             rh_amb   = rh_amb_estimate
 
-        # Build regression matrices — one-step-ahead delta
-        X_t, y_t = [], []
-        X_r, y_r = [], []
-        for i in range(len(common_ts) - 1):
-            d_temp = temps[i + 1] - temps[i]
-            d_rh   = rhs[i + 1]   - rhs[i]
-            hi, ei = hs[i], es[i]
-            X_t.append([hi, ei, temp_amb - temps[i], 1.0])
-            y_t.append(d_temp)
-            X_r.append([ei, rh_amb - rhs[i], 1.0])
-            y_r.append(d_rh)
+        # Input columns — the state during step i drives the change to i+1
+        m = n_aligned - 1
+        inputs = {"heater": hs[:m], "exhaust": es[:m]}
 
         # Guard against zero-variance columns — if heater or exhaust was never
         # toggled during the history window, the corresponding column is constant
         # (all 0.0 or all 1.0) and is perfectly collinear with the bias term.
         # OLS will return zero for that parameter anyway, but we surface a clear
         # error message rather than writing zeros to the number entities silently.
-        if len(X_t) > 0:
-            heater_vals  = [row[0] for row in X_t]
-            exhaust_vals = [row[1] for row in X_t]
-            if len(set(heater_vals)) < 2:
-                return {"error": "heater was never toggled in the history window — identification requires both ON and OFF states"}
-            if len(set(exhaust_vals)) < 2:
-                return {"error": "exhaust was never toggled in the history window — identification requires both ON and OFF states"}
+        for label in ("heater", "exhaust"):
+            if min(inputs[label]) == max(inputs[label]):
+                return {"error": f"{label} was never toggled in the history window — identification requires both ON and OFF states"}
+
+        # Optional devices only get a column when they actually switched —
+        # a constant column would just be collinear with the bias.  The state
+        # before a device's first recorded change is taken to be that state.
+        for name, rows in raw_extra.items():
+            if not rows:
+                continue
+            col = window(rows)[:m]
+            known = next((v for v in col if v == v), None)
+            if known is None:
+                continue
+            for i in range(m):
+                if col[i] != col[i]:
+                    col[i] = known
+                else:
+                    break
+            if min(col) != max(col):
+                inputs[name] = col
+
+        # ARX: delay the heater and exhaust columns by their dead time.  Rows
+        # start at the longest candidate lag so every lag sees the same data.
+        lag = max(0, min(int(max_lag), m - 50))
+        heater_lag = exhaust_lag = 0
+        if lag:
+            heater_lag, exhaust_lag = GrowTentCoordinator._select_lags(
+                temps, rhs, temp_amb, rh_amb, inputs, lag,
+            )
+        n_rows = m - lag
+        fit_inputs = {name: col[lag:] for name, col in inputs.items()}
+        fit_inputs["heater"]  = inputs["heater"][lag - heater_lag:m - heater_lag]
+        fit_inputs["exhaust"] = inputs["exhaust"][lag - exhaust_lag:m - exhaust_lag]
+
+        coeffs = GrowTentCoordinator._fit_models(
+            temps[lag:m], temps[lag + 1:], rhs[lag:m], rhs[lag + 1:],
+            array("d", [temp_amb]) * n_rows, array("d", [rh_amb]) * n_rows,
+            fit_inputs,
+        )
+        result = GrowTentCoordinator._model_result(coeffs, temp_amb, rh_amb, n_aligned)
+        result["mpc_heater_lag"]  = heater_lag
+        result["mpc_exhaust_lag"] = exhaust_lag
+        return result
 
-        theta_t, r2_t = GrowTentCoordinator._ols_fit(X_t, y_t)
-        theta_r, r2_r = GrowTentCoordinator._ols_fit(X_r, y_r)
+    @staticmethod
+    def _rescale_coarse_params(
+        gains: list[float], passive: float, steps: float,
+    ) -> tuple[list[float], float] | None:
+        """Convert coarse-timestep coefficients to the 10-second poll model.
+
+        The poll model  x+ = x + a_p*(amb - x) + u  with u held constant for
+        N polls is equivalent (zero-order hold) to one coarse step with
+            A_p = 1 - (1 - a_p)^N      A_u = u * A_p / a_p
+        so the inversion is exact, not a linear scaling.  gains are the input
+        and bias coefficients of the coarse fit, passive is A_p, steps is N.
+
+        Returns (fine_gains, fine_passive), or None when A_p is outside (0, 1)
+        and the coarse fit cannot describe a stable first-order plant.
+        """
+        if not 0.0 < passive < 1.0 or steps < 1.0:
+            return None
+        fine_passive = 1.0 - (1.0 - passive) ** (1.0 / steps)
+        ratio = fine_passive / passive
+        return [g * ratio for g in gains], fine_passive
 
-        return {
-            "mpc_temp_amb":  round(temp_amb,   2),
-            "mpc_rh_amb":    round(rh_amb,     2),
-            "mpc_a_heater":  round(theta_t[0], 6),
-            "mpc_a_exhaust": round(theta_t[1], 6),
-            "mpc_a_passive": round(theta_t[2], 6),
-            "mpc_a_bias":    round(theta_t[3], 6),
-            "mpc_b_exhaust": round(theta_r[0], 6),
-            "mpc_b_passive": round(theta_r[1], 6),
-            "mpc_b_bias":    round(theta_r[2], 6),
-            "r2_temp":       round(r2_t, 4),
-            "r2_rh":         round(r2_r, 4),
-            "n_samples":     len(common_ts),
-        }
+    @staticmethod
+    def _run_statistics_identification(
+        prefetched_stats: dict,
+        temp_id: str,
+        rh_id: str,
+        heater_id: str,
+        exhaust_id: str,
+        amb_temp_id: str | None,
+        amb_rh_id: str | None,
+        period_s: int,
+        temp_amb_estimate: float,
+        rh_amb_estimate: float,
+        extra_ids: dict[str, str] | None = None,
+    ) -> dict:
+        """Pure CPU work — runs in a thread-pool executor.
 
-    async def async_identify_model(self) -> dict:
-        """Trigger MPC model identification from HA history.
+        Fits the same thermal and humidity models as _run_identification, but
+        from recorder long-term statistics (one mean per period) instead of raw
+        state history, so the window is not limited by purge_keep_days.
 
-        Fetches all state history on the event loop (thread-safe), then runs
-        OLS regression in a thread executor using only plain Python data.
-        Writes the fitted parameters back to the MPC number entities, records
-        the result in the Grow Journal, and updates the R² diagnostic sensors.
+        prefetched_stats maps statistic_id -> list of (start_ts, mean).  Device
+        inputs are the duty-cycle sensors (0–100 %), so each period's mean is
+        the fraction of time the device was on.  extra_ids maps "humidifier" /
+        "dehumidifier" / "light" to their duty sensor; each one whose statistics
+        cover the whole window and vary gets its own column.  The coarse
+        coefficients are rescaled to the 10-second model used by _mpc_optimise.
+        """
+        RESAMPLE_S = 10
 
-        Returns the result dict (or an error dict).
+        def series(stat_id: str | None) -> dict:
+            return dict(prefetched_stats.get(stat_id, [])) if stat_id else {}
+
+        temps   = series(temp_id)
+        rhs     = series(rh_id)
+        heater  = series(heater_id)
+        exhaust = series(exhaust_id)
+        amb_t   = series(amb_temp_id)
+        amb_r   = series(amb_rh_id)
+        extras  = {name: series(sid) for name, sid in (extra_ids or {}).items()}
+
+        if not temps or not rhs or not heater or not exhaust:
+            return {"error": "insufficient long-term statistics — duty-cycle sensors need to be recorded first"}
+
+        # Ambient proxy when no lung room statistics exist — 10th percentile of
+        # tent readings over periods where the exhaust ran at least half the time
+        vented = [ts for ts, d in exhaust.items() if d >= 50.0 and ts in temps and ts in rhs]
+        if len(vented) > 10:
+            vt = sorted(temps[ts] for ts in vented)
+            vr = sorted(rhs[ts]   for ts in vented)
+            temp_amb = vt[len(vt) // 10]
+            rh_amb   = vr[len(vr) // 10]
+        else:
+            temp_amb = temp_amb_estimate
+            rh_amb   = rh_amb_estimate
+
+        # One regression row per pair of consecutive periods present in every
+        # series.  Temperatures are period means, so the input that drives the
+        # change between two means straddles both periods — use their average.
+        required = (temps, rhs, heater, exhaust)
+        starts = [
+            ts for ts in sorted(temps)
+            if all(ts in s and ts + period_s in s for s in required)
+        ]
+        if len(starts) < 50:
+            return {"error": f"only {len(starts)} aligned statistics periods — need at least 50"}
+
+        def duty(s: dict) -> array:
+            return array("d", ((s[ts] + s[ts + period_s]) / 200.0 for ts in starts))
+
+        def state(s: dict, offset: int) -> array:
+            return array("d", (s[ts + offset] for ts in starts))
+
+        inputs = {"heater": duty(heater), "exhaust": duty(exhaust)}
+
+        # Duty cycles are continuous, so "never toggled" shows up as a column
+        # that barely moves rather than a single repeated value.
+        for label in ("heater", "exhaust"):
+            if max(inputs[label]) - min(inputs[label]) < 0.01:
+                return {"error": f"{label} duty cycle never changed in the statistics window — identification requires both ON and OFF periods"}
+
+        for name, s in extras.items():
+            if s and all(ts in s and ts + period_s in s for ts in starts):
+                col = duty(s)
+                if max(col) - min(col) >= 0.01:
+                    inputs[name] = col
+
+        coeffs = GrowTentCoordinator._fit_models(
+            state(temps, 0), state(temps, period_s), state(rhs, 0), state(rhs, period_s),
+            array("d", (amb_t.get(ts, temp_amb) for ts in starts)),
+            array("d", (amb_r.get(ts, rh_amb)   for ts in starts)),
+            inputs,
+        )
+        if not 0.0 < coeffs["a_passive"] < 1.0 or not 0.0 < coeffs["b_passive"] < 1.0:
+            return {"error": "statistics fit produced an unstable passive coefficient — try a shorter window"}
+
+        # Rescale every input and bias gain with the same exact ZOH ratio as
+        # the passive coefficient of its model.
+        steps = period_s / RESAMPLE_S
+        for prefix in ("a", "b"):
+            gain_keys = [k for k in coeffs if k.startswith(f"{prefix}_") and k != f"{prefix}_passive"]
+            gains, coeffs[f"{prefix}_passive"] = GrowTentCoordinator._rescale_coarse_params(
+                [coeffs[k] for k in gain_keys], coeffs[f"{prefix}_passive"], steps,
+            )
+            coeffs.update(zip(gain_keys, gains))
+
+        return GrowTentCoordinator._model_result(coeffs, temp_amb, rh_amb, len(starts))
+
+    def _identification_extra_inputs(self) -> dict[str, str]:
+        """Configured optional devices that get their own model column.
+
+        Maps "humidifier" / "dehumidifier" / "light" to the switch entity.
         """
-        from homeassistant.components import recorder as rec_comp
-        from homeassistant.components.recorder.history import get_significant_states
+        extra: dict[str, str] = {}
+        for name, use_key, switch_key in (
+            ("humidifier",   CONF_USE_HUMIDIFIER,   CONF_HUMIDIFIER_SWITCH),
+            ("dehumidifier", CONF_USE_DEHUMIDIFIER, CONF_DEHUMIDIFIER_SWITCH),
+            ("light",        CONF_USE_LIGHT,        CONF_LIGHT_SWITCH),
+        ):
+            eid = self._get_option(switch_key) if self._use(use_key) else None
+            if eid:
+                extra[name] = eid
+        return extra
 
-        _LOGGER.info("%s: Starting MPC model identification", self.entry.title)
+    async def _async_fetch_statistics_fit(
+        self, recorder_instance, history_days: int, temp_amb: float, rh_amb: float,
+    ) -> dict:
+        """Fetch hourly long-term statistics and fit the model in the executor.
 
-        # Read config — collect all configured temp and RH sensors
-        _eid = lambda key, domain="number": self._entity_id(domain, key)
-        history_days = int(self._num(_eid("mpc_identify_days"), 7))
+        Used for windows longer than the recorder's purge_keep_days, where raw
+        state history no longer exists.  The controller's own Average
+        Temperature / Humidity and duty-cycle sensors are MEASUREMENT sensors,
+        so the recorder keeps their hourly means indefinitely.
+        """
+        from homeassistant.components.recorder.statistics import statistics_during_period
+
+        temp_id    = self._entity_id("sensor", "avg_temp_c")
+        rh_id      = self._entity_id("sensor", "avg_rh")
+        heater_id  = self._entity_id("sensor", "heater_duty_pct")
+        exhaust_id = self._entity_id("sensor", "exhaust_duty_pct")
+        amb_temp_id = self._get_option(CONF_AMBIENT_TEMP) or None
+        amb_rh_id   = self._get_option(CONF_AMBIENT_RH)   or None
+        extra_ids = {
+            name: self._entity_id("sensor", f"{name}_duty_pct")
+            for name in self._identification_extra_inputs()
+        }
+        extra_ids = {name: sid for name, sid in extra_ids.items() if sid}
+        stat_ids = (
+            {temp_id, rh_id, heater_id, exhaust_id}
+            | {i for i in (amb_temp_id, amb_rh_id) if i}
+            | set(extra_ids.values())
+        )
 
-        temp_sensors = [
-            self._get_option(k) for k in (CONF_TEMP_SENSOR_1, CONF_TEMP_SENSOR_2, CONF_TEMP_SENSOR_3)
-            if self._get_option(k)
-        ]
-        rh_sensors = [
-            self._get_option(k) for k in (CONF_RH_SENSOR_1, CONF_RH_SENSOR_2, CONF_RH_SENSOR_3)
-            if self._get_option(k)
-        ]
-        heater  = self._get_option(CONF_HEATER_SWITCH)  or ""
-        exhaust = self._get_option(CONF_EXHAUST_SWITCH) or ""
+        start = dt_util.utcnow() - timedelta(days=history_days)
+        end   = dt_util.utcnow()
+        try:
+            stats_map = await recorder_instance.async_add_executor_job(
+                statistics_during_period,
+                self.hass, start, end, stat_ids, "hour", None, {"mean"},
+            )
+        except Exception as err:
+            _LOGGER.error("%s: Failed to fetch long-term statistics: %s", self.entry.title, err)
+            return {"error": f"recorder statistics fetch failed: {err}"}
+
+        # Convert rows to plain (timestamp, mean) tuples — older HA versions
+        # return "start" as a datetime, newer ones as a float timestamp.
+        prefetched: dict[str, list[tuple[float, float]]] = {}
+        for stat_id, rows in stats_map.items():
+            out = []
+            for row in rows:
+                mean = row.get("mean")
+                start_ts = row.get("start")
+                if mean is None or start_ts is None:
+                    continue
+                if isinstance(start_ts, datetime):
+                    start_ts = start_ts.timestamp()
+                out.append((float(start_ts), float(mean)))
+            prefetched[stat_id] = out
 
-        if not temp_sensors or not rh_sensors or not heater or not exhaust:
-            _LOGGER.error("%s: Cannot identify — missing entity configuration", self.entry.title)
-            return {"error": "missing entity configuration"}
+        result = await recorder_instance.async_add_executor_job(
+            self._run_statistics_identification,
+            prefetched, temp_id, rh_id, heater_id, exhaust_id,
+            amb_temp_id, amb_rh_id, 3600, temp_amb, rh_amb, extra_ids,
+        )
+        result.setdefault("source", "long-term statistics (hourly)")
+        return result
+
+    async def _async_fetch_history_fit(
+        self,
+        recorder_instance,
+        temp_sensors: list[str],
+        rh_sensors: list[str],
+        heater: str,
+        exhaust: str,
+        history_days: int,
+        temp_amb: float,
+        rh_amb: float,
+        max_lag: int = 0,
+    ) -> dict:
+        """Fetch raw recorder state history and fit the model in the executor."""
+        from homeassistant.components.recorder.history import get_significant_states
+
+        extra_inputs = self._identification_extra_inputs()
 
         start = dt_util.utcnow() - timedelta(days=history_days)
         end   = dt_util.utcnow()
@@ -789,11 +1660,9 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # We convert state objects to plain (timestamp, state_str) tuples
         # immediately so the executor receives only pure Python data and
         # never needs to touch hass internals from a worker thread.
-        all_eids = temp_sensors + rh_sensors + [heater, exhaust]
+        all_eids = temp_sensors + rh_sensors + [heater, exhaust] + list(extra_inputs.values())
         prefetched: dict[str, list[tuple[float, str]]] = {}
 
-        recorder_instance = rec_comp.get_instance(self.hass)
-
         # get_significant_states is a synchronous DB call — run it in the
         # recorder's executor so we never block the HA event loop.
         try:
@@ -804,7 +1673,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 end,
                 all_eids,
                 None,   # filters
-                False,  # include_start_time_state
+                True,   # include_start_time_state — devices that rarely switch
+                        # still need their state at the start of the window
                 False,  # significant_changes_only
                 False,  # minimal_response
             )
@@ -819,9 +1689,6 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     rows.append((state.last_updated.timestamp(), state.state))
             prefetched[eid] = rows
 
-        temp_amb = float(self.data.get("mpc_temp_amb", 20.0)) if self.data else 20.0
-        rh_amb   = float(self.data.get("mpc_rh_amb",   55.0)) if self.data else 55.0
-
         # Run the CPU-intensive OLS work off the event loop.
         # _run_identification receives only plain Python data — no hass access.
         result = await recorder_instance.async_add_executor_job(
@@ -830,29 +1697,95 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             history_days,
             prefetched,
             temp_amb, rh_amb,
+            extra_inputs,
+            max_lag,
         )
 
+        result.setdefault("source", "state history")
+        return result
+
+    async def async_identify_model(self) -> dict:
+        """Run MPC model identification, at most one at a time.
+
+        A call while an identification is already running (button press,
+        change detector, weekly fallback) waits for that run and returns its
+        result instead of starting a second fetch-and-fit.
+        """
+        task = self._identify_task
+        if task is None or task.done():
+            task = self._identify_task = self.hass.async_create_task(
+                self._async_identify_model()
+            )
+        return await asyncio.shield(task)
+
+    async def _async_identify_model(self) -> dict:
+        """Trigger MPC model identification from HA history.
+
+        Fetches all state history on the event loop (thread-safe), then runs
+        OLS regression in a thread executor using only plain Python data.
+        Windows longer than the recorder's purge_keep_days are fitted from
+        hourly long-term statistics instead of raw state history.
+        Publishes the fitted parameters on the parameter bus, records
+        the result in the Grow Journal, and updates the R² diagnostic sensors.
+
+        Returns the result dict (or an error dict).
+        """
+        from homeassistant.components import recorder as rec_comp
+
+        _LOGGER.info("%s: Starting MPC model identification", self.entry.title)
+
+        # Read config — collect all configured temp and RH sensors
+        history_days = int(self.params.get("mpc_identify_days", 7))
+        max_lag      = int(self.params.get("mpc_identify_max_lag", 12))
+
+        temp_sensors = [
+            self._get_option(k) for k in (CONF_TEMP_SENSOR_1, CONF_TEMP_SENSOR_2, CONF_TEMP_SENSOR_3)
+            if self._get_option(k)
+        ]
+        rh_sensors = [
+            self._get_option(k) for k in (CONF_RH_SENSOR_1, CONF_RH_SENSOR_2, CONF_RH_SENSOR_3)
+            if self._get_option(k)
+        ]
+        heater  = self._get_option(CONF_HEATER_SWITCH)  or ""
+        exhaust = self._get_option(CONF_EXHAUST_SWITCH) or ""
+
+        if not temp_sensors or not rh_sensors or not heater or not exhaust:
+            _LOGGER.error("%s: Cannot identify — missing entity configuration", self.entry.title)
+            return {"error": "missing entity configuration"}
+
+        temp_amb = self.data.mpc_temp_amb if self.data else 20.0
+        rh_amb   = self.data.mpc_rh_amb   if self.data else 55.0
+
+        recorder_instance = rec_comp.get_instance(self.hass)
+
+        # Raw state history only reaches back purge_keep_days — longer windows
+        # are fitted from the hourly long-term statistics instead.
+        keep_days = int(getattr(recorder_instance, "keep_days", 10) or 10)
+        if history_days > keep_days:
+            result = await self._async_fetch_statistics_fit(
+                recorder_instance, history_days, temp_amb, rh_amb,
+            )
+        else:
+            result = await self._async_fetch_history_fit(
+                recorder_instance, temp_sensors, rh_sensors, heater, exhaust,
+                history_days, temp_amb, rh_amb, max_lag,
+            )
+
         if "error" in result:
             _LOGGER.error("%s: Identification failed: %s", self.entry.title, result["error"])
             return result
 
-        # Write parameters to number entities
+        # Publish parameters — the number entities follow the bus
         param_keys = [
             "mpc_temp_amb", "mpc_rh_amb",
             "mpc_a_heater", "mpc_a_exhaust", "mpc_a_passive", "mpc_a_bias",
             "mpc_b_exhaust", "mpc_b_passive", "mpc_b_bias",
+            "mpc_a_bias_day", "mpc_b_bias_day",
+            "mpc_a_humidifier", "mpc_b_humidifier",
+            "mpc_a_dehumidifier", "mpc_b_dehumidifier",
+            "mpc_heater_lag", "mpc_exhaust_lag",
         ]
-        for key in param_keys:
-            num_eid = self._entity_id("number", key)
-            if num_eid and key in result:
-                try:
-                    await self.hass.services.async_call(
-                        "number", "set_value",
-                        {"entity_id": num_eid, "value": result[key]},
-                        blocking=True,
-                    )
-                except Exception as err:
-                    _LOGGER.warning("%s: Could not update %s: %s", self.entry.title, key, err)
+        self.params.set_many({key: result[key] for key in param_keys if key in result})
 
         # Store R² and timestamp — in memory and persisted to .storage
         now_str = dt_util.as_local(dt_util.utcnow()).strftime("%Y-%m-%d %H:%M")
@@ -860,6 +1793,12 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.control.mpc_r2_rh           = result["r2_rh"]
         self.control.mpc_last_identified = now_str
         self.control.last_auto_identify  = dt_util.utcnow()
+        # Restart RLS from the freshly identified parameters — otherwise the
+        # old (restored) estimate would overwrite them within a minute
+        self.control.rls_banks.clear()
+        self.control.rls_detectors.clear()
+        if hasattr(self, "_rls_store") and self._rls_store:
+            await self._rls_store.async_flush(self.control)
         if hasattr(self, "_mpc_results_store") and self._mpc_results_store:
             await self._mpc_results_store.async_save(
                 result["r2_temp"], result["r2_rh"], now_str
@@ -868,11 +1807,17 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Write to Grow Journal
         note = (
             f"🔬 MPC Re-identification complete ({now_str}) — "
-            f"{result['n_samples']:,} samples over {history_days} days | "
+            f"{result['n_samples']:,} samples over {history_days} days "
+            f"({result.get('source', 'state history')}) | "
             f"R²(temp)={result['r2_temp']:.3f} R²(RH)={result['r2_rh']:.3f} | "
             f"a_heater={result['mpc_a_heater']:.4f} a_exhaust={result['mpc_a_exhaust']:.4f} "
             f"a_passive={result['mpc_a_passive']:.5f} a_bias={result['mpc_a_bias']:.4f}"
         )
+        if "mpc_heater_lag" in result:
+            note += (
+                f" | lag heater={result['mpc_heater_lag']} "
+                f"exhaust={result['mpc_exhaust_lag']} polls"
+            )
         if hasattr(self, "_notes_store") and self._notes_store:
             await self._notes_store.async_add(note)
             if self._notes_sensor:
@@ -892,57 +1837,13 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _rls_update(
-        theta: list[float],
-        P_flat: list[float],
-        phi: list[float],
-        y_obs: float,
-        lam: float,
-    ) -> tuple[list[float], list[float]]:
-        """One step of forgetting-factor RLS.  Pure Python, no numpy needed.
-
-        theta   — current parameter vector (n,)
-        P_flat  — current covariance matrix, row-major flattened (n*n,)
-        phi     — regressor vector (n,)  — the features for this observation
-        y_obs   — observed output (scalar)
-        lam     — forgetting factor (0 < lam <= 1)
-
-        Returns updated (theta, P_flat).
-        """
-        n = len(theta)
-
-        # Reconstruct P from flat list
-        P = [[P_flat[i * n + j] for j in range(n)] for i in range(n)]
-
-        # Innovation: y_obs - phi^T * theta
-        y_pred = sum(phi[i] * theta[i] for i in range(n))
-        innov  = y_obs - y_pred
-
-        # P * phi
-        Pphi = [sum(P[i][j] * phi[j] for j in range(n)) for i in range(n)]
-
-        # phi^T * P * phi + lam
-        denom = lam + sum(phi[i] * Pphi[i] for i in range(n))
-        if abs(denom) < 1e-10:
-            return theta, P_flat   # degenerate — skip update
-
-        # Kalman gain: k = P*phi / (lam + phi^T*P*phi)
-        k = [Pphi[i] / denom for i in range(n)]
+    def _lagged_input(history: list, lag: int, latest: int) -> int:
+        """Device state applied lag polls before the latest one in history."""
+        if lag <= 0 or not history:
+            return latest
+        return history[max(0, len(history) - 1 - lag)]
 
-        # Update parameters: theta = theta + k * innov
-        theta_new = [theta[i] + k[i] * innov for i in range(n)]
-
-        # Update covariance: P = (P - k * phi^T * P) / lam
-        # Compute k * phi^T * P
-        P_new_flat = []
-        for i in range(n):
-            for j in range(n):
-                kphiP_ij = k[i] * sum(phi[l] * P[l][j] for l in range(n))
-                P_new_flat.append((P[i][j] - kphiP_ij) / lam)
-
-        return theta_new, P_new_flat
-
-    async def _apply_rls_update(self, data: dict) -> None:
+    async def _apply_rls_update(self, data: CycleData) -> None:
         """Update MPC model parameters using the latest temperature and RH observations.
 
         Called every poll cycle when RLS is enabled and previous observations
@@ -950,6 +1851,11 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         to compute what the model predicted vs what actually happened, then
         adjusts the parameters to reduce that error.
 
+        Each model runs as a bank of estimators per period (day / night), one
+        per forgetting factor — the user's rls_forgetting_factor plus a fast
+        and a slow one.  Only the current period's banks learn, and MPC gets
+        the member with the lowest recent innovation variance.
+
         Parameters are written back to the MPC number entities so they persist
         across restarts and are visible on the dashboard.
         """
@@ -960,20 +1866,46 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 or ctrl.rls_prev_heater is None or ctrl.rls_prev_exhaust is None):
             return
 
-        lam      = float(data.get("rls_forgetting_factor", 0.999))
-        temp_amb = float(data.get("mpc_temp_amb", 20.0))
-        rh_amb   = float(data.get("mpc_rh_amb",   55.0))
+        # The latest model, not the cycle snapshot — if another writer has
+        # published since the cycle started, the banks restart from its values
+        model = self.model
+        if ctrl.rls_model_version is None:
+            ctrl.rls_model_version = model.version
+        elif ctrl.rls_model_version != model.version:
+            _LOGGER.debug(
+                "%s: model changed outside RLS (v%d → v%d) — reseeding RLS banks",
+                self.entry.title, ctrl.rls_model_version, model.version,
+            )
+            ctrl.rls_banks.clear()
+            ctrl.rls_detectors.clear()
+            ctrl.rls_model_version = model.version
+
+        lambdas  = RLSBank.lambda_set(data.rls_forgetting_factor)
+        temp_amb = data.mpc_temp_amb
+        rh_amb   = data.mpc_rh_amb
+        is_day   = data.debug_is_day
+        period   = "day" if is_day else "night"
+        a_bias_key = "mpc_a_bias_day" if is_day else "mpc_a_bias"
+        b_bias_key = "mpc_b_bias_day" if is_day else "mpc_b_bias"
+        a_bias     = model.a_bias_day if is_day else model.a_bias
+        b_bias     = model.b_bias_day if is_day else model.b_bias
 
         # Current observations
-        temp_now = float(data.get("avg_temp_c") or 0.0)
-        rh_now   = float(data.get("avg_rh")     or 0.0)
-
-        # Observed deltas
-        d_temp = temp_now - ctrl.rls_prev_temp
-        d_rh   = rh_now   - ctrl.rls_prev_rh
-
-        h = ctrl.rls_prev_heater
-        e = ctrl.rls_prev_exhaust
+        temp_now = float(data.avg_temp_c or 0.0)
+        rh_now   = float(data.avg_rh     or 0.0)
+
+        # Observed deltas, less the identified humidifier / dehumidifier
+        # effect.  MPC adds that effect on top of the bias (_mpc_biases); left
+        # in, RLS would absorb it into the bias and it would count twice.
+        hu = ctrl.rls_prev_humidifier
+        de = ctrl.rls_prev_dehumidifier
+        d_temp = temp_now - ctrl.rls_prev_temp - (model.a_humidifier * hu + model.a_dehumidifier * de)
+        d_rh   = rh_now   - ctrl.rls_prev_rh   - (model.b_humidifier * hu + model.b_dehumidifier * de)
+
+        # With an ARX dead time the input that drove this step was applied
+        # lag polls before the previous one
+        h = self._lagged_input(ctrl.heater_history,  model.heater_lag,  ctrl.rls_prev_heater)
+        e = self._lagged_input(ctrl.exhaust_history, model.exhaust_lag, ctrl.rls_prev_exhaust)
         pt = ctrl.rls_prev_amb_t if ctrl.rls_prev_amb_t is not None else temp_amb
         pr = ctrl.rls_prev_amb_r if ctrl.rls_prev_amb_r is not None else rh_amb
 
@@ -981,125 +1913,159 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Model: d_temp = a_heater*H + a_exhaust*E + a_passive*(T_amb-T) + a_bias
         phi_t = [float(h), float(e), pt - ctrl.rls_prev_temp, 1.0]
 
-        # Initialise RLS state on first run
+        # Initialise the period's bank on first run from the published model
         init_var = 1.0   # initial parameter variance — large = high uncertainty
-        if ctrl.rls_theta_t is None:
-            ctrl.rls_theta_t = [
-                float(data.get("mpc_a_heater",   0.423)),
-                float(data.get("mpc_a_exhaust",  -0.082)),
-                float(data.get("mpc_a_passive",   0.008)),
-                float(data.get("mpc_a_bias",      0.057)),
-            ]
-            ctrl.rls_P_t = [init_var if i == j else 0.0
-                            for i in range(4) for j in range(4)]
-
-        # Capture innovation (prediction error) using pre-update parameters
-        # before _rls_update overwrites them — used only for debug logging below.
-        innov_t = d_temp - sum(phi_t[i] * ctrl.rls_theta_t[i] for i in range(4))
-
-        theta_t_new, P_t_new = self._rls_update(
-            ctrl.rls_theta_t, ctrl.rls_P_t, phi_t, d_temp, lam
-        )
-
-        # Sanity-clamp: prevent parameters from drifting to physically absurd values
-        theta_t_new[0] = max(-1.0, min(2.0,  theta_t_new[0]))  # a_heater:  must be positive
-        theta_t_new[1] = max(-0.5, min(0.5,  theta_t_new[1]))  # a_exhaust: expected negative, clamped to prevent over-attribution
-        theta_t_new[2] = max(0.005, min(0.5, theta_t_new[2]))  # a_passive: floor at 0.005 (zero collapses thermal mass term)
-        theta_t_new[3] = max(-0.5, min(0.5,  theta_t_new[3]))  # a_bias
+        bank_t = ctrl.rls_banks.get(f"temp_{period}")
+        if bank_t is None:
+            bank_t = ctrl.rls_banks[f"temp_{period}"] = RLSBank(
+                [model.a_heater, model.a_exhaust, model.a_passive, a_bias], lambdas, init_var,
+            )
+        bank_t.retune(lambdas)
+        reset_t = bank_t.update(phi_t, d_temp)
+        bank_t.clamp(_RLS_BOUNDS_T)
+        best_t = bank_t.best()
+        theta_t_new = bank_t.members[best_t].theta
 
         # ── Humidity model ─────────────────────────────────────────────────
         # Model: d_rh = b_exhaust*E + b_passive*(RH_amb-RH) + b_bias
         phi_r = [float(e), pr - ctrl.rls_prev_rh, 1.0]
 
-        if ctrl.rls_theta_r is None:
-            ctrl.rls_theta_r = [
-                float(data.get("mpc_b_exhaust",  -1.196)),
-                float(data.get("mpc_b_passive",   0.006)),
-                float(data.get("mpc_b_bias",      0.556)),
-            ]
-            ctrl.rls_P_r = [init_var if i == j else 0.0
-                            for i in range(3) for j in range(3)]
-
-        # Capture RH innovation using pre-update parameters
-        innov_r = d_rh - sum(phi_r[i] * ctrl.rls_theta_r[i] for i in range(3))
-
-        theta_r_new, P_r_new = self._rls_update(
-            ctrl.rls_theta_r, ctrl.rls_P_r, phi_r, d_rh, lam
-        )
+        bank_r = ctrl.rls_banks.get(f"rh_{period}")
+        if bank_r is None:
+            bank_r = ctrl.rls_banks[f"rh_{period}"] = RLSBank(
+                [model.b_exhaust, model.b_passive, b_bias], lambdas, init_var,
+            )
+        bank_r.retune(lambdas)
+        reset_r = bank_r.update(phi_r, d_rh)
+        bank_r.clamp(_RLS_BOUNDS_R)
+        best_r = bank_r.best()
+        theta_r_new = bank_r.members[best_r].theta
+
+        if reset_t or reset_r:
+            _LOGGER.warning(
+                "%s: RLS covariance wound up (%s) — reset to prior, parameters kept",
+                self.entry.title,
+                " and ".join(m for m, r in (("temperature", reset_t), ("humidity", reset_r)) if r),
+            )
 
-        theta_r_new[0] = max(-3.0, min(0.5,  theta_r_new[0]))  # b_exhaust: expected negative, clamped to prevent wet-towel corruption
-        theta_r_new[1] = max(0.003, min(0.5, theta_r_new[1]))  # b_passive: floor at 0.003 (zero collapses humidity mass term)
-        theta_r_new[2] = max(-2.0, min(2.0,  theta_r_new[2]))  # b_bias
-
-        # Store updated state
-        ctrl.rls_theta_t = theta_t_new
-        ctrl.rls_P_t     = P_t_new
-        ctrl.rls_theta_r = theta_r_new
-        ctrl.rls_P_r     = P_r_new
-
-        # Write updated parameters back to number entities so they persist
-        # and are visible on the dashboard.  Throttled to once per minute
-        # (~6 polls) — writing every 10 s floods the HA event bus with
-        # state_changed events and can cause websocket queue overflows.
-        # In-cycle control always uses the data dict directly (updated below),
-        # so the throttle has no effect on control accuracy.
+        if hasattr(self, "_rls_store") and self._rls_store:
+            self._rls_store.schedule_save(ctrl)
+
+        # Publish updated parameters to the bus so they persist and the number
+        # entities show them on the dashboard.  Throttled to once per minute
+        # (~6 polls) — every publish writes entity state, and doing that every
+        # 10 s floods the HA event bus with state_changed events and can cause
+        # websocket queue overflows.
+        # MPC reads the model snapshot, which moves with each publish — so it
+        # follows RLS at the same cadence and its rollout table is rebuilt at
+        # most once a minute.
+        param_updates = {
+            "mpc_a_heater":  theta_t_new[0],
+            "mpc_a_exhaust": theta_t_new[1],
+            "mpc_a_passive": theta_t_new[2],
+            a_bias_key:      theta_t_new[3],
+            "mpc_b_exhaust": theta_r_new[0],
+            "mpc_b_passive": theta_r_new[1],
+            b_bias_key:      theta_r_new[2],
+        }
         ctrl.rls_write_countdown -= 1
         if ctrl.rls_write_countdown <= 0:
             ctrl.rls_write_countdown = 6  # reset: write again in ~60 s
-            param_updates = {
-                "mpc_a_heater":  round(theta_t_new[0], 6),
-                "mpc_a_exhaust": round(theta_t_new[1], 6),
-                "mpc_a_passive": round(theta_t_new[2], 6),
-                "mpc_a_bias":    round(theta_t_new[3], 6),
-                "mpc_b_exhaust": round(theta_r_new[0], 6),
-                "mpc_b_passive": round(theta_r_new[1], 6),
-                "mpc_b_bias":    round(theta_r_new[2], 6),
-            }
-            for key, val in param_updates.items():
-                num_eid = self._entity_id("number", key)
-                if num_eid:
-                    try:
-                        await self.hass.services.async_call(
-                            "number", "set_value",
-                            {"entity_id": num_eid, "value": val},
-                            blocking=False,
-                        )
-                    except Exception:
-                        pass
-
-        # Update data dict so this cycle's MPC uses the freshly adapted params
-        data["mpc_a_heater"]  = theta_t_new[0]
-        data["mpc_a_exhaust"] = theta_t_new[1]
-        data["mpc_a_passive"] = theta_t_new[2]
-        data["mpc_a_bias"]    = theta_t_new[3]
-        data["mpc_b_exhaust"] = theta_r_new[0]
-        data["mpc_b_passive"] = theta_r_new[1]
-        data["mpc_b_bias"]    = theta_r_new[2]
+            self.params.set_many({k: round(v, 6) for k, v in param_updates.items()})
+            ctrl.rls_model_version = self.model.version
+
+        # Show the freshly adapted params on this cycle's sensors
+        data.update(param_updates)
+        data.debug_rls_lambda_t    = bank_t.lambdas[best_t]
+        data.debug_rls_lambda_r    = bank_r.lambdas[best_r]
+        data.debug_rls_innov_var_t = round(bank_t.innov_var[best_t], 6)
+        data.debug_rls_innov_var_r = round(bank_r.innov_var[best_r], 6)
+
+        # ── Plant-change detection ─────────────────────────────────────────
+        # A run of biased innovations from the model MPC is using means the
+        # plant itself changed — refit from history instead of waiting for
+        # RLS to drift there (or for the weekly re-identification).
+        changed = []
+        for label, prefix, innov in (("temperature", "temp", bank_t.innov[best_t]),
+                                     ("humidity",    "rh",   bank_r.innov[best_r])):
+            key = f"{prefix}_{period}"
+            detector = ctrl.rls_detectors.get(key)
+            if detector is None:
+                detector = ctrl.rls_detectors[key] = InnovationCusum()
+            if detector.update(innov):
+                changed.append(label)
+        data.debug_rls_change_stat = round(max(
+            ctrl.rls_detectors[f"temp_{period}"].statistic,
+            ctrl.rls_detectors[f"rh_{period}"].statistic,
+        ), 2)
+        if changed:
+            await self._async_model_change_detected(changed, period, data)
 
         _LOGGER.debug(
-            "%s: RLS update — a_heater=%.4f a_exhaust=%.4f a_passive=%.5f "
-            "b_exhaust=%.4f innovation_t=%.3f innovation_r=%.3f",
-            self.entry.title,
+            "%s: RLS update (%s) — a_heater=%.4f a_exhaust=%.4f a_passive=%.5f "
+            "b_exhaust=%.4f innovation_t=%.3f innovation_r=%.3f λ_t=%s λ_r=%s",
+            self.entry.title, period,
             theta_t_new[0], theta_t_new[1], theta_t_new[2],
             theta_r_new[0],
-            innov_t,
-            innov_r,
+            bank_t.innov[best_t],
+            bank_r.innov[best_r],
+            bank_t.lambdas[best_t], bank_r.lambdas[best_r],
         )
 
-        # ------------------------------------------------------------------ #
+    async def _async_model_change_detected(self, models: list[str], period: str, data: CycleData) -> None:
+        """Journal a detected plant change and, if enabled, re-identify.
+
+        At most one alarm per _CHANGE_ALARM_COOLDOWN_S — later firings are
+        only logged at debug level.  Re-identification runs in the background
+        (single-flight).
+        """
+        ctrl = self.control
+        now  = dt_util.utcnow()
+        what = " and ".join(models)
+        last = ctrl.last_change_alarm
+        if last is not None and (now - last).total_seconds() < _CHANGE_ALARM_COOLDOWN_S:
+            _LOGGER.debug(
+                "%s: RLS change detector fired (%s, %s) — alarm cooling down",
+                self.entry.title, what, period,
+            )
+            return
+        ctrl.last_change_alarm = now
+        _LOGGER.info("%s: RLS change detector fired (%s, %s)", self.entry.title, what, period)
+
+        if data.mpc_auto_identify_weekly:
+            self.hass.async_create_task(self.async_identify_model())
+            action = "re-identifying MPC model"
+        else:
+            action = "enable MPC Auto-Identify to re-identify automatically"
+
+        now_str = dt_util.as_local(now).strftime("%Y-%m-%d %H:%M")
+        note = (
+            f"📈 Plant change detected ({now_str}) — {what} model ({period}) "
+            f"predictions persistently off | {action}"
+        )
+        self._record_action(f"Plant change detected · {what} ({period})")
+        if hasattr(self, "_notes_store") and self._notes_store:
+            await self._notes_store.async_add(note)
+            if self._notes_sensor:
+                self._notes_sensor.refresh()
+
+    # ------------------------------------------------------------------ #
     #  Temperature ramp helper                                             #
     # ------------------------------------------------------------------ #
 
-    def _apply_temp_ramp(self, effective_target: float, actual_target: float, ramp_rate: float) -> float:
-        """Slide effective_target toward actual_target at no more than ramp_rate °C/poll.
+    def _apply_temp_ramp(
+        self, effective_target: float, actual_target: float, ramp_rate: float, elapsed_s: float,
+    ) -> float:
+        """Slide effective_target toward actual_target at no more than ramp_rate °C/min.
 
-        ramp_rate is in °C/min; the controller polls every 10 seconds so the
-        per-poll cap is ramp_rate * 10/60.  When ramp_rate is 0 the target
-        jumps immediately (ramp disabled).
+        elapsed_s is the time since the ramp last advanced — polls are not
+        evenly spaced, so the cap is ramp_rate * elapsed_s/60 rather than a
+        fixed per-poll step.  When ramp_rate is 0 the target jumps
+        immediately (ramp disabled).
         """
         if ramp_rate <= 0:
             return actual_target
-        max_delta = ramp_rate * (10.0 / 60.0)   # °C per 10-second poll
+        max_delta = ramp_rate * (elapsed_s / 60.0)
         delta = actual_target - effective_target
         if abs(delta) <= max_delta:
             return actual_target
@@ -1190,16 +2156,16 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if cur is not None and cur != desired:
                 if eid_attr == "heater_eid":
                     dec.heater        = desired
-                    dec.heater_reason = f"override:{mode.lower()}"
+                    dec.heater_reason = Reason(Code.OVERRIDE, (mode.lower(),))
                 elif eid_attr == "humidifier_eid":
                     dec.humidifier        = desired
-                    dec.humidifier_reason = f"override:{mode.lower()}"
+                    dec.humidifier_reason = Reason(Code.OVERRIDE, (mode.lower(),))
                 elif eid_attr == "dehumidifier_eid":
                     dec.dehumidifier        = desired
-                    dec.dehumidifier_reason = f"override:{mode.lower()}"
+                    dec.dehumidifier_reason = Reason(Code.OVERRIDE, (mode.lower(),))
                 elif eid_attr == "circ_eid":
                     dec.circ        = desired
-                    dec.circ_reason = f"override:{mode.lower()}"
+                    dec.circ_reason = Reason(Code.OVERRIDE, (mode.lower(),))
             setattr(ctx, on_attr, desired)
             setattr(ctx, eid_attr, None)   # handled — skip auto
 
@@ -1209,10 +2175,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if mode != "Auto" and eid:
             if mode == "Day On":
                 if ctx.is_day:
-                    reason = "override:day_on (day window)"
+                    reason = Reason(Code.OVERRIDE_DAY_ON)
                     if self._exhaust_safety_blocks_off(ctx):
-                        reason += " [SAFETY: forced_on]"
-                    ctx.data["debug_exhaust_reason"] = reason
+                        reason = reason.tagged(Tag.SAFETY_FORCED_ON)
+                    ctx.data.debug_exhaust_reason = reason
                     cur = self._switch_is_on(eid)
                     if cur is not None and not cur:
                         dec.exhaust        = True
@@ -1220,11 +2186,11 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     ctx.exhaust_on  = True
                     ctx.exhaust_eid = None
                 else:
-                    ctx.data["debug_exhaust_reason"] = "day_on: night window -> auto"
+                    ctx.data.debug_exhaust_reason = Reason(Code.DAY_ON_NIGHT_WINDOW)
             elif mode == "Night On":
                 if not ctx.is_day:
-                    reason = "override:night_on (night window)"
-                    ctx.data["debug_exhaust_reason"] = reason
+                    reason = Reason(Code.OVERRIDE_NIGHT_ON)
+                    ctx.data.debug_exhaust_reason = reason
                     cur = self._switch_is_on(eid)
                     if cur is not None and not cur:
                         dec.exhaust        = True
@@ -1232,14 +2198,14 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     ctx.exhaust_on  = True
                     ctx.exhaust_eid = None
                 else:
-                    ctx.data["debug_exhaust_reason"] = "night_on: day window -> auto"
+                    ctx.data.debug_exhaust_reason = Reason(Code.NIGHT_ON_DAY_WINDOW)
             else:
                 desired = mode == "On"
-                reason  = f"override:{mode.lower()}"
+                reason  = Reason(Code.OVERRIDE, (mode.lower(),))
                 if not desired and self._exhaust_safety_blocks_off(ctx):
                     desired = True
-                    reason  += " [SAFETY: blocked_off]"
-                ctx.data["debug_exhaust_reason"] = reason
+                    reason  = reason.tagged(Tag.SAFETY_BLOCKED_OFF)
+                ctx.data.debug_exhaust_reason = reason
                 cur = self._switch_is_on(eid)
                 if cur is not None and cur != desired:
                     dec.exhaust        = desired
@@ -1256,8 +2222,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _apply_heater_safety(self, ctx: _Ctx) -> bool:
         """Returns True if a safety trip fired and the caller should return early."""
         now = ctx.now
-        ctx.data["debug_heater_max_run_s"] = ctx.heater_max_run_s
-        ctx.data["debug_heater_lockout"] = (
+        ctx.data.debug_heater_max_run_s = ctx.heater_max_run_s
+        ctx.data.debug_heater_lockout = (
             "active"
             if (self.control.heater_max_lockout_until and now < self.control.heater_max_lockout_until)
             else "inactive"
@@ -1270,6 +2236,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.control.last_heater_change = now
                 self.control.heater_on_since = None
                 self._record_action("Heater OFF · safety lockout active")
+                self._count_action("heater", Reason(Code.HEATER_LOCKOUT))
                 ctx.heater_on = False
 
         # Trip: max run exceeded
@@ -1285,10 +2252,11 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.control.heater_on_since = None
             self.control.heater_max_lockout_until = now + timedelta(seconds=ctx.heater_hold)
             self._record_action("Heater OFF · SAFETY TRIP max run time exceeded")
+            self._count_action("heater", Reason(Code.HEATER_MAX_RUN))
 
-            ctx.data["control_mode"]         = "safety_trip:heater_max_run"
-            ctx.data["debug_heater_reason"]  = "max_run_time_exceeded -> forced_off"
-            ctx.data["debug_heater_lockout"] = "active"
+            ctx.data.control_mode         = "safety_trip:heater_max_run"
+            ctx.data.debug_heater_reason  = Reason(Code.HEATER_MAX_RUN)
+            ctx.data.debug_heater_lockout = "active"
             return True
 
         return False
@@ -1307,8 +2275,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return hard_dec
 
         dec = ControlDecision(mode="drying_hard_limits_only")
-        self._decide_heater_off(ctx, dec, "drying: in-band -> neutral")
-        self._decide_exhaust_off(ctx, dec, "drying: in-band -> neutral")
+        self._decide_heater_off(ctx, dec, Reason(Code.DRYING_NEUTRAL))
+        self._decide_exhaust_off(ctx, dec, Reason(Code.DRYING_NEUTRAL))
         return dec
 
     # ------------------------------------------------------------------ #
@@ -1323,23 +2291,19 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         dec = ControlDecision(mode=f"night_{exhaust_mode}_dewpoint_protect")
 
         # Humidifier always off at night; dehumidifier if RH too high
-        self._decide_humidifier_off(ctx, dec, "night: force_off")
+        self._decide_humidifier_off(ctx, dec, Reason(Code.NIGHT_FORCE_OFF))
         if ctx.avg_rh > ctx.max_rh:
-            self._decide_dehumidifier_on(ctx, dec)
-            dec.dehumidifier_reason = "night: rh_above_max -> on"
-            ctx.data["debug_dehumidifier_reason"] = dec.dehumidifier_reason
+            self._decide_dehumidifier_on(ctx, dec, Reason(Code.NIGHT_RH_ABOVE_MAX))
         elif ctx.dehumidifier_on:
-            self._decide_dehumidifier_off(ctx, dec)
-            dec.dehumidifier_reason = "night: rh_ok -> off"
-            ctx.data["debug_dehumidifier_reason"] = dec.dehumidifier_reason
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.NIGHT_RH_OK))
 
         # Heater pulse plan — delegate to pure _decide_heater_pulse, then merge
         target_temp = min(ctx.dew + dew_margin_night, ctx.max_temp)
         error       = target_temp - ctx.avg_temp
         on_s, off_s = self._heater_pulse_plan(error)
 
-        ctx.data["debug_heater_target_c"] = round(target_temp, 2)
-        ctx.data["debug_heater_error_c"]  = round(error, 2)
+        ctx.data.debug_heater_target_c = round(target_temp, 2)
+        ctx.data.debug_heater_error_c  = round(error, 2)
 
         pulse_dec = self._decide_heater_pulse(ctx, on_s, off_s)
         # Merge heater decision from pulse into main decision
@@ -1349,10 +2313,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Exhaust night profile
         if exhaust_mode == "on":
-            self._decide_exhaust_on(ctx, dec, "night: profile=on")
+            self._decide_exhaust_on(ctx, dec, Reason(Code.NIGHT_PROFILE_ON))
         elif exhaust_mode == "auto":
             want = ctx.avg_rh > ctx.max_rh or ctx.avg_temp > ctx.max_temp
-            reason = f"night: auto want_exhaust={want}"
+            reason = Reason(Code.NIGHT_AUTO_EXHAUST, (want,))
             if want:
                 self._decide_exhaust_on(ctx, dec, reason)
             else:
@@ -1372,8 +2336,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         dec = ControlDecision()
 
         if on_s == 0:
-            dec.heater_reason = "night: at/above dew target -> off"
-            ctx.data["debug_heater_reason"] = dec.heater_reason
+            dec.heater_reason = Reason(Code.NIGHT_AT_DEW_TARGET)
+            ctx.data.debug_heater_reason = dec.heater_reason
             self.control.heater_pulse_until    = None
             self.control.heater_cooldown_until = None
             if ctx.heater_on and ctx.heater_eid and self._can_toggle(self.control.last_heater_change, ctx.heater_hold):
@@ -1382,15 +2346,15 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return dec
 
         if self.control.heater_cooldown_until and now < self.control.heater_cooldown_until:
-            dec.heater_reason = "night: cooldown"
-            ctx.data["debug_heater_reason"] = dec.heater_reason
+            dec.heater_reason = Reason(Code.NIGHT_COOLDOWN)
+            ctx.data.debug_heater_reason = dec.heater_reason
             if ctx.heater_on and ctx.heater_eid and self._can_toggle(self.control.last_heater_change, ctx.heater_hold):
                 dec.heater = False
                 ctx.heater_on = False
             return dec
 
-        dec.heater_reason = f"night: pulse plan on={on_s}s off={off_s}s"
-        ctx.data["debug_heater_reason"] = dec.heater_reason
+        dec.heater_reason = Reason(Code.NIGHT_PULSE_PLAN, (on_s, off_s))
+        ctx.data.debug_heater_reason = dec.heater_reason
 
         if not ctx.heater_on:
             self.control.heater_pulse_until = now + timedelta(seconds=on_s)
@@ -1416,8 +2380,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Advance pulse state now so the cooldown starts from this cycle
             self.control.heater_pulse_until    = None
             self.control.heater_cooldown_until = now + timedelta(seconds=off_s)
-            dec.heater_reason = f"night: pulse end -> cooldown {off_s}s"
-            ctx.data["debug_heater_reason"] = dec.heater_reason
+            dec.heater_reason = Reason(Code.NIGHT_PULSE_END, (off_s,))
+            ctx.data.debug_heater_reason = dec.heater_reason
 
         return dec
 
@@ -1447,17 +2411,17 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Dew-point floor: override heater if VPD chase left it off
         if not ctx.heater_on and ctx.avg_temp <= dew_floor:
-            floor_reason = (
-                f"night_vpd_chase: dew floor override "
-                f"(avg={ctx.avg_temp:.1f}°C <= floor={dew_floor:.1f}°C)"
-                + (" [VPD Chase (No Heater): dew floor only]" if night_heater_suppressed else "")
-            )
+            floor_reason = Reason(Code.DEW_FLOOR, ("night_vpd_chase", ctx.avg_temp, dew_floor))
+            if night_heater_suppressed:
+                floor_reason = floor_reason.tagged(Tag.DEW_FLOOR_ONLY)
             self._decide_heater_on(ctx, dec, floor_reason)
 
         # Stage exhaust profile: force-on only (auto not applied — causes cycling)
         if exhaust_mode == "on":
-            suffix = " [night profile: force_on]"
-            self._decide_exhaust_on(ctx, dec, (dec.exhaust_reason or "") + suffix)
+            self._decide_exhaust_on(ctx, dec, (
+                dec.exhaust_reason.tagged(Tag.NIGHT_PROFILE_ON) if dec.exhaust_reason
+                else Reason(Code.NIGHT_PROFILE_ON)
+            ))
 
         return dec
 
@@ -1477,17 +2441,42 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         mpc_a_passive: float, mpc_a_bias: float,
         mpc_b_exhaust: float, mpc_b_passive: float, mpc_b_bias: float,
         mpc_w_vpd: float, mpc_w_temp: float, mpc_w_rh: float, mpc_w_switch: float,
+        heater_lag: int = 0, exhaust_lag: int = 0,
+        heater_past: tuple = (), exhaust_past: tuple = (),
+        table: RolloutTable | None = None,
     ) -> tuple[int, int, float, list, float, float, float]:
         """Pure CPU work — runs in a thread pool, must not touch HA state.
 
+        heater_lag / exhaust_lag are the identified dead times in polls.  The
+        rollout is extended by the longest lag with the last planned action
+        held, so the first move still reaches the scored terminal state; the
+        first lag steps are driven by heater_past / exhaust_past (the states
+        applied at recent polls, oldest first).
+
+        table, when built from the same model coefficients, replaces the
+        per-plan simulation with one lookup per plan; it is skipped whenever
+        a clamp could bind, so both paths give the same plan.
+
         Returns (h_want, e_want, best_score, best_actions, pred_temp, pred_rh, pred_vpd).
         """
         import math
 
+        def lead_in(past, lag, current):
+            past = [int(v) for v in past[-lag:]] if lag else []
+            return [int(current)] * (lag - len(past)) + past
+
+        steps  = horizon + max(heater_lag, exhaust_lag)
+        h_lead = lead_in(heater_past,  heater_lag,  heater_on)
+        e_lead = lead_in(exhaust_past, exhaust_lag, exhaust_on)
+
         def sim(actions):
+            hs = h_lead + [a[0] for a in actions]
+            es = e_lead + [a[1] for a in actions]
+            hs += [hs[-1]] * (steps - len(hs))
+            es += [es[-1]] * (steps - len(es))
             temp = temp0
             rh   = rh0
-            for h, e in actions:
+            for h, e in zip(hs, es):
                 temp += mpc_a_heater * h + mpc_a_exhaust * e + mpc_a_passive * (mpc_temp_amb - temp) + mpc_a_bias
                 rh   += mpc_b_exhaust * e + mpc_b_passive * (mpc_rh_amb - rh)   + mpc_b_bias
                 temp = max(0.0, min(60.0, temp))
@@ -1501,6 +2490,36 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         best_score   = float("inf")
         best_actions = [(0, 0)] * horizon
 
+        base = None
+        if table is not None and table.horizon == horizon:
+            base = table.base(
+                temp0, rh0, mpc_temp_amb, mpc_rh_amb,
+                mpc_a_passive, mpc_b_passive, mpc_a_bias, mpc_b_bias,
+                h_lead, e_lead,
+            )
+        if base is not None:
+            base_t, base_r = base
+            best_idx = 0
+            for combo_idx, actions in enumerate(table.actions):
+                tf = base_t + table.d_temp[combo_idx]
+                rf = base_r + table.d_rh[combo_idx]
+                pv = vpd_leaf(tf, rf, tf + leaf_offset)
+                first_h, first_e = actions[0]
+                switch_pen = (abs(first_h - int(heater_on)) + abs(first_e - int(exhaust_on))) * mpc_w_switch
+                score = (mpc_w_vpd  * (pv - target_vpd)  ** 2
+                       + mpc_w_temp * (tf - target_temp)  ** 2
+                       + mpc_w_rh   * (rf - target_rh)    ** 2
+                       + switch_pen)
+                if score < best_score:
+                    best_score = score
+                    best_idx   = combo_idx
+            best_actions = table.actions[best_idx]
+            tf = base_t + table.d_temp[best_idx]
+            rf = base_r + table.d_rh[best_idx]
+            pv = vpd_leaf(tf, rf, tf + leaf_offset)
+            h_want, e_want = best_actions[0]
+            return h_want, e_want, best_score, best_actions, tf, rf, pv
+
         for combo_idx in range(4 ** horizon):
             actions = []
             idx = combo_idx
@@ -1530,6 +2549,38 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         h_want, e_want = best_actions[0]
         return h_want, e_want, best_score, best_actions, tf, rf, pv
 
+    @staticmethod
+    def _mpc_biases(ctx: "_Ctx", day: bool) -> tuple[float, float]:
+        """Temperature and RH bias for the MPC rollout.
+
+        The optimiser only searches heater/exhaust, so the humidifier and
+        dehumidifier are held at their current state over the horizon and
+        their identified effect is folded into the per-step bias.
+        """
+        m = ctx.model
+        a_bias = m.a_bias_day if day else m.a_bias
+        b_bias = m.b_bias_day if day else m.b_bias
+        if ctx.humidifier_on:
+            a_bias += m.a_humidifier
+            b_bias += m.b_humidifier
+        if ctx.dehumidifier_on:
+            a_bias += m.a_dehumidifier
+            b_bias += m.b_dehumidifier
+        return a_bias, b_bias
+
+    async def _async_rollout_table(self, model: ModelParams, horizon: int) -> RolloutTable:
+        """The MPC rollout table for this model version and horizon.
+
+        Built in the executor when the model version (or horizon) moves, and
+        reused for every poll in between — with RLS off that is until the next
+        identification or manual edit, with RLS on about once a minute.
+        """
+        table = self._rollout_table
+        if table is None or table.key != (model.version, horizon):
+            table = await self.hass.async_add_executor_job(RolloutTable, model, horizon)
+            self._rollout_table = table
+        return table
+
     async def _decide_mpc_day(self, ctx: "_Ctx") -> ControlDecision:
         """MPC day control.
 
@@ -1543,12 +2594,12 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         blocks the HA event loop. Only the first step of the optimal sequence
         is executed. Hard limits and hold times are still enforced.
         """
-        ctx.data["control_mode"] = "mpc"
+        ctx.data.control_mode = "mpc"
 
         # Targets: always use day targets in this method
-        target_vpd  = float(ctx.data.get("vpd_target_kpa",  STAGE_TARGET_VPD_KPA.get(ctx.stage, 1.00)))
-        target_temp = float(ctx.data.get("target_temp_c",   STAGE_TARGET_TEMP_C.get(ctx.stage, 25.0)))
-        target_rh   = float(ctx.data.get("target_rh",       STAGE_TARGET_RH.get(ctx.stage, 55.0)))
+        target_vpd  = ctx.data.vpd_target_kpa
+        target_temp = ctx.data.target_temp_c
+        target_rh   = ctx.data.target_rh
 
         # Hard cap horizon at 6: 4^6 = 4096 combos, runs in <1ms in a thread
         horizon = max(1, min(6, int(ctx.mpc_horizon)))
@@ -1558,7 +2609,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.entry.title, ctx.mpc_horizon,
             )
 
-        leaf_offset = float(ctx.data.get("leaf_temp_offset_c", -1.5))
+        leaf_offset = ctx.data.leaf_temp_offset_c
+        a_bias, b_bias = self._mpc_biases(ctx, day=True)
+        m     = ctx.model
+        table = await self._async_rollout_table(m, horizon)
 
         # Run the CPU-intensive optimisation off the event loop
         (h_want, e_want, best_score, best_actions,
@@ -1569,42 +2623,45 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             target_temp, target_rh, target_vpd,
             horizon, leaf_offset,
             ctx.mpc_temp_amb, ctx.mpc_rh_amb,
-            ctx.mpc_a_heater, ctx.mpc_a_exhaust,
-            ctx.mpc_a_passive, ctx.mpc_a_bias_day,  # daytime bias includes grow light heat
-            ctx.mpc_b_exhaust, ctx.mpc_b_passive, ctx.mpc_b_bias,
+            m.a_heater, m.a_exhaust,
+            m.a_passive, a_bias,  # daytime bias includes grow light heat
+            m.b_exhaust, m.b_passive, b_bias,
             ctx.mpc_w_vpd, ctx.mpc_w_temp, ctx.mpc_w_rh, ctx.mpc_w_switch,
+            m.heater_lag, m.exhaust_lag,
+            tuple(self.control.heater_history), tuple(self.control.exhaust_history),
+            table,
         )
 
-        ctx.data["debug_mpc_horizon"]    = horizon
-        ctx.data["debug_mpc_score"]      = round(best_score, 4)
-        ctx.data["debug_mpc_pred_temp"]  = round(temp_pred, 2)
-        ctx.data["debug_mpc_pred_rh"]    = round(rh_pred, 2)
-        ctx.data["debug_mpc_pred_vpd"]   = round(vpd_pred, 3)
-        ctx.data["debug_mpc_plan"]       = str(best_actions[:3])  # first 3 steps for debug
+        ctx.data.debug_mpc_horizon    = horizon
+        ctx.data.debug_mpc_score      = round(best_score, 4)
+        ctx.data.debug_mpc_pred_temp  = round(temp_pred, 2)
+        ctx.data.debug_mpc_pred_rh    = round(rh_pred, 2)
+        ctx.data.debug_mpc_pred_vpd   = round(vpd_pred, 3)
+        ctx.data.debug_mpc_plan       = str(best_actions[:3])  # first 3 steps for debug
 
         dec = ControlDecision(mode="mpc")
 
         if h_want == 1:
-            self._decide_heater_on(ctx, dec, f"mpc: plan={best_actions[:2]} score={best_score:.3f}")
+            self._decide_heater_on(ctx, dec, Reason(Code.MPC_PLAN_SCORED, ("mpc", best_actions[:2], best_score)))
         else:
-            self._decide_heater_off(ctx, dec, f"mpc: plan={best_actions[:2]} score={best_score:.3f}")
+            self._decide_heater_off(ctx, dec, Reason(Code.MPC_PLAN_SCORED, ("mpc", best_actions[:2], best_score)))
 
         if e_want == 1:
-            self._decide_exhaust_on(ctx, dec, f"mpc: plan={best_actions[:2]}")
+            self._decide_exhaust_on(ctx, dec, Reason(Code.MPC_PLAN, ("mpc", best_actions[:2])))
         else:
-            self._decide_exhaust_off(ctx, dec, f"mpc: plan={best_actions[:2]}")
+            self._decide_exhaust_off(ctx, dec, Reason(Code.MPC_PLAN, ("mpc", best_actions[:2])))
 
         # Humidity: RH deadband fallback (no reliable humidifier model yet)
         deadband_rh = 2.0
         if ctx.avg_rh < (target_rh - deadband_rh):
-            self._decide_humidifier_on(ctx, dec, "mpc: rh below target")
-            self._decide_dehumidifier_off(ctx, dec, "mpc: rh below target")
+            self._decide_humidifier_on(ctx, dec, Reason(Code.RH_BELOW_TARGET, ("mpc",)))
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.RH_BELOW_TARGET, ("mpc",)))
         elif ctx.avg_rh > (target_rh + deadband_rh):
-            self._decide_humidifier_off(ctx, dec, "mpc: rh above target")
-            self._decide_reduce_humidity(ctx, dec, "mpc: rh above target")
+            self._decide_humidifier_off(ctx, dec, Reason(Code.RH_ABOVE_TARGET, ("mpc",)))
+            self._decide_reduce_humidity(ctx, dec, Reason(Code.RH_ABOVE_TARGET, ("mpc",)))
         else:
-            self._decide_humidifier_off(ctx, dec, "mpc: rh in band")
-            self._decide_dehumidifier_off(ctx, dec, "mpc: rh in band")
+            self._decide_humidifier_off(ctx, dec, Reason(Code.RH_IN_BAND, ("mpc",)))
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.RH_IN_BAND, ("mpc",)))
 
         return dec
 
@@ -1628,11 +2685,14 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         dew_margin_night = ctx.dew_margin + float(profile.get("dew_margin_add_c", 0.0))
         dew_floor        = ctx.dew + dew_margin_night
 
-        ctx.data["control_mode"] = "night_mpc"
+        ctx.data.control_mode = "night_mpc"
 
         # Hard cap horizon — same as day MPC
         horizon = max(1, min(6, int(ctx.mpc_horizon)))
-        leaf_offset = float(ctx.data.get("leaf_temp_offset_c", -1.5))
+        leaf_offset = ctx.data.leaf_temp_offset_c
+        a_bias, b_bias = self._mpc_biases(ctx, day=False)
+        m     = ctx.model
+        table = await self._async_rollout_table(m, horizon)
 
         # Run optimisation in thread executor using night targets
         (h_want, e_want, best_score, best_actions,
@@ -1643,52 +2703,57 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ctx.night_target_temp, ctx.night_target_rh, ctx.night_vpd_target,
             horizon, leaf_offset,
             ctx.mpc_temp_amb, ctx.mpc_rh_amb,
-            ctx.mpc_a_heater, ctx.mpc_a_exhaust,
-            ctx.mpc_a_passive, ctx.mpc_a_bias,
-            ctx.mpc_b_exhaust, ctx.mpc_b_passive, ctx.mpc_b_bias,
+            m.a_heater, m.a_exhaust,
+            m.a_passive, a_bias,
+            m.b_exhaust, m.b_passive, b_bias,
             ctx.mpc_w_vpd, ctx.mpc_w_temp, ctx.mpc_w_rh, ctx.mpc_w_switch,
+            m.heater_lag, m.exhaust_lag,
+            tuple(self.control.heater_history), tuple(self.control.exhaust_history),
+            table,
         )
 
-        ctx.data["debug_mpc_horizon"]   = horizon
-        ctx.data["debug_mpc_score"]     = round(best_score, 4)
-        ctx.data["debug_mpc_pred_temp"] = round(temp_pred, 2)
-        ctx.data["debug_mpc_pred_rh"]   = round(rh_pred, 2)
-        ctx.data["debug_mpc_pred_vpd"]  = round(vpd_pred, 3)
-        ctx.data["debug_mpc_plan"]      = str(best_actions[:3])
+        ctx.data.debug_mpc_horizon   = horizon
+        ctx.data.debug_mpc_score     = round(best_score, 4)
+        ctx.data.debug_mpc_pred_temp = round(temp_pred, 2)
+        ctx.data.debug_mpc_pred_rh   = round(rh_pred, 2)
+        ctx.data.debug_mpc_pred_vpd  = round(vpd_pred, 3)
+        ctx.data.debug_mpc_plan      = str(best_actions[:3])
 
         dec = ControlDecision(mode="night_mpc")
 
         if h_want == 1:
-            self._decide_heater_on(ctx, dec, f"night_mpc: plan={best_actions[:2]}")
+            self._decide_heater_on(ctx, dec, Reason(Code.MPC_PLAN, ("night_mpc", best_actions[:2])))
         else:
-            self._decide_heater_off(ctx, dec, f"night_mpc: plan={best_actions[:2]}")
+            self._decide_heater_off(ctx, dec, Reason(Code.MPC_PLAN, ("night_mpc", best_actions[:2])))
 
         # Dew-point floor
         if not ctx.heater_on and ctx.avg_temp <= dew_floor:
             self._decide_heater_on(ctx, dec,
-                f"night_mpc: dew floor override (avg={ctx.avg_temp:.1f}°C <= floor={dew_floor:.1f}°C)")
+                Reason(Code.DEW_FLOOR, ("night_mpc", ctx.avg_temp, dew_floor)))
 
         if e_want == 1:
-            self._decide_exhaust_on(ctx, dec, f"night_mpc: plan={best_actions[:2]}")
+            self._decide_exhaust_on(ctx, dec, Reason(Code.MPC_PLAN, ("night_mpc", best_actions[:2])))
         else:
-            self._decide_exhaust_off(ctx, dec, f"night_mpc: plan={best_actions[:2]}")
+            self._decide_exhaust_off(ctx, dec, Reason(Code.MPC_PLAN, ("night_mpc", best_actions[:2])))
 
         # Stage exhaust profile: force-on only
         if exhaust_mode == "on":
-            suffix = " [night profile: force_on]"
-            self._decide_exhaust_on(ctx, dec, (dec.exhaust_reason or "") + suffix)
+            self._decide_exhaust_on(ctx, dec, (
+                dec.exhaust_reason.tagged(Tag.NIGHT_PROFILE_ON) if dec.exhaust_reason
+                else Reason(Code.NIGHT_PROFILE_ON)
+            ))
 
         # Humidity: RH deadband fallback
         deadband_rh = 2.0
         if ctx.avg_rh < (ctx.night_target_rh - deadband_rh):
-            self._decide_humidifier_on(ctx, dec, "night_mpc: rh below target")
-            self._decide_dehumidifier_off(ctx, dec, "night_mpc: rh below target")
+            self._decide_humidifier_on(ctx, dec, Reason(Code.RH_BELOW_TARGET, ("night_mpc",)))
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.RH_BELOW_TARGET, ("night_mpc",)))
         elif ctx.avg_rh > (ctx.night_target_rh + deadband_rh):
-            self._decide_humidifier_off(ctx, dec, "night_mpc: rh above target")
-            self._decide_reduce_humidity(ctx, dec, "night_mpc: rh above target")
+            self._decide_humidifier_off(ctx, dec, Reason(Code.RH_ABOVE_TARGET, ("night_mpc",)))
+            self._decide_reduce_humidity(ctx, dec, Reason(Code.RH_ABOVE_TARGET, ("night_mpc",)))
         else:
-            self._decide_humidifier_off(ctx, dec, "night_mpc: rh in band")
-            self._decide_dehumidifier_off(ctx, dec, "night_mpc: rh in band")
+            self._decide_humidifier_off(ctx, dec, Reason(Code.RH_IN_BAND, ("night_mpc",)))
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.RH_IN_BAND, ("night_mpc",)))
 
         return dec
 
@@ -1705,30 +2770,30 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         dec = ControlDecision(mode=f"hard_limit:{limit}")
 
         if limit == "temp_below_min":
-            self._decide_heater_on(ctx, dec, "hard_limit: temp_below_min -> heater_on")
-            self._decide_exhaust_off(ctx, dec, "hard_limit: temp_below_min -> exhaust_off")
+            self._decide_heater_on(ctx, dec, Reason(Code.HARD_LIMIT_TEMP_LOW, ("heater_on",)))
+            self._decide_exhaust_off(ctx, dec, Reason(Code.HARD_LIMIT_TEMP_LOW, ("exhaust_off",)))
         elif limit == "temp_above_max":
-            self._decide_heater_off(ctx, dec, "hard_limit: temp_above_max -> heater_off")
-            self._decide_exhaust_on(ctx, dec, "hard_limit: temp_above_max -> exhaust_on")
+            self._decide_heater_off(ctx, dec, Reason(Code.HARD_LIMIT_TEMP_HIGH, ("heater_off",)))
+            self._decide_exhaust_on(ctx, dec, Reason(Code.HARD_LIMIT_TEMP_HIGH, ("exhaust_on",)))
         elif limit == "rh_above_max":
             # Gap B fix: exhaust and heater are gated on avg_temp > min_temp —
             # exhausting or shutting off the heater in a cold tent makes things
             # worse.  Dehum fires unconditionally: humidity control is independent
             # of temperature and the dehumidifier won't make the tent colder.
             if ctx.avg_temp > ctx.min_temp:
-                self._decide_exhaust_on(ctx, dec, "hard_limit: rh_above_max -> exhaust_on")
-                self._decide_heater_off(ctx, dec, "hard_limit: rh_above_max -> heater_off")
-            self._decide_humidifier_off(ctx, dec)
-            self._decide_dehumidifier_on(ctx, dec)
+                self._decide_exhaust_on(ctx, dec, Reason(Code.HARD_LIMIT_RH_HIGH, ("exhaust_on",)))
+                self._decide_heater_off(ctx, dec, Reason(Code.HARD_LIMIT_RH_HIGH, ("heater_off",)))
+            self._decide_humidifier_off(ctx, dec, Reason(Code.HARD_LIMIT_RH_HIGH, ("humidifier_off",)))
+            self._decide_dehumidifier_on(ctx, dec, Reason(Code.HARD_LIMIT_RH_HIGH, ("dehumidifier_on",)))
         elif limit == "rh_below_min":
             # Gap B fix: same rationale — exhaust and heater gated on temperature,
             # humidifier fires unconditionally because adding humidity doesn't
             # affect temperature meaningfully.
-            self._decide_exhaust_off(ctx, dec, "hard_limit: rh_below_min -> exhaust_off")
+            self._decide_exhaust_off(ctx, dec, Reason(Code.HARD_LIMIT_RH_LOW, ("exhaust_off",)))
             if ctx.avg_temp > ctx.min_temp:
-                self._decide_heater_off(ctx, dec, "hard_limit: rh_below_min -> heater_off")
-            self._decide_dehumidifier_off(ctx, dec)
-            self._decide_humidifier_on(ctx, dec)
+                self._decide_heater_off(ctx, dec, Reason(Code.HARD_LIMIT_RH_LOW, ("heater_off",)))
+            self._decide_dehumidifier_off(ctx, dec, Reason(Code.HARD_LIMIT_RH_LOW, ("dehumidifier_off",)))
+            self._decide_humidifier_on(ctx, dec, Reason(Code.HARD_LIMIT_RH_LOW, ("humidifier_on",)))
 
         return dec
 
@@ -1740,71 +2805,71 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         dec = ControlDecision(mode="vpd_chase")
         # Use night targets during night window, day targets during day
         if ctx.is_day:
-            target_vpd  = float(ctx.data.get("vpd_target_kpa",  STAGE_TARGET_VPD_KPA.get(ctx.stage, 1.00)))
-            target_temp = float(ctx.data.get("target_temp_c",   STAGE_TARGET_TEMP_C.get(ctx.stage, 25.0)))
-            target_rh   = float(ctx.data.get("target_rh",       STAGE_TARGET_RH.get(ctx.stage, 55.0)))
+            target_vpd  = ctx.data.vpd_target_kpa
+            target_temp = ctx.data.target_temp_c
+            target_rh   = ctx.data.target_rh
         else:
             target_vpd  = ctx.night_vpd_target
             target_temp = ctx.night_target_temp
             target_rh   = ctx.night_target_rh
-        deadband = float(ctx.data.get("vpd_deadband_kpa", 0.07))
+        deadband = ctx.data.vpd_deadband_kpa
         temp_db  = 0.5
         rh_db    = 2.0
         low  = target_vpd - deadband
         high = target_vpd + deadband
 
-        ctx.data["debug_target_temp_c"] = target_temp
-        ctx.data["debug_target_rh"]     = target_rh
+        ctx.data.debug_target_temp_c = target_temp
+        ctx.data.debug_target_rh     = target_rh
 
         if ctx.vpd < low:
             if ctx.avg_temp < (target_temp - temp_db):
-                self._decide_heater_on(ctx, dec, "vpd_low: temp below target -> heater_on")
-                self._decide_exhaust_off(ctx, dec, "vpd_low: temp below target -> exhaust_off")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_low: heating -> dehumidifier_off")
-                self._decide_humidifier_off(ctx, dec, "vpd_low: heating -> humidifier_off")
+                self._decide_heater_on(ctx, dec, Reason(Code.VPD_LOW_TEMP_LOW, ("heater_on",)))
+                self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_LOW, ("exhaust_off",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_LOW, ("dehumidifier_off",)))
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_LOW, ("humidifier_off",)))
             elif ctx.avg_temp > (target_temp + temp_db):
                 # Gap D fix: exhaust off in all vpd_low branches — ventilating
                 # when VPD is already too low (humid) would make it worse.
-                self._decide_heater_off(ctx, dec, "vpd_low: temp above target -> heater_off")
-                self._decide_exhaust_off(ctx, dec, "vpd_low: temp above target -> exhaust_off")
-                self._decide_reduce_humidity(ctx, dec, "vpd_low: temp high -> reduce_humidity")
-                self._decide_humidifier_off(ctx, dec, "vpd_low: temp high -> humidifier_off")
+                self._decide_heater_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_HIGH, ("heater_off",)))
+                self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_HIGH, ("exhaust_off",)))
+                self._decide_reduce_humidity(ctx, dec, Reason(Code.VPD_LOW_TEMP_HIGH, ("reduce_humidity",)))
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_HIGH, ("humidifier_off",)))
             else:
-                self._decide_heater_off(ctx, dec, "vpd_low: temp ok -> heater_off")
-                self._decide_exhaust_off(ctx, dec, "vpd_low: temp ok -> exhaust_off")
-                self._decide_reduce_humidity(ctx, dec, "vpd_low: temp ok -> reduce_humidity")
-                self._decide_humidifier_off(ctx, dec, "vpd_low: -> humidifier_off")
+                self._decide_heater_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_OK, ("heater_off",)))
+                self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_OK, ("exhaust_off",)))
+                self._decide_reduce_humidity(ctx, dec, Reason(Code.VPD_LOW_TEMP_OK, ("reduce_humidity",)))
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_LOW_TEMP_OK, ("humidifier_off",)))
 
         elif ctx.vpd > high:
             if ctx.avg_temp > (target_temp + temp_db):
-                self._decide_heater_off(ctx, dec, "vpd_high: temp above target -> heater_off")
-                self._decide_exhaust_on(ctx, dec, "vpd_high: temp above target -> exhaust_on")
-                self._decide_humidifier_off(ctx, dec, "vpd_high: cooling -> humidifier_off")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_high: cooling -> dehumidifier_off")
+                self._decide_heater_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_HIGH, ("heater_off",)))
+                self._decide_exhaust_on(ctx, dec, Reason(Code.VPD_HIGH_TEMP_HIGH, ("exhaust_on",)))
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_HIGH, ("humidifier_off",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_HIGH, ("dehumidifier_off",)))
             elif ctx.avg_temp < (target_temp - temp_db):
-                self._decide_heater_off(ctx, dec, "vpd_high: temp below target -> heater_off")
-                self._decide_exhaust_off(ctx, dec, "vpd_high: temp below target -> exhaust_off")
-                self._decide_humidifier_on(ctx, dec, "vpd_high: temp low -> humidifier_on")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_high: temp low -> dehumidifier_off")
+                self._decide_heater_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_LOW, ("heater_off",)))
+                self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_LOW, ("exhaust_off",)))
+                self._decide_humidifier_on(ctx, dec, Reason(Code.VPD_HIGH_TEMP_LOW, ("humidifier_on",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_LOW, ("dehumidifier_off",)))
             else:
-                self._decide_heater_off(ctx, dec, "vpd_high: temp ok -> heater_off")
-                self._decide_exhaust_off(ctx, dec, "vpd_high: temp ok -> exhaust_off")
-                self._decide_humidifier_on(ctx, dec, "vpd_high: temp ok -> humidifier_on")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_high: -> dehumidifier_off")
+                self._decide_heater_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_OK, ("heater_off",)))
+                self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_OK, ("exhaust_off",)))
+                self._decide_humidifier_on(ctx, dec, Reason(Code.VPD_HIGH_TEMP_OK, ("humidifier_on",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_HIGH_TEMP_OK, ("dehumidifier_off",)))
 
         else:
             # VPD in band — nudge RH toward target
-            self._decide_heater_off(ctx, dec, "vpd_inband -> heater_off")
-            self._decide_exhaust_off(ctx, dec, "vpd_inband -> exhaust_off")
+            self._decide_heater_off(ctx, dec, Reason(Code.VPD_IN_BAND, ("heater_off",)))
+            self._decide_exhaust_off(ctx, dec, Reason(Code.VPD_IN_BAND, ("exhaust_off",)))
             if ctx.avg_rh < (target_rh - rh_db):
-                self._decide_humidifier_on(ctx, dec, "vpd_inband: rh below target -> humidifier_on")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_inband: rh below target -> dehumidifier_off")
+                self._decide_humidifier_on(ctx, dec, Reason(Code.VPD_IN_BAND_RH_LOW, ("humidifier_on",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_IN_BAND_RH_LOW, ("dehumidifier_off",)))
             elif ctx.avg_rh > (target_rh + rh_db):
-                self._decide_reduce_humidity(ctx, dec, "vpd_inband: rh above target -> reduce_humidity")
-                self._decide_humidifier_off(ctx, dec, "vpd_inband: rh above target -> humidifier_off")
+                self._decide_reduce_humidity(ctx, dec, Reason(Code.VPD_IN_BAND_RH_HIGH, ("reduce_humidity",)))
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_IN_BAND_RH_HIGH, ("humidifier_off",)))
             else:
-                self._decide_humidifier_off(ctx, dec, "vpd_inband")
-                self._decide_dehumidifier_off(ctx, dec, "vpd_inband")
+                self._decide_humidifier_off(ctx, dec, Reason(Code.VPD_IN_BAND_RH_OK, ("humidifier_off",)))
+                self._decide_dehumidifier_off(ctx, dec, Reason(Code.VPD_IN_BAND_RH_OK, ("dehumidifier_off",)))
 
         return dec
 
@@ -1838,16 +2903,16 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # later logic within the same cycle (e.g. dew floor checks) sees the right
     # state — this preserves the existing intra-cycle dependency behaviour.
 
-    def _decide_heater_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: str) -> None:
+    def _decide_heater_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason) -> None:
         dec.heater_reason = reason
-        ctx.data["debug_heater_reason"] = reason
+        ctx.data.debug_heater_reason = reason
         if ctx.heater_on and ctx.heater_eid and self._can_toggle(self.control.last_heater_change, ctx.heater_hold):
             dec.heater = False
             ctx.heater_on = False
 
-    def _decide_heater_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: str) -> None:
+    def _decide_heater_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason) -> None:
         dec.heater_reason = reason
-        ctx.data["debug_heater_reason"] = reason
+        ctx.data.debug_heater_reason = reason
         if (
             not ctx.heater_on and ctx.heater_eid
             and self._heater_allowed_on(ctx.now)
@@ -1856,70 +2921,73 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             dec.heater = True
             ctx.heater_on = True
 
-    def _decide_exhaust_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: str) -> None:
+    def _decide_exhaust_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason) -> None:
         dec.exhaust_reason = reason
-        ctx.data["debug_exhaust_reason"] = reason
+        ctx.data.debug_exhaust_reason = reason
         if not ctx.exhaust_on and ctx.exhaust_eid and self._can_toggle(self.control.last_exhaust_change, ctx.exhaust_hold):
             dec.exhaust = True
             ctx.exhaust_on = True
 
-    def _decide_exhaust_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: str) -> None:
+    def _decide_exhaust_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason) -> None:
         dec.exhaust_reason = reason
-        ctx.data["debug_exhaust_reason"] = reason
+        ctx.data.debug_exhaust_reason = reason
         if ctx.exhaust_on and ctx.exhaust_eid and self._can_toggle(self.control.last_exhaust_change, ctx.exhaust_hold):
             if self._exhaust_safety_blocks_off(ctx):
-                blocked = f"{reason} [SAFETY: blocked_off]"
+                blocked = reason.tagged(Tag.SAFETY_BLOCKED_OFF)
                 dec.exhaust_reason = blocked
-                ctx.data["debug_exhaust_reason"] = blocked
+                ctx.data.debug_exhaust_reason = blocked
                 return
             dec.exhaust = False
             ctx.exhaust_on = False
 
-    def _decide_humidifier_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: str = "auto") -> None:
+    def _decide_humidifier_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason = AUTO) -> None:
         dec.humidifier_reason = reason
         if not ctx.humidifier_on and ctx.humidifier_eid and self._can_toggle(self.control.last_humidifier_change, ctx.humidifier_hold):
             dec.humidifier = True
             ctx.humidifier_on = True
 
-    def _decide_humidifier_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: str = "auto") -> None:
+    def _decide_humidifier_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason = AUTO) -> None:
         dec.humidifier_reason = reason
         if ctx.humidifier_on and ctx.humidifier_eid and self._can_toggle(self.control.last_humidifier_change, ctx.humidifier_hold):
             dec.humidifier = False
             ctx.humidifier_on = False
 
-    def _decide_dehumidifier_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: str = "auto") -> None:
+    def _decide_dehumidifier_on(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason = AUTO) -> None:
         dec.dehumidifier_reason = reason
         if not ctx.dehumidifier_on and ctx.dehumidifier_eid and self._can_toggle(self.control.last_dehumidifier_change, ctx.dehumidifier_hold):
             dec.dehumidifier = True
             ctx.dehumidifier_on = True
 
-    def _decide_dehumidifier_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: str = "auto") -> None:
+    def _decide_dehumidifier_off(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason = AUTO) -> None:
         dec.dehumidifier_reason = reason
         if ctx.dehumidifier_on and ctx.dehumidifier_eid and self._can_toggle(self.control.last_dehumidifier_change, ctx.dehumidifier_hold):
             dec.dehumidifier = False
             ctx.dehumidifier_on = False
 
-    def _decide_reduce_humidity(self, ctx: "_Ctx", dec: "ControlDecision", reason: str = "auto") -> None:
+    def _decide_reduce_humidity(self, ctx: "_Ctx", dec: "ControlDecision", reason: Reason = AUTO) -> None:
         """Reduce humidity: use dehumidifier if configured, otherwise exhaust fan."""
         if ctx.dehumidifier_eid:
             self._decide_dehumidifier_on(ctx, dec, reason)
         else:
-            self._decide_exhaust_on(ctx, dec, f"{reason} [fallback: exhaust]")
+            self._decide_exhaust_on(ctx, dec, reason.tagged(Tag.FALLBACK_EXHAUST))
 
     # ------------------------------------------------------------------ #
     #  Decision applicator                                                 #
     # ------------------------------------------------------------------ #
 
     async def _apply_decision(self, ctx: "_Ctx", dec: "ControlDecision") -> None:
-        """Apply a ControlDecision to hardware — the ONLY place _async_switch is called
+        """Apply a ControlDecision — the ONLY place switch commands are issued
         for normal control flow.
 
         Hold-time bookkeeping, heater run-time tracking, toggle counters, action
         recording, and debug sensor propagation all happen here.  Decision-building
         helpers (_decide_*) remain pure and never touch hardware.
 
-        The blocking flag is reserved for safety-critical decisions (e.g. disturbance
-        neutral) where the switch call must complete before this method returns.
+        The commands themselves are queued: every decision of the cycle lands
+        in one batch that _async_update_data sends once control is done (see
+        _async_flush_switches).  The blocking flag is reserved for
+        safety-critical decisions (e.g. disturbance neutral) and makes that
+        batch complete before the cycle returns.
         """
         now = ctx.now
 
@@ -1944,8 +3012,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     " | ".join(parts),
                 )
 
-        if dec.heater is not None and ctx.heater_eid:
-            await self._async_switch(ctx.heater_eid, dec.heater, blocking=dec.blocking)
+        if dec.heater is not None and ctx.heater_eid and self._command(ctx.heater_eid, dec.heater, dec.blocking):
             self.control.last_heater_change = now
             if dec.heater:
                 if self.control.heater_on_since is None:
@@ -1953,66 +3020,67 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else:
                 self.control.heater_on_since = None
             self._record_action(f"Heater {'ON' if dec.heater else 'OFF'} · {dec.heater_reason}")
+            self._count_action("heater", dec.heater_reason or AUTO)
             self._increment_toggle("heater")
 
-        if dec.exhaust is not None and ctx.exhaust_eid:
-            await self._async_switch(ctx.exhaust_eid, dec.exhaust, blocking=dec.blocking)
+        if dec.exhaust is not None and ctx.exhaust_eid and self._command(ctx.exhaust_eid, dec.exhaust, dec.blocking):
             self.control.last_exhaust_change = now
             self._record_action(f"Exhaust {'ON' if dec.exhaust else 'OFF'} · {dec.exhaust_reason}")
+            self._count_action("exhaust", dec.exhaust_reason or AUTO)
             self._increment_toggle("exhaust")
 
-        if dec.humidifier is not None and ctx.humidifier_eid:
-            await self._async_switch(ctx.humidifier_eid, dec.humidifier, blocking=dec.blocking)
+        if dec.humidifier is not None and ctx.humidifier_eid and self._command(ctx.humidifier_eid, dec.humidifier, dec.blocking):
             self.control.last_humidifier_change = now
             self._record_action(f"Humidifier {'ON' if dec.humidifier else 'OFF'} · {dec.humidifier_reason}")
+            self._count_action("humidifier", dec.humidifier_reason or AUTO)
             self._increment_toggle("humidifier")
 
-        if dec.dehumidifier is not None and ctx.dehumidifier_eid:
-            await self._async_switch(ctx.dehumidifier_eid, dec.dehumidifier, blocking=dec.blocking)
+        if dec.dehumidifier is not None and ctx.dehumidifier_eid and self._command(ctx.dehumidifier_eid, dec.dehumidifier, dec.blocking):
             self.control.last_dehumidifier_change = now
             self._record_action(f"Dehumidifier {'ON' if dec.dehumidifier else 'OFF'} · {dec.dehumidifier_reason}")
+            self._count_action("dehumidifier", dec.dehumidifier_reason or AUTO)
             self._increment_toggle("dehumidifier")
 
-        if dec.circ is not None and ctx.circ_eid:
-            await self._async_switch(ctx.circ_eid, dec.circ, blocking=dec.blocking)
-            reason = dec.circ_reason or ("auto: on" if dec.circ else "auto: off")
+        if dec.circ is not None and ctx.circ_eid and self._command(ctx.circ_eid, dec.circ, dec.blocking):
+            reason = dec.circ_reason or Reason(Code.CIRC_AUTO, ("on" if dec.circ else "off",))
             self._record_action(f"Circulation {'ON' if dec.circ else 'OFF'} · {reason}")
+            self._count_action("circulation", reason)
 
-        if dec.light is not None and ctx.data.get("_light_eid"):
-            light_eid = ctx.data["_light_eid"]
-            await self._async_switch(light_eid, dec.light, blocking=dec.blocking)
+        light_eid = ctx.data.light_eid
+        if dec.light is not None and light_eid and self._command(light_eid, dec.light, dec.blocking):
             self.control.last_light_change = now
-            reason = dec.light_reason or ("schedule" if dec.light else "schedule")
+            reason = dec.light_reason or Reason(Code.LIGHT_SCHEDULE)
             self._record_action(f"Light {'ON' if dec.light else 'OFF'} · {reason}")
+            self._count_action("light", reason)
 
         if dec.mode:
-            ctx.data["control_mode"] = dec.mode
+            ctx.data.control_mode = dec.mode
 
         # Propagate reason strings to data dict for debug sensors
         if dec.heater_reason:
-            ctx.data["debug_heater_reason"] = dec.heater_reason
+            ctx.data.debug_heater_reason = dec.heater_reason
         if dec.exhaust_reason:
-            ctx.data["debug_exhaust_reason"] = dec.exhaust_reason
+            ctx.data.debug_exhaust_reason = dec.exhaust_reason
         if dec.humidifier_reason:
-            ctx.data["debug_humidifier_reason"] = dec.humidifier_reason
+            ctx.data.debug_humidifier_reason = dec.humidifier_reason
         if dec.dehumidifier_reason:
-            ctx.data["debug_dehumidifier_reason"] = dec.dehumidifier_reason
+            ctx.data.debug_dehumidifier_reason = dec.dehumidifier_reason
         if dec.circ_reason:
-            ctx.data["debug_circulation_reason"] = dec.circ_reason
+            ctx.data.debug_circulation_reason = dec.circ_reason
         if dec.light_reason:
-            ctx.data["debug_light_reason"] = dec.light_reason
+            ctx.data.debug_light_reason = dec.light_reason
 
         # ------------------------------------------------------------------ #
     #  Top-level control dispatcher                                        #
     # ------------------------------------------------------------------ #
 
-    async def _apply_control(self, data: dict[str, Any]) -> dict[str, Any]:
-        enabled: bool = data.get("controller_enabled", True)
-        stage:   str  = data.get("stage", DEFAULT_STAGE)
+    async def _apply_control(self, data: CycleData, model: ModelParams) -> CycleData:
+        enabled: bool = data.controller_enabled
+        stage:   str  = data.stage
         drying:  bool = stage == "Drying"
 
-        light_on  = data.get("light_on_time")
-        light_off = data.get("light_off_time")
+        light_on  = data.light_on_time
+        light_off = data.light_off_time
         if not isinstance(light_on,  time): light_on  = _DEFAULT_LIGHT_ON
         if not isinstance(light_off, time): light_off = _DEFAULT_LIGHT_OFF
 
@@ -2022,12 +3090,12 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if drying:
             is_day = False
-            data["debug_light_window"] = (
+            data.debug_light_window = (
                 f"{light_on.strftime('%H:%M:%S')}–{light_off.strftime('%H:%M:%S')} (ignored: drying)"
             )
         else:
-            data["debug_light_window"] = f"{light_on.strftime('%H:%M:%S')}–{light_off.strftime('%H:%M:%S')}"
-        data["debug_is_day"] = is_day
+            data.debug_light_window = f"{light_on.strftime('%H:%M:%S')}–{light_off.strftime('%H:%M:%S')}"
+        data.debug_is_day = is_day
 
         light_eid        = self._get_option(CONF_LIGHT_SWITCH)        if self._use(CONF_USE_LIGHT)         else None
         circ_eid         = self._get_option(CONF_CIRC_SWITCH)         if self._use(CONF_USE_CIRCULATION)   else None
@@ -2038,7 +3106,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Stash light_eid in data so _apply_decision can reach it without
         # threading it through _Ctx (light is not an env-control device)
-        data["_light_eid"] = light_eid
+        data.light_eid = light_eid
 
         # ── Decide: light ─────────────────────────────────────────────────
         light_dec = ControlDecision()
@@ -2047,36 +3115,36 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if light_mode != "Auto":
             desired = light_mode == "On"
-            light_dec.light_reason = f"override:{light_mode.lower()}"
+            light_dec.light_reason = Reason(Code.OVERRIDE, (light_mode.lower(),))
             if light_eid and cur_light is not None and cur_light != desired:
                 light_dec.light = desired
         elif light_eid and cur_light is not None:
             if drying:
-                light_dec.light_reason = "drying -> force_off"
+                light_dec.light_reason = Reason(Code.LIGHT_DRYING_OFF)
                 if cur_light and self._can_toggle(self.control.last_light_change, 10):
                     light_dec.light = False
             elif self.control.startup_polls_remaining > 0:
-                light_dec.light_reason = "startup_suppressed -> waiting_for_schedule"
+                light_dec.light_reason = Reason(Code.LIGHT_STARTUP)
             elif not is_day and cur_light:
-                light_dec.light_reason = "schedule_night_window -> turn_off"
+                light_dec.light_reason = Reason(Code.LIGHT_NIGHT_WINDOW)
                 if self._can_toggle(self.control.last_light_change, 10):
                     light_dec.light = False
             elif is_day and not cur_light:
-                light_dec.light_reason = "schedule_day_window -> turn_on"
+                light_dec.light_reason = Reason(Code.LIGHT_DAY_WINDOW)
                 if self._can_toggle(self.control.last_light_change, 10):
                     light_dec.light = True
             else:
-                light_dec.light_reason = "schedule_ok -> no_change"
+                light_dec.light_reason = Reason(Code.LIGHT_SCHEDULE_OK)
         elif not light_eid:
-            light_dec.light_reason = "light_entity_not_configured"
+            light_dec.light_reason = Reason(Code.LIGHT_NOT_CONFIGURED)
         else:
-            light_dec.light_reason = "light_state_unknown"
+            light_dec.light_reason = Reason(Code.LIGHT_STATE_UNKNOWN)
 
-        data["debug_light_reason"] = light_dec.light_reason
+        data.debug_light_reason = light_dec.light_reason
 
         # ── Decide: controller disabled ───────────────────────────────────
         if not enabled:
-            data["control_mode"] = "disabled"
+            data.control_mode = "disabled"
             disabled_dec = ControlDecision(mode="disabled")
             for eid, mode_key, label in [
                 (heater_eid,       "heater_mode",       "Heater"),
@@ -2093,15 +3161,15 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     continue
                 desired = mode == "On"
                 if label == "Exhaust" and mode == "Off":
-                    avg_t = data.get("avg_temp_c")
-                    avg_r = data.get("avg_rh")
+                    avg_t = data.avg_temp_c
+                    avg_r = data.avg_rh
                     if avg_t is not None and avg_r is not None:
-                        if (float(avg_t) >= float(data.get("exhaust_safety_max_temp_c", 30.0)) or
-                                float(avg_r) >= float(data.get("exhaust_safety_max_rh", 75.0))):
+                        if (float(avg_t) >= data.exhaust_safety_max_temp_c or
+                                float(avg_r) >= data.exhaust_safety_max_rh):
                             desired = True
                 cur_s = self._switch_is_on(eid)
                 if cur_s is not None and cur_s != desired:
-                    reason = f"override:{mode.lower()} (disabled)"
+                    reason = Reason(Code.OVERRIDE_DISABLED, (mode.lower(),))
                     if label == "Heater":
                         disabled_dec.heater        = desired
                         disabled_dec.heater_reason = reason
@@ -2115,28 +3183,11 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         disabled_dec.dehumidifier        = desired
                         disabled_dec.dehumidifier_reason = reason
 
-            # Build a minimal ctx for _apply_decision (only eids needed)
+            # Only the eids are needed to actuate
             disabled_ctx = _Ctx(
-                data=data, now=now, stage=stage, drying=drying, is_day=is_day,
-                avg_temp=0.0, avg_rh=0.0, dew=0.0, vpd=0.0,
-                min_temp=0.0, max_temp=99.0, min_rh=0.0, max_rh=100.0,
-                dew_margin=1.0, heater_hold=60.0, exhaust_hold=45.0,
-                humidifier_hold=45.0, dehumidifier_hold=45.0,
+                data=data, now=now, model=model, stage=stage, drying=drying, is_day=is_day,
                 exhaust_eid=exhaust_eid, heater_eid=heater_eid,
                 humidifier_eid=humidifier_eid, dehumidifier_eid=dehumidifier_eid,
-                circ_eid=None,
-                heater_on=False, exhaust_on=False, humidifier_on=False,
-                dehumidifier_on=False, circ_on=False,
-                exhaust_safety_on=False, exhaust_safety_max_temp=30.0,
-                exhaust_safety_max_rh=75.0, heater_max_run_s=0.0,
-                night_mode="Dew Protection", night_vpd_target=1.0,
-                night_target_temp=20.0, night_target_rh=55.0,
-                temp_ramp_rate=1.0, day_mode="VPD Chase",
-                mpc_horizon=3, mpc_temp_amb=20.0, mpc_rh_amb=55.0,
-                mpc_a_heater=0.423, mpc_a_exhaust=-0.082, mpc_a_passive=0.008,
-                mpc_a_bias=0.057, mpc_a_bias_day=0.180, mpc_b_exhaust=-1.196,
-                mpc_b_passive=0.006, mpc_b_bias=0.556,
-                mpc_w_vpd=5.0, mpc_w_temp=2.0, mpc_w_rh=1.0, mpc_w_switch=0.5,
             )
             await self._apply_decision(disabled_ctx, light_dec)
             await self._apply_decision(disabled_ctx, disabled_dec)
@@ -2148,14 +3199,17 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         humidifier_on    = self._switch_is_on(humidifier_eid) is True
         dehumidifier_on  = self._switch_is_on(dehumidifier_eid) is True
 
-        # Heater on-time tracking (must use real hardware state)
+        # Heater on-time tracking (must use real hardware state).  Only an
+        # "off" report ends it: a plug that drops off the network often does
+        # so with the relay closed, and max-run must keep counting.
+        heater_st = self._snapshot.get(heater_eid) if heater_eid else None
         if heater_on_actual:
             if self.control.heater_on_since is None:
                 self.control.heater_on_since = now
-        else:
+        elif heater_st is None or heater_st.state == "off":
             self.control.heater_on_since = None
 
-        data["debug_heater_on_for_s"] = (
+        data.debug_heater_on_for_s = (
             int((now - self.control.heater_on_since).total_seconds())
             if heater_on_actual and self.control.heater_on_since else 0
         )
@@ -2167,19 +3221,19 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             stage              = stage,
             drying             = drying,
             is_day             = is_day,
-            avg_temp           = float(data.get("avg_temp_c") or 0.0),
-            avg_rh             = float(data.get("avg_rh")     or 0.0),
-            dew                = float(data.get("dew_point_c") or 0.0),
-            vpd                = float(data.get("vpd_kpa")     or 0.0),
-            min_temp           = float(data.get("min_temp_c", 20.0)),
-            max_temp           = float(data.get("max_temp_c", 30.0)),
-            min_rh             = float(data.get("min_rh",     40.0)),
-            max_rh             = float(data.get("max_rh",     70.0)),
-            dew_margin         = float(data.get("dewpoint_margin_c", 1.0)),
-            heater_hold        = float(data.get("heater_hold_s",      60.0)),
-            exhaust_hold       = float(data.get("exhaust_hold_s",     45.0)),
-            humidifier_hold    = float(data.get("humidifier_hold_s",  45.0)),
-            dehumidifier_hold  = float(data.get("dehumidifier_hold_s",45.0)),
+            avg_temp           = float(data.avg_temp_c or 0.0),
+            avg_rh             = float(data.avg_rh     or 0.0),
+            dew                = float(data.dew_point_c or 0.0),
+            vpd                = float(data.vpd_kpa     or 0.0),
+            min_temp           = data.min_temp_c,
+            max_temp           = data.max_temp_c,
+            min_rh             = data.min_rh,
+            max_rh             = data.max_rh,
+            dew_margin         = data.dewpoint_margin_c,
+            heater_hold        = data.heater_hold_s,
+            exhaust_hold       = data.exhaust_hold_s,
+            humidifier_hold    = data.humidifier_hold_s,
+            dehumidifier_hold  = data.dehumidifier_hold_s,
             exhaust_eid        = exhaust_eid,
             heater_eid         = heater_eid,
             humidifier_eid     = humidifier_eid,
@@ -2190,31 +3244,24 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             humidifier_on      = humidifier_on,
             dehumidifier_on    = dehumidifier_on,
             circ_on            = self._switch_is_on(circ_eid) is True,
-            exhaust_safety_on  = bool(data.get("exhaust_safety_override")),
-            exhaust_safety_max_temp = float(data.get("exhaust_safety_max_temp_c", 30.0)),
-            exhaust_safety_max_rh   = float(data.get("exhaust_safety_max_rh",     75.0)),
-            heater_max_run_s   = float(data.get("heater_max_run_s", 0.0) or 0.0),
-            night_mode         = data.get("night_mode", "Dew Protection"),
-            night_vpd_target   = float(data.get("night_vpd_target_kpa", 1.00)),
-            night_target_temp  = float(data.get("night_target_temp_c",  20.0)),
-            night_target_rh    = float(data.get("night_target_rh",      55.0)),
-            temp_ramp_rate     = float(data.get("temp_ramp_rate_c_per_min", 1.0)),
-            day_mode           = data.get("day_mode", "VPD Chase"),
-            mpc_horizon        = int(data.get("mpc_horizon_steps", 3)),
-            mpc_temp_amb       = float(data.get("mpc_temp_amb",    20.0)),
-            mpc_rh_amb         = float(data.get("mpc_rh_amb",      55.0)),
-            mpc_a_heater       = float(data.get("mpc_a_heater",     0.423)),
-            mpc_a_exhaust      = float(data.get("mpc_a_exhaust",   -0.082)),
-            mpc_a_passive      = float(data.get("mpc_a_passive",    0.008)),
-            mpc_a_bias         = float(data.get("mpc_a_bias",       0.057)),
-            mpc_a_bias_day     = float(data.get("mpc_a_bias_day",   0.180)),
-            mpc_b_exhaust      = float(data.get("mpc_b_exhaust",   -1.196)),
-            mpc_b_passive      = float(data.get("mpc_b_passive",    0.006)),
-            mpc_b_bias         = float(data.get("mpc_b_bias",       0.556)),
-            mpc_w_vpd          = float(data.get("mpc_w_vpd",        5.0)),
-            mpc_w_temp         = float(data.get("mpc_w_temp",       2.0)),
-            mpc_w_rh           = float(data.get("mpc_w_rh",         1.0)),
-            mpc_w_switch       = float(data.get("mpc_w_switch",     0.5)),
+            exhaust_safety_on  = data.exhaust_safety_override,
+            exhaust_safety_max_temp = data.exhaust_safety_max_temp_c,
+            exhaust_safety_max_rh   = data.exhaust_safety_max_rh,
+            heater_max_run_s   = data.heater_max_run_s,
+            night_mode         = data.night_mode,
+            night_vpd_target   = data.night_vpd_target_kpa,
+            night_target_temp  = data.night_target_temp_c,
+            night_target_rh    = data.night_target_rh,
+            temp_ramp_rate     = data.temp_ramp_rate_c_per_min,
+            day_mode           = data.day_mode,
+            mpc_horizon        = data.mpc_horizon_steps,
+            mpc_temp_amb       = data.mpc_temp_amb,
+            mpc_rh_amb         = data.mpc_rh_amb,
+            model              = model,
+            mpc_w_vpd          = data.mpc_w_vpd,
+            mpc_w_temp         = data.mpc_w_temp,
+            mpc_w_rh           = data.mpc_w_rh,
+            mpc_w_switch       = data.mpc_w_switch,
         )
 
         # ── Temperature ramp ──────────────────────────────────────────────
@@ -2222,19 +3269,23 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if self.control.last_is_day != ctx.is_day:
             self.control.last_is_day = ctx.is_day
             self.control.ramped_target_temp_c = ctx.avg_temp
+            self.control.ramp_updated_at      = now
             self.control.rls_transition_guard = 60
 
-        actual_target_temp = float(data.get("target_temp_c", 25.0)) if ctx.is_day else ctx.night_target_temp
+        actual_target_temp = data.target_temp_c if ctx.is_day else ctx.night_target_temp
         if self.control.ramped_target_temp_c is None:
             self.control.ramped_target_temp_c = actual_target_temp
+        last_ramp = self.control.ramp_updated_at
+        self.control.ramp_updated_at = now
         self.control.ramped_target_temp_c = self._apply_temp_ramp(
-            self.control.ramped_target_temp_c, actual_target_temp, ramp_rate
+            self.control.ramped_target_temp_c, actual_target_temp, ramp_rate,
+            (now - last_ramp).total_seconds() if last_ramp else _SAMPLE_PERIOD_S,
         )
         if ctx.is_day:
-            data["target_temp_c"] = round(self.control.ramped_target_temp_c, 2)
+            data.target_temp_c = round(self.control.ramped_target_temp_c, 2)
         else:
             ctx.night_target_temp = round(self.control.ramped_target_temp_c, 2)
-        data["debug_ramped_target_temp_c"] = round(self.control.ramped_target_temp_c, 2)
+        data.debug_ramped_target_temp_c = round(self.control.ramped_target_temp_c, 2)
 
         # ── Decide: manual overrides (pure — no switches) ─────────────────
         override_dec = self._decide_forced_modes(ctx)
@@ -2245,29 +3296,31 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if ctx.circ_eid:
             if ctx.drying:
                 circ_dec.circ        = False
-                circ_dec.circ_reason = "auto:off (drying)"
+                circ_dec.circ_reason = Reason(Code.CIRC_DRYING_OFF)
             else:
                 circ_dec.circ        = True
-                circ_dec.circ_reason = "auto:on (day/night)"
-            ctx.data["debug_circulation_reason"] = circ_dec.circ_reason
+                circ_dec.circ_reason = Reason(Code.CIRC_AUTO_ON)
+            ctx.data.debug_circulation_reason = circ_dec.circ_reason
 
+        self.timing.lap("control_prep")
         # ── Apply: light, overrides, circulation ──────────────────────────
         # These are applied before the sensor check so overrides are always
         # enforced even when sensors are unavailable.
         await self._apply_decision(ctx, light_dec)
         await self._apply_decision(ctx, override_dec)
         await self._apply_decision(ctx, circ_dec)
+        self.timing.lap("apply_overrides")
 
         # ── Check sensors ─────────────────────────────────────────────────
         sensors_ok = (
-            data.get("avg_temp_c")  is not None and
-            data.get("avg_rh")      is not None and
-            data.get("dew_point_c") is not None and
-            data.get("vpd_kpa")     is not None
+            data.avg_temp_c  is not None and
+            data.avg_rh      is not None and
+            data.dew_point_c is not None and
+            data.vpd_kpa     is not None
         )
         self._handle_sensor_availability(sensors_ok)
         if not sensors_ok:
-            data["control_mode"] = "waiting_for_sensors"
+            data.control_mode = "waiting_for_sensors"
             # Safety: heater off immediately — blocking call, not deferred.
             # This is an exception to the decide/apply pattern: the risk of
             # leaving a heater running with no sensor feedback justifies a
@@ -2277,6 +3330,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.control.last_heater_change = now
                 self.control.heater_on_since    = None
                 self._record_action("Heater OFF · sensors unavailable safety shutoff")
+                self._count_action("heater", Reason(Code.SENSOR_DROPOUT))
                 _LOGGER.warning(
                     "%s: heater turned off — sensors unavailable (safety shutoff)",
                     self.entry.title,
@@ -2284,12 +3338,12 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return data
 
         # ── Disturbance detection ─────────────────────────────────────────
-        dist_temp_delta  = float(data.get("disturbance_temp_delta_c", 2.0))
-        dist_rh_delta    = float(data.get("disturbance_rh_delta",     8.0))
-        dist_hold_s      = float(data.get("disturbance_hold_s",       120.0))
+        dist_temp_delta  = data.disturbance_temp_delta_c
+        dist_rh_delta    = data.disturbance_rh_delta
+        dist_hold_s      = data.disturbance_hold_s
 
         manual_dist_eid = self._entity_id("switch", "disturbance_active")
-        manual_dist_on  = self._switch_is_on(manual_dist_eid) is True
+        manual_dist_on  = self.settings.disturbance_active
 
         if manual_dist_on and not self.control.disturbance_active:
             self.control.disturbance_active = True
@@ -2299,8 +3353,8 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.info("%s: manual disturbance hold started", self.entry.title)
 
         if not self.control.disturbance_active:
-            avg_t_val = data.get("avg_temp_c")
-            avg_r_val = data.get("avg_rh")
+            avg_t_val = data.avg_temp_c
+            avg_r_val = data.avg_rh
             reason = self._detect_disturbance(
                 avg_t_val, avg_r_val,
                 dist_temp_delta, dist_rh_delta,
@@ -2327,14 +3381,14 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._record_action("Disturbance hold ended — resuming control")
                 _LOGGER.info("%s: disturbance hold ended, resuming control", self.entry.title)
 
-        data["disturbance_active"]         = self.control.disturbance_active
-        data["debug_disturbance_reason"]   = self.control.disturbance_reason
+        data.disturbance_active         = self.control.disturbance_active
+        data.debug_disturbance_reason   = self.control.disturbance_reason
 
         if self.control.disturbance_active:
-            data["control_mode"] = f"disturbance_hold:{self.control.disturbance_reason}"
+            data.control_mode = f"disturbance_hold:{self.control.disturbance_reason}"
             remaining = int((self.control.disturbance_until - now).total_seconds()) \
                 if self.control.disturbance_until else 0
-            data["debug_disturbance_remaining_s"] = remaining
+            data.debug_disturbance_remaining_s = remaining
 
             # Decide: neutral state — all env devices off, hold timers updated.
             # blocking=True so the devices are off before we return.
@@ -2344,20 +3398,20 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             if ctx.heater_on and heater_eid:
                 neutral_dec.heater        = False
-                neutral_dec.heater_reason = "disturbance: neutral"
+                neutral_dec.heater_reason = Reason(Code.DISTURBANCE_NEUTRAL)
             if ctx.exhaust_on and exhaust_eid:
                 neutral_dec.exhaust        = False
-                neutral_dec.exhaust_reason = "disturbance: neutral"
+                neutral_dec.exhaust_reason = Reason(Code.DISTURBANCE_NEUTRAL)
             if ctx.humidifier_on and humidifier_eid:
                 neutral_dec.humidifier        = False
-                neutral_dec.humidifier_reason = "disturbance: neutral"
+                neutral_dec.humidifier_reason = Reason(Code.DISTURBANCE_NEUTRAL)
             if ctx.dehumidifier_on and dehumidifier_eid:
                 neutral_dec.dehumidifier        = False
-                neutral_dec.dehumidifier_reason = "disturbance: neutral"
+                neutral_dec.dehumidifier_reason = Reason(Code.DISTURBANCE_NEUTRAL)
             await self._apply_decision(ctx, neutral_dec)
             return data
         else:
-            data["debug_disturbance_remaining_s"] = 0
+            data.debug_disturbance_remaining_s = 0
 
         # ── Heater safety trip ────────────────────────────────────────────
         # Blocking, direct trip — exception to the decide/apply pattern.
@@ -2365,7 +3419,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if await self._apply_heater_safety(ctx):
             return data
 
-        data["debug_exhaust_policy"] = "normal"
+        data.debug_exhaust_policy = "normal"
 
         # ── Compute decision ──────────────────────────────────────────────
         dec: ControlDecision | None = None
@@ -2390,7 +3444,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     dec = await self._decide_mpc_day(ctx)
                 elif ctx.day_mode == DAY_MODE_LIMITS:
                     dec = ControlDecision(mode="limits_only")
-                elif data.get("vpd_chase_enabled", True):
+                elif data.vpd_chase_enabled:
                     dec = self._decide_vpd_chase(ctx)
                 else:
                     # Gap C note: vpd_chase_enabled gates day VPD Chase only.
@@ -2399,13 +3453,18 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     # this switch — night mode is a separate control surface.
                     dec = ControlDecision(mode="limits_only")
 
+        self.timing.lap("decide")
         # ── Apply decision ────────────────────────────────────────────────
         if dec is not None:
             await self._apply_decision(ctx, dec)
+        self.timing.lap("apply_decision")
 
-        # Update previous readings for next poll's disturbance detection
-        self.control.prev_avg_temp = data.get("avg_temp_c")
-        self.control.prev_avg_rh   = data.get("avg_rh")
+        # Update previous readings for next poll's disturbance detection —
+        # on the grid only, so the delta spans whole 10-second steps
+        if self._sample_tick:
+            self.control.prev_avg_temp = data.avg_temp_c
+            self.control.prev_avg_rh   = data.avg_rh
+            self.control.prev_avg_at   = now
 
         return data
 
@@ -2416,34 +3475,18 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _reset_stage_targets(self, stage: str) -> None:
         """Reset VPD target, temperature target, and RH target to stage defaults.
 
-        Uses the entity registry and number.set_value service calls instead of
-        the deprecated hass.data["entity_components"] internal API, which is
-        unreliable across HA versions and may return None silently.
+        Published through the parameter bus in one batch — the number
+        entities follow it and the values are persisted with a single save.
         """
-        targets = {
-            f"{self.entry.entry_id}_vpd_target_kpa":      STAGE_TARGET_VPD_KPA.get(stage, 1.00),
-            f"{self.entry.entry_id}_target_temp_c":       STAGE_TARGET_TEMP_C.get(stage, 25.0),
-            f"{self.entry.entry_id}_target_rh":           STAGE_TARGET_RH.get(stage, 55.0),
-            f"{self.entry.entry_id}_night_vpd_target_kpa": STAGE_NIGHT_TARGET_VPD_KPA.get(stage, 1.00),
-            f"{self.entry.entry_id}_night_target_temp_c":  STAGE_NIGHT_TARGET_TEMP_C.get(stage, 20.0),
-            f"{self.entry.entry_id}_night_target_rh":      STAGE_NIGHT_TARGET_RH.get(stage, 55.0),
-        }
-
-        registry = er.async_get(self.hass)
-        for unique_id_suffix, value in targets.items():
-            eid = registry.async_get_entity_id("number", DOMAIN, unique_id_suffix)
-            if eid is None:
-                _LOGGER.debug("Stage target reset: entity not found for unique_id=%s", unique_id_suffix)
-                continue
-            try:
-                await self.hass.services.async_call(
-                    "number", "set_value",
-                    {"entity_id": eid, "value": value},
-                    blocking=True,
-                )
-                _LOGGER.debug("Stage target reset %s → %.3f (stage: %s)", eid, value, stage)
-            except Exception as err:
-                _LOGGER.warning("Stage target reset failed for %s: %s", eid, err)
+        self.params.set_many({
+            "vpd_target_kpa":       STAGE_TARGET_VPD_KPA.get(stage, 1.00),
+            "target_temp_c":        STAGE_TARGET_TEMP_C.get(stage, 25.0),
+            "target_rh":            STAGE_TARGET_RH.get(stage, 55.0),
+            "night_vpd_target_kpa": STAGE_NIGHT_TARGET_VPD_KPA.get(stage, 1.00),
+            "night_target_temp_c":  STAGE_NIGHT_TARGET_TEMP_C.get(stage, 20.0),
+            "night_target_rh":      STAGE_NIGHT_TARGET_RH.get(stage, 55.0),
+        })
+        _LOGGER.debug("%s: Stage targets reset to %s defaults", self.entry.title, stage)
 
     # ------------------------------------------------------------------ #
     #  Observability                                                       #
@@ -2467,47 +3510,53 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.control.dehumidifier_toggles += 1
         if hasattr(self, '_toggle_store') and self._toggle_store:
             self._toggle_store.increment(device)
-            self.hass.async_create_task(self._toggle_store.async_save())
+            self._toggle_store.schedule_save()
 
-    def _update_observability(self, data: dict[str, Any]) -> None:
+    def _update_observability(self, data: CycleData) -> None:
         """Update VPD performance counters, toggle sensor data, and emit the
         structured cycle log line.  Called once per poll, after control runs."""
         ctrl  = self.control
         now   = self._now()
 
-        vpd           = data.get("vpd_kpa")
+        vpd           = data.vpd_kpa
         # Use day or night VPD target depending on current period.
         # Previously this always fell through to the day target because
         # vpd_target_kpa is always set, so night in-band % was calculated
         # against the wrong target.
-        _is_day       = data.get("debug_is_day", True)
+        _is_day       = data.debug_is_day
         vpd_target    = (
-            float(data.get("vpd_target_kpa", 1.0))
+            data.vpd_target_kpa
             if _is_day
-            else float(data.get("night_vpd_target_kpa", 1.0))
+            else data.night_vpd_target_kpa
         )
-        deadband      = float(data.get("vpd_deadband_kpa", 0.07))
-        sensors_ok    = vpd is not None and data.get("avg_temp_c") is not None
-        control_mode  = data.get("control_mode", "init")
+        deadband      = data.vpd_deadband_kpa
+        sensors_ok    = vpd is not None and data.avg_temp_c is not None
+        control_mode  = data.control_mode
 
         # ── VPD deadband performance ──────────────────────────────────────
         in_band = False
-        if sensors_ok and control_mode not in ("init", "disabled", "waiting_for_sensors"):
-            ctrl.vpd_total_polls += 1
+        # Weighted by grid steps, so slow polls count for the time they cover
+        steps = self._sample_steps
+        if (steps and sensors_ok
+                and control_mode not in ("init", "disabled", "waiting_for_sensors")):
+            ctrl.vpd_total_polls += steps
             vpd_low  = vpd_target - deadband
             vpd_high = vpd_target + deadband
             in_band  = vpd_low <= float(vpd) <= vpd_high
 
             if in_band:
-                ctrl.vpd_in_band_polls += 1
+                ctrl.vpd_in_band_polls += steps
                 ctrl.vpd_out_of_band_since = None   # reset streak
+                if ctrl.vpd_in_band_since is None:
+                    ctrl.vpd_in_band_since = now
             else:
+                ctrl.vpd_in_band_since = None
                 if ctrl.vpd_out_of_band_since is None:
                     ctrl.vpd_out_of_band_since = now
 
             # Record into the 24-hour rolling store and fire background save
             if hasattr(self, "_vpd_band_store") and self._vpd_band_store:
-                self._vpd_band_store.record(in_band)
+                self._vpd_band_store.record(in_band, steps)
                 self.hass.async_create_task(self._vpd_band_store.async_save())
 
         # Derived metrics for sensor exposure
@@ -2527,14 +3576,14 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if ctrl.vpd_out_of_band_since is not None else 0
         )
 
-        data["vpd_pct_in_band"]        = pct_in_band_24h
-        data["vpd_pct_in_band_hours"]  = hours_of_data
-        data["vpd_out_of_band_s"]      = out_of_band_s
-        data["vpd_polls_total"]        = ctrl.vpd_total_polls
-        data["heater_toggles"]         = ctrl.heater_toggles
-        data["exhaust_toggles"]        = ctrl.exhaust_toggles
-        data["humidifier_toggles"]     = ctrl.humidifier_toggles
-        data["dehumidifier_toggles"]   = ctrl.dehumidifier_toggles
+        data.vpd_pct_in_band        = pct_in_band_24h
+        data.vpd_pct_in_band_hours  = hours_of_data
+        data.vpd_out_of_band_s      = out_of_band_s
+        data.vpd_polls_total        = ctrl.vpd_total_polls
+        data.heater_toggles         = ctrl.heater_toggles
+        data.exhaust_toggles        = ctrl.exhaust_toggles
+        data.humidifier_toggles     = ctrl.humidifier_toggles
+        data.dehumidifier_toggles   = ctrl.dehumidifier_toggles
 
         # ── Structured cycle log ──────────────────────────────────────────
         # Determine controller state label
@@ -2548,10 +3597,10 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             state_label = "SAFETY"
         elif control_mode in ("init",):
             state_label = "INIT"
-        elif not data.get("controller_enabled", True):
+        elif not data.controller_enabled:
             state_label = "DISABLED"
         else:
-            state_label = "DAY" if data.get("debug_is_day") else "NIGHT"
+            state_label = "DAY" if data.debug_is_day else "NIGHT"
 
         # Build compact device state string — only include configured devices
         dev_parts = []
@@ -2570,9 +3619,9 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         devices_str = " ".join(dev_parts) if dev_parts else "no_devices"
 
         # Sensor summary
-        avg_t = data.get("avg_temp_c")
-        avg_r = data.get("avg_rh")
-        vpd_v = data.get("vpd_kpa")
+        avg_t = data.avg_temp_c
+        avg_r = data.avg_rh
+        vpd_v = data.vpd_kpa
         sensor_str = (
             f"{avg_t:.1f}°C {avg_r:.1f}% {vpd_v:.3f}kPa"
             if avg_t is not None and avg_r is not None and vpd_v is not None
@@ -2580,13 +3629,13 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
         # Primary reason — prefer heater reason when in dew/night mode, exhaust otherwise
-        reason = (
-            data.get("debug_heater_reason")
-            or data.get("debug_exhaust_reason")
+        reason = str(
+            data.debug_heater_reason
+            or data.debug_exhaust_reason
             or control_mode
         )
         # Trim reason to keep line compact
-        if reason and len(reason) > 40:
+        if len(reason) > 40:
             reason = reason[:40]
 
         in_band_str = (
@@ -2618,170 +3667,193 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     #  Main data update                                                    #
     # ------------------------------------------------------------------ #
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        temp_eids = [
-            self._get_option(k) for k in (CONF_TEMP_SENSOR_1, CONF_TEMP_SENSOR_2, CONF_TEMP_SENSOR_3)
-            if self._get_option(k)
-        ]
-        rh_eids = [
-            self._get_option(k) for k in (CONF_RH_SENSOR_1, CONF_RH_SENSOR_2, CONF_RH_SENSOR_3)
-            if self._get_option(k)
-        ]
+    async def _async_update_data(self) -> CycleData:
+        # Every path lands here (timer, debounced events, wake-ups, manual
+        # refreshes), so this is where cycles are serialized
+        async with self._cycle_lock:
+            try:
+                return await self._async_run_cycle()
+            finally:
+                if self._rerun:
+                    self._rerun = False
+                    self.hass.async_create_task(self.async_refresh())
+
+    @callback
+    def _async_refresh_now(self) -> None:
+        """Run a cycle now, or straight after the one in progress.
+
+        For exact-time triggers, which skip the debouncer's delay.  A trigger
+        that arrives mid-cycle marks the cycle for a rerun rather than
+        queueing its own refresh behind the lock.
+        """
+        if self._cycle_lock.locked():
+            self._rerun = True
+        else:
+            self.hass.async_create_task(self.async_refresh())
+
+    async def _async_run_cycle(self) -> CycleData:
+        timing = self.timing
+        timing.begin()
+        # One model snapshot for the whole cycle — see model.py
+        model = self.model
+        # ... and one pass over hass.states — see snapshot.py
+        self._snapshot = StateSnapshot(self.hass, self._watched_entity_ids())
+        timing.lap("snapshot")
+        self._sample_steps = self._take_sample_steps(self._now())
+        self._sample_tick  = self._sample_steps > 0
+
+        temp_eids, rh_eids = self._sensor_eids()
 
         # Read raw sensor values
         raw_temps = [self._get_state_float(e) for e in temp_eids]
         raw_rhs   = [self._get_state_float(e) for e in rh_eids]
 
         # Read anomaly filter thresholds from number entities
-        _feid = lambda key: self._entity_id("number", key)
-        max_delta_temp = self._num(_feid("anomaly_max_delta_temp_c"), 3.0)
-        max_delta_rh   = self._num(_feid("anomaly_max_delta_rh"),     10.0)
+        max_delta_temp = self.params.get("anomaly_max_delta_temp_c", 3.0)
+        max_delta_rh   = self.params.get("anomaly_max_delta_rh",     10.0)
 
         # Apply per-sensor spike filter
         filtered_temps, filtered_rhs = self._filter_sensor_readings(
-            raw_temps, raw_rhs, max_delta_temp, max_delta_rh
+            raw_temps, raw_rhs, max_delta_temp, max_delta_rh, self._now()
         )
 
         avg_t = avg(filtered_temps) if filtered_temps else None
         avg_r = avg(filtered_rhs)   if filtered_rhs   else None
 
-        leaf_off_eid  = self._entity_id("number", "leaf_temp_offset_c")
-        leaf_offset_c = self._num(leaf_off_eid, 0.0)
+        leaf_offset_c = self.params.get("leaf_temp_offset_c", 0.0)
 
         vpd = dew = leaf_temp_c = None
         if avg_t is not None and avg_r is not None:
             leaf_temp_c = avg_t + float(leaf_offset_c)
             vpd = vpd_leaf_kpa(avg_t, avg_r, leaf_temp_c)
             dew = dew_point_c(avg_t, avg_r)
+        timing.lap("sensor_filter")
 
-        controller_eid = self._entity_id("switch", "controller")
-        stage_eid      = self._entity_id("select", "stage")
+        settings = self.settings
 
         now_local        = dt_util.as_local(self._now())
         debug_local_time = now_local.strftime("%Y-%m-%d %H:%M:%S")
         debug_local_tod  = now_local.strftime("%H:%M:%S")
 
-        enabled_state      = self._get_entity_state(controller_eid)
-        controller_enabled = (enabled_state == "on") if enabled_state is not None else True
-        stage_state        = self._get_entity_state(stage_eid)
-        stage              = stage_state if stage_state in STAGE_TARGET_VPD_KPA else DEFAULT_STAGE
-
-        def _eid(key: str, domain: str = "number") -> str:
-            return self._entity_id(domain, key)
-
-        data: dict[str, Any] = {
-            "temp_sensor_1_c":  filtered_temps[0] if len(filtered_temps) > 0 else None,
-            "temp_sensor_2_c":  filtered_temps[1] if len(filtered_temps) > 1 else None,
-            "temp_sensor_3_c":  filtered_temps[2] if len(filtered_temps) > 2 else None,
-            "rh_sensor_1":      filtered_rhs[0]   if len(filtered_rhs)   > 0 else None,
-            "rh_sensor_2":      filtered_rhs[1]   if len(filtered_rhs)   > 1 else None,
-            "rh_sensor_3":      filtered_rhs[2]   if len(filtered_rhs)   > 2 else None,
-            "avg_temp_c":      avg_t,
-            "avg_rh":          avg_r,
-            "vpd_kpa":         vpd,
-            "dew_point_c":     dew,
-            "controller_enabled": controller_enabled,
-            "stage":              stage,
-            "min_temp_c":         self._num(_eid("min_temp_c"),         20.0),
-            "max_temp_c":         self._num(_eid("max_temp_c"),         30.0),
-            "min_rh":             self._num(_eid("min_rh"),             40.0),
-            "max_rh":             self._num(_eid("max_rh"),             70.0),
-            "vpd_target_kpa":       self._num(_eid("vpd_target_kpa"),       1.00),
-            "target_temp_c":        self._num(_eid("target_temp_c"),        25.0),
-            "target_rh":            self._num(_eid("target_rh"),            55.0),
-            "night_vpd_target_kpa": self._num(_eid("night_vpd_target_kpa"), 1.00),
-            "night_target_temp_c":  self._num(_eid("night_target_temp_c"),  20.0),
-            "night_target_rh":      self._num(_eid("night_target_rh"),      55.0),
-            "temp_ramp_rate_c_per_min": self._num(_eid("temp_ramp_rate_c_per_min"), 1.0),
-            "vpd_deadband_kpa":   self._num(_eid("vpd_deadband_kpa"),   0.07),
-            "vpd_chase_enabled":  (self._get_entity_state(_eid("vpd_chase_enabled", "switch")) != "off"),
-            "night_mode":         self._get_entity_state(_eid(CONF_NIGHT_MODE, "select")) or "Dew Protection",
-            "day_mode":           self._get_entity_state(_eid(CONF_DAY_MODE, "select")) or "VPD Chase",
+        controller_enabled = settings.controller
+        stage              = settings.stage if settings.stage in STAGE_TARGET_VPD_KPA else DEFAULT_STAGE
+
+        data = CycleData(
+            temp_sensor_1_c=  filtered_temps[0] if len(filtered_temps) > 0 else None,
+            temp_sensor_2_c=  filtered_temps[1] if len(filtered_temps) > 1 else None,
+            temp_sensor_3_c=  filtered_temps[2] if len(filtered_temps) > 2 else None,
+            rh_sensor_1=      filtered_rhs[0]   if len(filtered_rhs)   > 0 else None,
+            rh_sensor_2=      filtered_rhs[1]   if len(filtered_rhs)   > 1 else None,
+            rh_sensor_3=      filtered_rhs[2]   if len(filtered_rhs)   > 2 else None,
+            avg_temp_c=      avg_t,
+            avg_rh=          avg_r,
+            vpd_kpa=         vpd,
+            dew_point_c=     dew,
+            controller_enabled= controller_enabled,
+            stage=              stage,
+            min_temp_c=         self.params.get("min_temp_c",         20.0),
+            max_temp_c=         self.params.get("max_temp_c",         30.0),
+            min_rh=             self.params.get("min_rh",             40.0),
+            max_rh=             self.params.get("max_rh",             70.0),
+            vpd_target_kpa=       self.params.get("vpd_target_kpa",       1.00),
+            target_temp_c=        self.params.get("target_temp_c",        25.0),
+            target_rh=            self.params.get("target_rh",            55.0),
+            night_vpd_target_kpa= self.params.get("night_vpd_target_kpa", 1.00),
+            night_target_temp_c=  self.params.get("night_target_temp_c",  20.0),
+            night_target_rh=      self.params.get("night_target_rh",      55.0),
+            temp_ramp_rate_c_per_min= self.params.get("temp_ramp_rate_c_per_min", 1.0),
+            vpd_deadband_kpa=   self.params.get("vpd_deadband_kpa",   0.07),
+            vpd_chase_enabled=  settings.vpd_chase_enabled,
+            night_mode=         settings.night_mode,
+            day_mode=           settings.day_mode,
             # MPC parameters
-            "mpc_horizon_steps":  int(self._num(_eid("mpc_horizon_steps"), 3)),
-            "mpc_temp_amb":       self._num(_eid("mpc_temp_amb"),   20.0),
-            "mpc_rh_amb":         self._num(_eid("mpc_rh_amb"),     55.0),
-            "mpc_a_heater":       self._num(_eid("mpc_a_heater"),    0.423),
-            "mpc_a_exhaust":      self._num(_eid("mpc_a_exhaust"),  -0.082),
-            "mpc_a_passive":      self._num(_eid("mpc_a_passive"),   0.008),
-            "mpc_a_bias":         self._num(_eid("mpc_a_bias"),      0.057),
-            "mpc_a_bias_day":      self._num(_eid("mpc_a_bias_day"),  0.180),
-            "mpc_b_exhaust":      self._num(_eid("mpc_b_exhaust"),  -1.196),
-            "mpc_b_passive":      self._num(_eid("mpc_b_passive"),   0.006),
-            "mpc_b_bias":         self._num(_eid("mpc_b_bias"),      0.556),
-            "mpc_w_vpd":          self._num(_eid("mpc_w_vpd"),       5.0),
-            "mpc_w_temp":         self._num(_eid("mpc_w_temp"),      2.0),
-            "mpc_w_rh":           self._num(_eid("mpc_w_rh"),        1.0),
-            "mpc_w_switch":       self._num(_eid("mpc_w_switch"),    0.5),
+            mpc_horizon_steps=  int(self.params.get("mpc_horizon_steps", 3)),
+            mpc_temp_amb=       self.params.get("mpc_temp_amb",   20.0),
+            mpc_rh_amb=         self.params.get("mpc_rh_amb",     55.0),
+            **model.as_values(),
+            mpc_model_version=  model.version,
+            mpc_w_vpd=          self.params.get("mpc_w_vpd",       5.0),
+            mpc_w_temp=         self.params.get("mpc_w_temp",      2.0),
+            mpc_w_rh=           self.params.get("mpc_w_rh",        1.0),
+            mpc_w_switch=       self.params.get("mpc_w_switch",    0.5),
             # RLS
-            "rls_enabled":                (self._get_entity_state(_eid(CONF_RLS_ENABLED, "switch")) == "on"),
-            "rls_forgetting_factor":       self._num(_eid("rls_forgetting_factor"), 0.999),
-            "mpc_auto_identify_weekly":   (self._get_entity_state(_eid(CONF_MPC_AUTO_IDENTIFY_WEEKLY, "switch")) == "on"),
-            "mpc_identify_days":           int(self._num(_eid("mpc_identify_days"), 7)),
-            "dewpoint_margin_c":  self._num(_eid("dewpoint_margin_c"),  1.0),
-            "heater_hold_s":      self._num(_eid("heater_hold_s"),      60.0),
-            "exhaust_hold_s":     self._num(_eid("exhaust_hold_s"),     45.0),
-            "humidifier_hold_s":  self._num(_eid("humidifier_hold_s"),  45.0),
-            "dehumidifier_hold_s":self._num(_eid("dehumidifier_hold_s"),45.0),
-            "exhaust_safety_override":   (self._get_entity_state(_eid(CONF_EXHAUST_SAFETY_OVERRIDE, "switch")) == "on"),
-            "exhaust_safety_max_temp_c": self._num(_eid(CONF_EXHAUST_SAFETY_MAX_TEMP_C), 30.0),
-            "exhaust_safety_max_rh":     self._num(_eid(CONF_EXHAUST_SAFETY_MAX_RH),     75.0),
-            "heater_max_run_s":          self._num(_eid("heater_max_run_s"),              0.0),
+            rls_enabled=                settings.rls_enabled,
+            rls_forgetting_factor=       self.params.get("rls_forgetting_factor", 0.999),
+            mpc_auto_identify_weekly=   settings.mpc_auto_identify_weekly,
+            mpc_identify_days=           int(self.params.get("mpc_identify_days", 7)),
+            mpc_identify_max_lag=        int(self.params.get("mpc_identify_max_lag", 12)),
+            dewpoint_margin_c=  self.params.get("dewpoint_margin_c",  1.0),
+            heater_hold_s=      self.params.get("heater_hold_s",      60.0),
+            exhaust_hold_s=     self.params.get("exhaust_hold_s",     45.0),
+            humidifier_hold_s=  self.params.get("humidifier_hold_s",  45.0),
+            dehumidifier_hold_s=self.params.get("dehumidifier_hold_s",45.0),
+            exhaust_safety_override=   settings.exhaust_safety_override,
+            exhaust_safety_max_temp_c= self.params.get(CONF_EXHAUST_SAFETY_MAX_TEMP_C, 30.0),
+            exhaust_safety_max_rh=     self.params.get(CONF_EXHAUST_SAFETY_MAX_RH,     75.0),
+            heater_max_run_s=          self.params.get("heater_max_run_s",              0.0),
             # Disturbance detection thresholds
-            "disturbance_temp_delta_c": self._num(_eid("disturbance_temp_delta_c"), 2.0),
-            "disturbance_rh_delta":     self._num(_eid("disturbance_rh_delta"),     8.0),
-            "disturbance_hold_s":       self._num(_eid("disturbance_hold_s"),       120.0),
+            disturbance_temp_delta_c= self.params.get("disturbance_temp_delta_c", 2.0),
+            disturbance_rh_delta=     self.params.get("disturbance_rh_delta",     8.0),
+            disturbance_hold_s=       self.params.get("disturbance_hold_s",       120.0),
             # Anomaly filter thresholds (also read earlier before averaging, re-included for sensor display)
-            "anomaly_max_delta_temp_c": self._num(_eid("anomaly_max_delta_temp_c"), 3.0),
-            "anomaly_max_delta_rh":     self._num(_eid("anomaly_max_delta_rh"),     10.0),
-            "light_on_time":   self._parse_time(self._get_entity_state(_eid("light_on",  "time")), _DEFAULT_LIGHT_ON),
-            "light_off_time":  self._parse_time(self._get_entity_state(_eid("light_off", "time")), _DEFAULT_LIGHT_OFF),
-            "control_mode":    "init",
-            "leaf_temp_offset_c":  float(leaf_offset_c),
-            "leaf_temp_c":         leaf_temp_c,
+            anomaly_max_delta_temp_c= self.params.get("anomaly_max_delta_temp_c", 3.0),
+            anomaly_max_delta_rh=     self.params.get("anomaly_max_delta_rh",     10.0),
+            light_on_time=   settings.light_on,
+            light_off_time=  settings.light_off,
+            control_mode=    "init",
+            leaf_temp_offset_c=  float(leaf_offset_c),
+            leaf_temp_c=         leaf_temp_c,
             # New in v0.1.15
-            "last_action":         self.control.last_action,
-            "sensors_unavailable": self.control.sensors_were_unavailable,
+            last_action=         self.control.last_action,
+            sensors_unavailable= self.control.sensors_were_unavailable,
             # Debug
-            "debug_local_time":       debug_local_time,
-            "debug_target_temp_c":    None,
-            "debug_target_rh":        None,
-            "debug_local_tod":        debug_local_tod,
-            "debug_light_reason":     "n/a",
-            "debug_exhaust_policy":   "n/a",
-            "debug_exhaust_reason":   "n/a",
-            "debug_heater_reason":    "n/a",
-            "debug_heater_target_c":  None,
-            "debug_heater_error_c":   None,
-            "debug_heater_on_for_s":  0,
-            "debug_heater_max_run_s": 0.0,
-            "debug_heater_lockout":   "inactive",
-            "debug_ramped_target_temp_c": None,
-            "debug_mpc_horizon":    0,
-            "debug_mpc_score":      None,
-            "debug_mpc_pred_temp":  None,
-            "debug_mpc_pred_rh":    None,
-            "debug_mpc_pred_vpd":   None,
-            "debug_mpc_plan":       "n/a",
-            "debug_ambient_source": "static_slider",
+            debug_local_time=       debug_local_time,
+            debug_target_temp_c=    None,
+            debug_target_rh=        None,
+            debug_local_tod=        debug_local_tod,
+            debug_light_reason=     "n/a",
+            debug_exhaust_policy=   "n/a",
+            debug_exhaust_reason=   "n/a",
+            debug_heater_reason=    "n/a",
+            debug_heater_target_c=  None,
+            debug_heater_error_c=   None,
+            debug_heater_on_for_s=  0,
+            debug_heater_max_run_s= 0.0,
+            debug_heater_lockout=   "inactive",
+            debug_ramped_target_temp_c= None,
+            debug_mpc_horizon=    0,
+            debug_mpc_score=      None,
+            debug_mpc_pred_temp=  None,
+            debug_mpc_pred_rh=    None,
+            debug_mpc_pred_vpd=   None,
+            debug_mpc_plan=       "n/a",
+            debug_ambient_source= "static_slider",
             # Disturbance detection
-            "disturbance_active":              False,
-            "debug_disturbance_reason":        "none",
-            "debug_disturbance_remaining_s":   0,
+            disturbance_active=              False,
+            debug_disturbance_reason=        "none",
+            debug_disturbance_remaining_s=   0,
             # Observability (populated later by _update_observability)
-            "vpd_pct_in_band":        None,
-            "vpd_pct_in_band_hours":  0,
-            "vpd_out_of_band_s":      0,
-            "vpd_polls_total":        self.control.vpd_total_polls,
-            "heater_toggles":         self.control.heater_toggles,
-            "exhaust_toggles":        self.control.exhaust_toggles,
-            "humidifier_toggles":     self.control.humidifier_toggles,
-            "dehumidifier_toggles":   self.control.dehumidifier_toggles,
+            vpd_pct_in_band=        None,
+            vpd_pct_in_band_hours=  0,
+            vpd_out_of_band_s=      0,
+            vpd_polls_total=        self.control.vpd_total_polls,
+            heater_toggles=         self.control.heater_toggles,
+            exhaust_toggles=        self.control.exhaust_toggles,
+            humidifier_toggles=     self.control.humidifier_toggles,
+            dehumidifier_toggles=   self.control.dehumidifier_toggles,
+            # Device duty cycles (0/100 %) — recorded as long-term statistics
+            # so the hourly mean is the duty cycle used by identification
+            heater_duty_pct=      None,
+            exhaust_duty_pct=     None,
+            humidifier_duty_pct=  None,
+            dehumidifier_duty_pct= None,
+            light_duty_pct=       None,
             # MPC identification results (updated by button/auto)
-            "mpc_r2_temp":          self.control.mpc_r2_temp,
-            "mpc_r2_rh":            self.control.mpc_r2_rh,
-            "mpc_last_identified":  self.control.mpc_last_identified,
-        }
+            mpc_r2_temp=          self.control.mpc_r2_temp,
+            mpc_r2_rh=            self.control.mpc_r2_rh,
+            mpc_last_identified=  self.control.mpc_last_identified,
+        )
+        timing.lap("settings")
 
         # --- Ambient estimate for MPC ---
         # Priority: lung room sensor → weather blend → static slider
@@ -2794,7 +3866,7 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ambient_temp_eid  = self._get_option(CONF_AMBIENT_TEMP)    or None
         ambient_rh_eid    = self._get_option(CONF_AMBIENT_RH)      or None
         weather_eid       = self._get_option(CONF_WEATHER_ENTITY)  or None
-        weather_blend     = float(self._num(self._entity_id("number", "mpc_weather_blend"), 0.9))
+        weather_blend     = float(self.params.get("mpc_weather_blend", 0.9))
         weather_blend     = max(0.0, min(1.0, weather_blend))
 
         # Read lung room sensor
@@ -2824,43 +3896,33 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             eff_rh = None
 
-        # Apply effective ambient and write back to number entities
-        async def _apply_amb(val: float, key: str, threshold: float) -> None:
-            data[key] = val
-            num_eid = self._entity_id("number", key)
-            if num_eid and self._get_entity_state(num_eid) not in (None, "unavailable"):
-                try:
-                    current = float(self._get_entity_state(num_eid) or 0)
-                    if abs(current - val) >= threshold:
-                        await self.hass.services.async_call(
-                            "number", "set_value",
-                            {"entity_id": num_eid, "value": round(val, 1)},
-                            blocking=False,
-                        )
-                except Exception:
-                    pass
-
-        if eff_temp is not None:
-            await _apply_amb(eff_temp, "mpc_temp_amb", 0.05)
-        if eff_rh is not None:
-            await _apply_amb(eff_rh,   "mpc_rh_amb",   0.5)
-
-        data["debug_ambient_source"] = (
-            "lung_room+weather" if (lung_room_temp is not None and outdoor_temp is not None)
-            else "lung_room" if lung_room_temp is not None
-            else "weather" if outdoor_temp is not None
-            else "static_slider"
+        # Low-pass and hold in the tracker; the MPC Ambient numbers are only
+        # the fallback once the sources have been quiet too long — see ambient.py
+        lung_room = lung_room_temp is not None or lung_room_rh is not None
+        outdoor   = outdoor_temp   is not None or outdoor_rh   is not None
+        self.ambient.update(
+            eff_temp, eff_rh,
+            "lung_room+weather" if lung_room and outdoor
+            else "lung_room" if lung_room
+            else "weather" if outdoor
+            else None,
+            now_local, self.params.get("mpc_ambient_filter_min", 10.0),
         )
+        amb_t, amb_r, amb_source = self.ambient.effective(now_local, data.mpc_temp_amb, data.mpc_rh_amb)
+        data.mpc_temp_amb = round(amb_t, 2)
+        data.mpc_rh_amb   = round(amb_r, 2)
+        data.debug_ambient_source = amb_source
+        timing.lap("ambient")
 
         # --- Target conflict detection ---
         # Compute the VPD that would result from target_temp + target_rh
         # using the same leaf offset the controller uses for live VPD.
         # If this implied VPD deviates from target_vpd by more than a
         # threshold, the targets are inconsistent and the user should be warned.
-        t_temp = float(data.get("target_temp_c", 25.0))
-        t_rh   = float(data.get("target_rh",     55.0))
-        t_vpd  = float(data.get("vpd_target_kpa", 1.00))
-        t_leaf = t_temp + float(data.get("leaf_temp_offset_c", -1.5))
+        t_temp = data.target_temp_c
+        t_rh   = data.target_rh
+        t_vpd  = data.vpd_target_kpa
+        t_leaf = t_temp + data.leaf_temp_offset_c
         implied_vpd = round(vpd_leaf_kpa(t_temp, t_rh, t_leaf), 3)
         conflict_pct = round(((implied_vpd - t_vpd) / t_vpd) * 100.0, 1) if t_vpd > 0 else 0.0
         # Implied RH needed at target_temp to actually hit target_vpd
@@ -2868,42 +3930,81 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         svp_air  = sat_vapor_pressure_kpa(t_temp)
         svp_leaf = sat_vapor_pressure_kpa(t_leaf)
         implied_rh = round(max(0.0, min(100.0, (svp_leaf - t_vpd) / svp_air * 100.0)), 1) if svp_air > 0 else t_rh
-        data["target_vpd_implied"]   = implied_vpd
-        data["target_conflict_pct"]  = conflict_pct
-        data["target_implied_rh"]    = implied_rh
+        data.target_vpd_implied   = implied_vpd
+        data.target_conflict_pct  = conflict_pct
+        data.target_implied_rh    = implied_rh
 
-        data = await self._apply_control(data)
+        self._observe_actuators(data)
+        timing.lap("target_check")
+        try:
+            data = await self._apply_control(data, model)
+        finally:
+            await self._async_flush_switches()
+            # Also takes the tail of _apply_control after its last phase
+            timing.lap("switch_flush")
+        # heater_on_since / heater_max_run_s may have moved this cycle
+        self.safety.async_arm_heater()
+        self._arm_wakeups()
 
         # --- RLS online adaptation ---
         # Store current observations for use in next poll's RLS update.
         # The RLS update itself uses the *previous* poll's observations
         # (what was commanded) vs the *current* readings (what happened).
-        if data.get("rls_enabled") and data.get("avg_temp_c") is not None:
+        # Both ends are grid cycles — event-driven cycles in between neither
+        # update the estimator nor move the observations it compares against.
+        # The model is one 10-second step, so after a late poll (several steps
+        # at once) there is no one-step pair to learn from; the update is
+        # skipped and the observations restart from here.  The watchdog does
+        # not slow down while RLS is on, so this is the exception.
+        steps = self._sample_steps
+        if steps and data.rls_enabled and data.avg_temp_c is not None:
             if self.control.rls_transition_guard > 0:
-                self.control.rls_transition_guard -= 1
+                self.control.rls_transition_guard = max(0, self.control.rls_transition_guard - steps)
                 _LOGGER.debug(
                     "%s: RLS suppressed during transition guard (%d polls remaining)",
                     self.entry.title, self.control.rls_transition_guard,
                 )
-            else:
+            elif steps == 1:
                 await self._apply_rls_update(data)
         # Always update prev observations regardless of RLS enabled state
         # so that when RLS is turned on it has valid prev values immediately.
-        # Read switch state directly here — heater_on_actual / exhaust_on are only
-        # defined when the controller is enabled (they are set after the early-return
-        # disabled branch), so we cannot reference them unconditionally.
-        if data.get("avg_temp_c") is not None and data.get("avg_rh") is not None:
-            _h_eid = self._get_option(CONF_HEATER_SWITCH)
-            _e_eid = self._get_option(CONF_EXHAUST_SWITCH)
-            self.control.rls_prev_temp    = float(data["avg_temp_c"])
-            self.control.rls_prev_rh      = float(data["avg_rh"])
+        # Read switch state from the cycle snapshot here — heater_on_actual /
+        # exhaust_on are only defined when the controller is enabled (they are set
+        # after the early-return disabled branch), so we cannot reference them
+        # unconditionally.  The snapshot carries this cycle's commands, so these
+        # are the post-actuation states.
+        _h_eid = self._get_option(CONF_HEATER_SWITCH)
+        _e_eid = self._get_option(CONF_EXHAUST_SWITCH)
+        duty_eids = {"heater": _h_eid, "exhaust": _e_eid, **self._identification_extra_inputs()}
+        for name, eid in duty_eids.items():
+            is_on = self._switch_is_on(eid)
+            key = f"{name}_duty_pct"
+            data[key] = None if is_on is None else (100.0 if is_on else 0.0)
+        if (self._sample_tick and data.avg_temp_c is not None
+                and data.avg_rh is not None):
+            self.control.rls_prev_temp    = float(data.avg_temp_c)
+            self.control.rls_prev_rh      = float(data.avg_rh)
             self.control.rls_prev_heater  = 1 if self._switch_is_on(_h_eid) else 0
             self.control.rls_prev_exhaust = 1 if self._switch_is_on(_e_eid) else 0
-            self.control.rls_prev_amb_t   = float(data.get("mpc_temp_amb", 20.0))
-            self.control.rls_prev_amb_r   = float(data.get("mpc_rh_amb",   55.0))
-
-        # --- MPC auto-identify weekly ---
-        if data.get("mpc_auto_identify_weekly"):
+            self.control.rls_prev_humidifier   = 1 if data.humidifier_duty_pct   else 0
+            self.control.rls_prev_dehumidifier = 1 if data.dehumidifier_duty_pct else 0
+            for hist, state in ((self.control.heater_history,  self.control.rls_prev_heater),
+                                (self.control.exhaust_history, self.control.rls_prev_exhaust)):
+                # Devices only switch on cycles, so over skipped steps the
+                # previous state was held
+                held = hist[-1] if hist else state
+                hist.extend([held] * (steps - 1))
+                hist.append(state)
+                del hist[:-(_MAX_INPUT_LAG + 1)]
+            self.control.rls_prev_amb_t   = data.mpc_temp_amb
+            self.control.rls_prev_amb_r   = data.mpc_rh_amb
+        timing.lap("rls")
+
+        # --- MPC auto-identify ---
+        # With RLS on, the change detector in _apply_rls_update decides when
+        # to re-identify.  Without RLS there are no innovations to watch, so
+        # fall back to a weekly refit.
+        if data.mpc_auto_identify_weekly and not data.rls_enabled:
             last = self.control.last_auto_identify
             if last is None or (dt_util.utcnow() - last).total_seconds() >= 7 * 86400:
                 _LOGGER.info("%s: weekly auto-identification triggered", self.entry.title)
@@ -2915,18 +4016,31 @@ class GrowTentCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # RestoreEntity time to restore saved number values before the coordinator
         # compares against them. Genuine stage changes require manual user action
         # so the 60s window is safe.
-        current_stage = data.get("stage", DEFAULT_STAGE)
+        current_stage = data.stage
         if self.control.startup_polls_remaining > 0:
             # Always record stage during startup window, never reset
             self.control.last_stage = current_stage
-            self.control.startup_polls_remaining -= 1
+            self.control.startup_polls_remaining = max(
+                0, self.control.startup_polls_remaining - self._sample_steps
+            )
         elif current_stage != self.control.last_stage:
             self.control.last_stage = current_stage
             await self._reset_stage_targets(current_stage)
+        timing.lap("stage_reset")
 
         # ------------------------------------------------------------------ #
         #  Observability                                                        #
         # ------------------------------------------------------------------ #
         self._update_observability(data)
+        timing.lap("observability")
+
+        # ── Adaptive poll interval ────────────────────────────────────────
+        # Takes effect when the coordinator schedules the next refresh,
+        # right after this returns
+        self._cycle_readings = dict(zip(temp_eids + rh_eids, raw_temps + raw_rhs))
+        interval = self._next_poll_interval(data)
+        self.update_interval = timedelta(seconds=interval)
+        data.debug_poll_interval_s = interval
 
+        data.debug_cycle_ms = timing.end()
         return data
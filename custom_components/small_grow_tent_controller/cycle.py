@@ -0,0 +1,218 @@
+"""
+Typed per-cycle data — what one poll read, decided and publishes.
+
+A cycle used to build a fresh dict of some 130 string keys and then read most
+of them back with float(data.get(key, default)) casts.  A mistyped key there
+silently fell back to the default.  CycleData holds the same values as
+slotted, typed attributes: the coordinator reads and writes data.avg_temp_c
+and friends, values are cast once when the cycle fills them in, and a
+mistyped name is an AttributeError.
+
+Entities still look values up by key — a sensor's key is its unique_id
+suffix — so CycleData is also a read-only Mapping over its public fields.
+Item assignment is kept for the few writers whose key is computed (ambient
+values, duty cycles, actuation latencies, RLS-adapted model values) and
+raises KeyError for a name that is not a field.  The debug_*_reason fields
+hold reasons.Reason objects; the Mapping view renders them to text.
+
+One instance per cycle: the finished one is what the entities read, so it is
+not reused for the next cycle.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, fields
+from datetime import time
+from typing import Any
+
+from .const import DAY_MODE_VPD, DEFAULT_STAGE, NIGHT_MODE_DEW
+from .reasons import Reason
+
+
+@dataclass(slots=True, eq=False)
+class CycleData(Mapping):
+    # ── Sensors (spike-filtered) and derived climate ─────────────────────────
+    temp_sensor_1_c: float | None = None
+    temp_sensor_2_c: float | None = None
+    temp_sensor_3_c: float | None = None
+    rh_sensor_1:     float | None = None
+    rh_sensor_2:     float | None = None
+    rh_sensor_3:     float | None = None
+    avg_temp_c:      float | None = None
+    avg_rh:          float | None = None
+    vpd_kpa:         float | None = None
+    dew_point_c:     float | None = None
+    leaf_temp_offset_c: float = 0.0
+    leaf_temp_c:     float | None = None
+
+    # ── Settings and targets ─────────────────────────────────────────────────
+    controller_enabled: bool = True
+    stage:              str  = DEFAULT_STAGE
+    min_temp_c:         float = 20.0
+    max_temp_c:         float = 30.0
+    min_rh:             float = 40.0
+    max_rh:             float = 70.0
+    vpd_target_kpa:       float = 1.00
+    target_temp_c:        float = 25.0
+    target_rh:            float = 55.0
+    night_vpd_target_kpa: float = 1.00
+    night_target_temp_c:  float = 20.0
+    night_target_rh:      float = 55.0
+    temp_ramp_rate_c_per_min: float = 1.0
+    vpd_deadband_kpa:   float = 0.07
+    vpd_chase_enabled:  bool  = True
+    night_mode:         str   = NIGHT_MODE_DEW
+    day_mode:           str   = DAY_MODE_VPD
+    light_on_time:      time  = time(9, 0, 0)
+    light_off_time:     time  = time(21, 0, 0)
+    dewpoint_margin_c:  float = 1.0
+    heater_hold_s:       float = 60.0
+    exhaust_hold_s:      float = 45.0
+    humidifier_hold_s:   float = 45.0
+    dehumidifier_hold_s: float = 45.0
+    exhaust_safety_override:   bool  = False
+    exhaust_safety_max_temp_c: float = 30.0
+    exhaust_safety_max_rh:     float = 75.0
+    heater_max_run_s:          float = 0.0
+    disturbance_temp_delta_c: float = 2.0
+    disturbance_rh_delta:     float = 8.0
+    disturbance_hold_s:       float = 120.0
+    anomaly_max_delta_temp_c: float = 3.0
+    anomaly_max_delta_rh:     float = 10.0
+
+    # ── MPC / model (mpc_a_* … mpc_*_lag come from ModelParams.as_values) ────
+    mpc_horizon_steps:  int   = 3
+    mpc_temp_amb:       float = 20.0
+    mpc_rh_amb:         float = 55.0
+    mpc_a_heater:       float = 0.0
+    mpc_a_exhaust:      float = 0.0
+    mpc_a_passive:      float = 0.0
+    mpc_a_bias:         float = 0.0
+    mpc_a_bias_day:     float = 0.0
+    mpc_b_exhaust:      float = 0.0
+    mpc_b_passive:      float = 0.0
+    mpc_b_bias:         float = 0.0
+    mpc_b_bias_day:     float = 0.0
+    mpc_a_humidifier:   float = 0.0
+    mpc_a_dehumidifier: float = 0.0
+    mpc_b_humidifier:   float = 0.0
+    mpc_b_dehumidifier: float = 0.0
+    mpc_heater_lag:     int   = 0
+    mpc_exhaust_lag:    int   = 0
+    mpc_model_version:  int   = 0
+    mpc_w_vpd:          float = 5.0
+    mpc_w_temp:         float = 2.0
+    mpc_w_rh:           float = 1.0
+    mpc_w_switch:       float = 0.5
+    mpc_r2_temp:         float | None = None
+    mpc_r2_rh:           float | None = None
+    mpc_last_identified: str | None   = None
+    rls_enabled:              bool  = False
+    rls_forgetting_factor:    float = 0.999
+    mpc_auto_identify_weekly: bool  = False
+    mpc_identify_days:        int   = 7
+    mpc_identify_max_lag:     int   = 12
+
+    # ── Target conflict detection ────────────────────────────────────────────
+    target_vpd_implied:  float | None = None
+    target_conflict_pct: float | None = None
+    target_implied_rh:   float | None = None
+
+    # ── Controller status ────────────────────────────────────────────────────
+    control_mode:        str  = "init"
+    last_action:         str  = "none"
+    sensors_unavailable: bool = False
+    disturbance_active:  bool = False
+    actuators_unresponsive: list[str] = field(default_factory=list)
+
+    # ── Debug / diagnostics ──────────────────────────────────────────────────
+    debug_local_time:     str = ""
+    debug_local_tod:      str = ""
+    debug_is_day:         bool = True
+    debug_light_window:   str | None = None
+    debug_light_reason:   Reason | str = "n/a"
+    debug_target_temp_c:  float | None = None
+    debug_target_rh:      float | None = None
+    debug_exhaust_policy: str = "n/a"
+    debug_exhaust_reason: Reason | str = "n/a"
+    debug_heater_reason:  Reason | str = "n/a"
+    debug_heater_target_c: float | None = None
+    debug_heater_error_c:  float | None = None
+    debug_heater_on_for_s:  int   = 0
+    debug_heater_max_run_s: float = 0.0
+    debug_heater_lockout:   str   = "inactive"
+    debug_humidifier_reason:   Reason | None = None
+    debug_dehumidifier_reason: Reason | None = None
+    debug_circulation_reason:  Reason | None = None
+    debug_ramped_target_temp_c: float | None = None
+    debug_mpc_horizon:    int = 0
+    debug_mpc_score:      float | None = None
+    debug_mpc_pred_temp:  float | None = None
+    debug_mpc_pred_rh:    float | None = None
+    debug_mpc_pred_vpd:   float | None = None
+    debug_mpc_plan:       str = "n/a"
+    debug_ambient_source: str = "static_slider"
+    debug_rls_lambda_t:    float | None = None
+    debug_rls_lambda_r:    float | None = None
+    debug_rls_innov_var_t: float | None = None
+    debug_rls_innov_var_r: float | None = None
+    debug_rls_change_stat: float | None = None
+    debug_disturbance_reason:      str = "none"
+    debug_disturbance_remaining_s: int = 0
+    debug_heater_latency_ms:       float | None = None
+    debug_exhaust_latency_ms:      float | None = None
+    debug_humidifier_latency_ms:   float | None = None
+    debug_dehumidifier_latency_ms: float | None = None
+    debug_circulation_latency_ms:  float | None = None
+    debug_light_latency_ms:        float | None = None
+    debug_poll_interval_s: float | None = None
+    debug_cycle_ms:        float | None = None
+
+    # ── Observability ────────────────────────────────────────────────────────
+    vpd_pct_in_band:       float | None = None
+    vpd_pct_in_band_hours: float = 0
+    vpd_out_of_band_s:     int   = 0
+    vpd_polls_total:       int   = 0
+    heater_toggles:        int   = 0
+    exhaust_toggles:       int   = 0
+    humidifier_toggles:    int   = 0
+    dehumidifier_toggles:  int   = 0
+    heater_duty_pct:       float | None = None
+    exhaust_duty_pct:      float | None = None
+    humidifier_duty_pct:   float | None = None
+    dehumidifier_duty_pct: float | None = None
+    light_duty_pct:        float | None = None
+
+    # ── Internal — not published ─────────────────────────────────────────────
+    # Light switch for _apply_decision (light is not an env-control device,
+    # so it is not on _Ctx)
+    light_eid: str | None = None
+
+    # ── Mapping view for the entities ────────────────────────────────────────
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PUBLISHED:
+            raise KeyError(key)
+        value = getattr(self, key)
+        # Decision reasons are rendered only when an entity reads them
+        return str(value) if isinstance(value, Reason) else value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PUBLISHED)
+
+    def __len__(self) -> int:
+        return len(_PUBLISHED)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field whose name is computed; KeyError if it is not one."""
+        if key not in _FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+
+_FIELDS    = frozenset(f.name for f in fields(CycleData))
+_PUBLISHED = frozenset(_FIELDS - {"light_eid"})
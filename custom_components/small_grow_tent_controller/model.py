@@ -0,0 +1,177 @@
+"""
+Versioned, immutable snapshots of the MPC plant model.
+
+The model parameters (mpc_a_* / mpc_b_* / dead times) have several writers —
+RLS, identification, the user via the number entities — and several readers
+in one poll cycle.  Readers take the coordinator's current ModelParams once
+and use only that object, so a write landing mid-cycle (e.g. a background
+identification) cannot mix old and new coefficients.  Writers go through
+the parameter bus; one set()/set_many() batch produces exactly one new
+version.
+
+Anything derived from the model — the MPC rollout table below, RLS banks
+seeded from it — records the version it was built from and is rebuilt when
+the version moves, instead of being recomputed every poll.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Mapping
+
+# Number key → field name: the field is the key without its "mpc_" prefix
+_PREFIX = "mpc_"
+
+
+@dataclass(frozen=True, slots=True)
+class ModelParams:
+    version:         int   = 0
+    a_heater:        float = 0.423
+    a_exhaust:       float = -0.082
+    a_passive:       float = 0.008
+    a_bias:          float = 0.057
+    a_bias_day:      float = 0.180
+    b_exhaust:       float = -1.196
+    b_passive:       float = 0.006
+    b_bias:          float = 0.556
+    b_bias_day:      float = 0.556
+    a_humidifier:    float = 0.0
+    a_dehumidifier:  float = 0.0
+    b_humidifier:    float = 0.0
+    b_dehumidifier:  float = 0.0
+    heater_lag:      int   = 0
+    exhaust_lag:     int   = 0
+
+    def evolve(self, values: Mapping[str, float]) -> ModelParams:
+        """Apply number-keyed values; the next version, or self if nothing changed.
+
+        Keys that are not model parameters are ignored, so the whole batch of
+        a parameter-bus write can be passed in.
+        """
+        changes = {}
+        for key, value in values.items():
+            name = key[len(_PREFIX):] if key.startswith(_PREFIX) else None
+            if name not in _FIELD_TYPES:
+                continue
+            value = _FIELD_TYPES[name](value)
+            if getattr(self, name) != value:
+                changes[name] = value
+        if not changes:
+            return self
+        return replace(self, version=self.version + 1, **changes)
+
+    def as_values(self) -> dict[str, float]:
+        """Number-keyed values, as published to the data dict."""
+        return {f"{_PREFIX}{name}": getattr(self, name) for name in _FIELD_TYPES}
+
+
+_FIELD_TYPES: dict[str, Callable] = {
+    f.name: (int if f.type in ("int", int) else float)
+    for f in fields(ModelParams) if f.name != "version"
+}
+
+
+# ── MPC rollout table ────────────────────────────────────────────────────────
+
+# The rollout is exact on the table path only while no intermediate state
+# would hit the simulator's clamps — the same bounds as _mpc_optimise.sim
+TEMP_BOUNDS = (0.0, 60.0)
+RH_BOUNDS   = (0.1, 99.9)
+
+
+class RolloutTable:
+    """Per-plan input response of the first-order model, for one model version.
+
+    The MPC model is linear between its clamps:
+        T[k+1] = c·T[k] + a_heater·H[k] + a_exhaust·E[k] + a_passive·T_amb + a_bias
+    with c = 1 − a_passive.  The device inputs' contribution to the state
+    after every step depends only on the plan and the model coefficients,
+    not on the current reading, targets, ambient or bias — so it is computed
+    once per (model version, horizon) and each poll only adds the
+    plan-independent part.  Per-step minima / maxima over all plans let the
+    optimiser check up front whether any plan could reach a clamp, in which
+    case it falls back to the step-by-step simulation.
+    """
+
+    __slots__ = (
+        "key", "horizon", "steps", "heater_lag", "exhaust_lag",
+        "a_heater", "a_exhaust", "b_exhaust", "c_t", "c_r",
+        "actions", "d_temp", "d_rh", "t_lo", "t_hi", "r_lo", "r_hi",
+    )
+
+    def __init__(self, model: ModelParams, horizon: int) -> None:
+        self.key         = (model.version, horizon)
+        self.horizon     = horizon
+        self.heater_lag  = model.heater_lag
+        self.exhaust_lag = model.exhaust_lag
+        self.steps = steps = horizon + max(model.heater_lag, model.exhaust_lag)
+        self.a_heater    = model.a_heater
+        self.a_exhaust   = model.a_exhaust
+        self.b_exhaust   = model.b_exhaust
+        self.c_t = c_t   = 1.0 - model.a_passive
+        self.c_r = c_r   = 1.0 - model.b_passive
+
+        inf = float("inf")
+        self.actions = []
+        self.d_temp  = array("d")
+        self.d_rh    = array("d")
+        # Index m − 1 holds the range of the contribution after step m
+        self.t_lo = array("d", [inf]) * steps
+        self.t_hi = array("d", [-inf]) * steps
+        self.r_lo = array("d", [inf]) * steps
+        self.r_hi = array("d", [-inf]) * steps
+        t_lo, t_hi, r_lo, r_hi = self.t_lo, self.t_hi, self.r_lo, self.r_hi
+
+        for combo_idx in range(4 ** horizon):
+            # Same enumeration order as _mpc_optimise — ties resolve identically
+            actions = []
+            idx = combo_idx
+            for _ in range(horizon):
+                bit = idx % 4
+                idx //= 4
+                actions.append((1 if bit >= 2 else 0, 1 if bit % 2 == 1 else 0))
+            self.actions.append(actions)
+
+            t = r = 0.0
+            for k in range(steps):
+                # Planned action k lands lag steps later; the lead-in before
+                # it is handled per poll, the tail holds the last action
+                h = actions[min(k - self.heater_lag, horizon - 1)][0] if k >= self.heater_lag else 0
+                e = actions[min(k - self.exhaust_lag, horizon - 1)][1] if k >= self.exhaust_lag else 0
+                t = c_t * t + model.a_heater * h + model.a_exhaust * e
+                r = c_r * r + model.b_exhaust * e
+                if t < t_lo[k]: t_lo[k] = t
+                if t > t_hi[k]: t_hi[k] = t
+                if r < r_lo[k]: r_lo[k] = r
+                if r > r_hi[k]: r_hi[k] = r
+            self.d_temp.append(t)
+            self.d_rh.append(r)
+
+    def base(
+        self,
+        temp0: float, rh0: float,
+        temp_amb: float, rh_amb: float,
+        a_passive: float, b_passive: float,
+        a_bias: float, b_bias: float,
+        h_lead: list[int], e_lead: list[int],
+    ) -> tuple[float, float] | None:
+        """Plan-independent part of the final state, or None if a clamp could bind.
+
+        h_lead / e_lead are the device states already applied that still
+        drive the first heater_lag / exhaust_lag steps.
+        """
+        c_t, c_r = self.c_t, self.c_r
+        u_t = a_passive * temp_amb + a_bias
+        u_r = b_passive * rh_amb   + b_bias
+        t, r = temp0, rh0
+        t_min, t_max = TEMP_BOUNDS
+        r_min, r_max = RH_BOUNDS
+        for k in range(self.steps):
+            h = h_lead[k] if k < self.heater_lag else 0
+            e = e_lead[k] if k < self.exhaust_lag else 0
+            t = c_t * t + u_t + self.a_heater * h + self.a_exhaust * e
+            r = c_r * r + u_r + self.b_exhaust * e
+            if (t + self.t_lo[k] < t_min or t + self.t_hi[k] > t_max
+                    or r + self.r_lo[k] < r_min or r + self.r_hi[k] > r_max):
+                return None
+        return t, r
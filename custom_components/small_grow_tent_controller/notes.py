@@ -14,6 +14,7 @@ in sensor.py and button.py respectively.  This file provides:
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
@@ -245,6 +246,10 @@ class ToggleCounterStore:
     flushed to .storage asynchronously.  The flush is triggered after every
     toggle so the data is always fresh, but the write is non-blocking so it
     never delays the poll cycle.
+
+    The same file holds the switch commands per device and reason code
+    (ControlState.action_counts, shown on the Last Action sensor).  `actions`
+    is that same dict, so a save always writes the live counts.
     """
 
     _KEYS = ("heater", "exhaust", "humidifier", "dehumidifier")
@@ -258,6 +263,8 @@ class ToggleCounterStore:
         self.exhaust:      int = 0
         self.humidifier:   int = 0
         self.dehumidifier: int = 0
+        # device → {reason code: commands}
+        self.actions: dict[str, dict[str, int]] = {}
 
     async def async_load(self) -> None:
         data = await self._store.async_load()
@@ -266,14 +273,30 @@ class ToggleCounterStore:
             self.exhaust      = int(data.get("exhaust",      0))
             self.humidifier   = int(data.get("humidifier",   0))
             self.dehumidifier = int(data.get("dehumidifier", 0))
-
-    async def async_save(self) -> None:
-        await self._store.async_save({
+            actions = data.get("actions_by_reason")
+            if isinstance(actions, dict):
+                self.actions = {
+                    str(device): {str(code): int(n) for code, n in counts.items()}
+                    for device, counts in actions.items() if isinstance(counts, dict)
+                }
+
+    def _data(self) -> dict:
+        return {
             "heater":       self.heater,
             "exhaust":      self.exhaust,
             "humidifier":   self.humidifier,
             "dehumidifier": self.dehumidifier,
-        })
+            "actions_by_reason": {
+                device: dict(counts) for device, counts in self.actions.items()
+            },
+        }
+
+    async def async_save(self) -> None:
+        await self._store.async_save(self._data())
+
+    def schedule_save(self) -> None:
+        """Queue a write; calls in the same second share it."""
+        self._store.async_delay_save(self._data, 1)
 
     def increment(self, device: str) -> None:
         """Increment one counter in memory.  Caller must schedule async_save."""
@@ -303,6 +326,9 @@ async def async_setup_toggle_counter_store(
     coordinator.control.exhaust_toggles      = store.exhaust
     coordinator.control.humidifier_toggles   = store.humidifier
     coordinator.control.dehumidifier_toggles = store.dehumidifier
+    coordinator.control.action_counts = store.actions = {
+        device: Counter(counts) for device, counts in store.actions.items()
+    }
     return store
 
 
@@ -348,8 +374,9 @@ class VpdBandStore:
         t = int(_time.time())
         return t - (t % 3600)
 
-    def record(self, in_band: bool) -> None:
-        """Record one poll result. Caller schedules async_save."""
+    def record(self, in_band: bool, weight: int = 1) -> None:
+        """Record one poll result, counted weight times (a slow poll covers
+        several 10-second steps). Caller schedules async_save."""
         now_hour_ts = self._hour_ts_now()
 
         # On hour boundary: advance and clear any bucket older than 23 hours
@@ -371,9 +398,9 @@ class VpdBandStore:
             bucket = {"in": 0, "total": 0, "hour_ts": now_hour_ts}
             self.buckets[hour_key] = bucket
 
-        bucket["total"] += 1
+        bucket["total"] += weight
         if in_band:
-            bucket["in"] += 1
+            bucket["in"] += weight
 
     @property
     def pct_24h(self) -> float | None:
@@ -405,3 +432,94 @@ async def async_setup_vpd_band_store(
     await store.async_load()
     coordinator._vpd_band_store = store
     return store
+
+
+# ── RLS estimator persistence ─────────────────────────────────────────────────
+
+_RLS_STORE_VERSION = 1
+# Minimum spacing between writes — the estimator changes every poll, but a
+# few minutes of lost adaptation after a crash is harmless
+_RLS_SAVE_DELAY_S = 300
+
+
+class RlsStateStore:
+    """Persists the RLS estimator banks (θ, U-D covariance factors and innovation
+    variance of every member) across restarts.
+
+    Without this every restart re-initialises the covariance to the prior and
+    the filter relearns with a large gain, which shows up as a burst of
+    parameter jumps.  Writes are coalesced with Store.async_delay_save so at
+    most one happens per _RLS_SAVE_DELAY_S; the state is snapshotted when the
+    write runs, and async_flush writes immediately on unload.
+    """
+
+    # Bank key on ControlState.rls_banks → parameter count
+    _BANKS = {"temp_day": 4, "temp_night": 4, "rh_day": 3, "rh_night": 3}
+    # Pre-bank files held one estimator per model, learnt over day and night
+    _LEGACY = (("temp", 4), ("rh", 3))
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store(hass, _RLS_STORE_VERSION, f"{DOMAIN}.rls_state.{entry_id}")
+        self._save_pending = False
+        self.data: dict = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        self.data = data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _snapshot(control: Any) -> dict:
+        return {"banks": {key: bank.as_dict() for key, bank in control.rls_banks.items()}}
+
+    def restore(self, control: Any) -> None:
+        """Rebuild the estimator banks on ControlState from the loaded data."""
+        from .rls import RLSBank, UDRLS
+        banks = self.data.get("banks")
+        if isinstance(banks, dict):
+            for key, n in self._BANKS.items():
+                if isinstance(banks.get(key), dict):
+                    bank = RLSBank.from_dict(banks[key], n)
+                    if bank is not None:
+                        control.rls_banks[key] = bank
+            return
+        # Legacy single estimators seed both periods' banks; the λ set is
+        # corrected on the first update from the rls_forgetting_factor number
+        for model, n in self._LEGACY:
+            if isinstance(self.data.get(model), dict):
+                est = UDRLS.from_dict(self.data[model], n)
+                if est is not None:
+                    for period in ("day", "night"):
+                        control.rls_banks[f"{model}_{period}"] = RLSBank.seeded(
+                            est, RLSBank.lambda_set(0.999)
+                        )
+
+    def schedule_save(self, control: Any) -> None:
+        """Queue a throttled write.  Calls while one is pending are no-ops."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+
+        def _data() -> dict:
+            self._save_pending = False
+            return self._snapshot(control)
+
+        self._store.async_delay_save(_data, _RLS_SAVE_DELAY_S)
+
+    async def async_flush(self, control: Any) -> None:
+        """Write the current state now, replacing any pending delayed write."""
+        self._save_pending = False
+        await self._store.async_save(self._snapshot(control))
+
+
+async def async_setup_rls_store(
+    hass: HomeAssistant,
+    entry,
+) -> "RlsStateStore":
+    """Create, load, and attach the RlsStateStore, restoring saved estimators."""
+    from .coordinator import GrowTentCoordinator
+    coordinator: GrowTentCoordinator = hass.data[DOMAIN][entry.entry_id]
+    store = RlsStateStore(hass, entry.entry_id)
+    await store.async_load()
+    store.restore(coordinator.control)
+    coordinator._rls_store = store
+    return store
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.storage import Store
 
@@ -64,6 +64,13 @@ NUMBERS = [
     ("mpc_b_exhaust",           "MPC b_exhaust",                -5.0, 5.0,   0.01, -1.196, "%/step"),
     ("mpc_b_passive",           "MPC b_passive",                0.0,  0.5,   0.001, 0.006, "/step"),
     ("mpc_b_bias",              "MPC b_bias",                   -5.0, 5.0,   0.01,  0.556, "%/step"),
+    ("mpc_b_bias_day",          "MPC b_bias (Day)",             -5.0, 5.0,   0.01,  0.556, "%/step"),
+    ("mpc_a_humidifier",        "MPC a_humidifier",             -2.0, 2.0,   0.001, 0.0,   "°C/step"),
+    ("mpc_a_dehumidifier",      "MPC a_dehumidifier",           -2.0, 2.0,   0.001, 0.0,   "°C/step"),
+    ("mpc_b_humidifier",        "MPC b_humidifier",             -5.0, 5.0,   0.01,  0.0,   "%/step"),
+    ("mpc_b_dehumidifier",      "MPC b_dehumidifier",           -5.0, 5.0,   0.01,  0.0,   "%/step"),
+    ("mpc_heater_lag",          "MPC Heater Dead Time",         0,    12,    1,     0,     "polls"),
+    ("mpc_exhaust_lag",         "MPC Exhaust Dead Time",        0,    12,    1,     0,     "polls"),
     ("mpc_w_vpd",               "MPC Weight VPD",               0.0,  10.0,  0.1,  5.0,   ""),
     ("mpc_w_temp",              "MPC Weight Temp",              0.0,  10.0,  0.1,  2.0,   ""),
     ("mpc_w_rh",                "MPC Weight RH",                0.0,  10.0,  0.1,  1.0,   ""),
@@ -71,9 +78,12 @@ NUMBERS = [
     # RLS parameters
     ("rls_forgetting_factor",   "RLS Forgetting Factor",        0.990, 1.000, 0.001, 0.999, ""),
     # MPC model identification
-    ("mpc_identify_days",       "MPC Identification Days",      1,    30,    1,     7,     "days"),
+    ("mpc_identify_days",       "MPC Identification Days",      1,    180,   1,     7,     "days"),
+    ("mpc_identify_max_lag",    "MPC Identification Max Lag",   0,    12,    1,     12,    "polls"),
     # Outdoor weather blend
     ("mpc_weather_blend",       "MPC Weather Blend",            0.0,  1.0,   0.05,  0.9,   ""),
+    # Low-pass time constant of the effective ambient (0 = unfiltered)
+    ("mpc_ambient_filter_min",  "MPC Ambient Filter",           0,    60,    1,     10,    "min"),
 ]
 
 
@@ -127,6 +137,12 @@ async def async_setup_entry(
 
 
 class GrowNumber(NumberEntity):
+    """Number entity backed by the coordinator's ParameterBus.
+
+    The bus holds the value and persists it; the entity displays it and
+    forwards user changes.  Coordinator writes arrive via _handle_bus_value.
+    """
+
     _attr_has_entity_name = True
     _attr_mode = NumberMode.SLIDER
 
@@ -142,35 +158,54 @@ class GrowNumber(NumberEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_device_info                = device_info_for_entry(entry)
         self._value  = default
-        self.store   = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_numbers_{key}")
+        self._bus    = hass.data[DOMAIN][entry.entry_id].params
+        # Per-entity store used before the parameter bus — read once to
+        # migrate the value, never written
+        self._legacy_store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_numbers_{key}")
 
     async def async_added_to_hass(self):
-        saved = await self.store.async_load()
-        if isinstance(saved, dict) and "value" in saved:
-            try:
-                self._value = float(saved["value"])
-            except Exception:
-                pass
-        self.async_write_ha_state()
+        if self.key in self._bus:
+            self._value = self._bus.get(self.key, self._value)
+        else:
+            saved = await self._legacy_store.async_load()
+            if isinstance(saved, dict) and "value" in saved:
+                try:
+                    self._value = float(saved["value"])
+                except Exception:
+                    pass
+        self.async_on_remove(self._bus.subscribe(
+            self.key, self._attr_native_min_value, self._attr_native_max_value,
+            self._handle_bus_value,
+        ))
+        # Seeds the bus with a migrated or default value — the listener writes
+        # state when it changes, otherwise write it here
+        if not self._bus.set(self.key, self._value):
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_bus_value(self, value: float) -> None:
+        self._value = value
+        if self.hass is not None and self.entity_id:
+            self.async_write_ha_state()
 
     @property
     def native_value(self):
         return self._value
 
     async def async_set_native_value(self, value: float):
-        v = max(self._attr_native_min_value, min(self._attr_native_max_value, float(value)))
-        if v == self._value:
-            return   # no-op: value unchanged — skip event + storage write
-        self._value = v
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        # User change — the bus clamps, updates this entity and is a no-op
+        # when the value is unchanged.  Flushed now rather than coalesced so
+        # a manual setting is never lost to a crash.
+        if self._bus.set(self.key, value):
+            await self._bus.async_flush()
 
 
 class VpdTargetNumber(GrowNumber):
     """VPD Target number that auto-resets to the stage default when the stage changes.
 
-    The coordinator calls async_set_to_stage_default() when it detects a stage change.
-    The user can freely override the value at any time.
+    The coordinator resets it (with the other stage targets) through the
+    parameter bus when it detects a stage change.  The user can freely
+    override the value at any time.
     """
 
     def __init__(self, hass, entry, key, name, min_v, max_v, step, default, unit):
@@ -180,9 +215,7 @@ class VpdTargetNumber(GrowNumber):
     async def async_set_to_stage_default(self, stage: str) -> None:
         """Called by the coordinator when stage changes — resets to the stage default."""
         default = STAGE_TARGET_VPD_KPA.get(stage, STAGE_TARGET_VPD_KPA[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
 
 
 class TempTargetNumber(GrowNumber):
@@ -197,9 +230,7 @@ class TempTargetNumber(GrowNumber):
     async def async_set_to_stage_default(self, stage: str) -> None:
         """Called by the coordinator when stage changes — resets to the stage default."""
         default = STAGE_TARGET_TEMP_C.get(stage, STAGE_TARGET_TEMP_C[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
 
 
 class RhTargetNumber(GrowNumber):
@@ -212,9 +243,7 @@ class RhTargetNumber(GrowNumber):
     async def async_set_to_stage_default(self, stage: str) -> None:
         """Called by the coordinator when stage changes — resets to the stage default."""
         default = STAGE_TARGET_RH.get(stage, STAGE_TARGET_RH[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
 
 class NightVpdTargetNumber(GrowNumber):
     """Night VPD Target — auto-resets to stage default on stage change."""
@@ -225,9 +254,7 @@ class NightVpdTargetNumber(GrowNumber):
 
     async def async_set_to_stage_default(self, stage: str) -> None:
         default = STAGE_NIGHT_TARGET_VPD_KPA.get(stage, STAGE_NIGHT_TARGET_VPD_KPA[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
 
 
 class NightTempTargetNumber(GrowNumber):
@@ -241,9 +268,7 @@ class NightTempTargetNumber(GrowNumber):
 
     async def async_set_to_stage_default(self, stage: str) -> None:
         default = STAGE_NIGHT_TARGET_TEMP_C.get(stage, STAGE_NIGHT_TARGET_TEMP_C[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
 
 
 class NightRhTargetNumber(GrowNumber):
@@ -257,6 +282,4 @@ class NightRhTargetNumber(GrowNumber):
 
     async def async_set_to_stage_default(self, stage: str) -> None:
         default = STAGE_NIGHT_TARGET_RH.get(stage, STAGE_NIGHT_TARGET_RH[DEFAULT_STAGE])
-        self._value = default
-        await self.store.async_save({"value": self._value})
-        self.async_write_ha_state()
+        self._bus.set(self.key, default)
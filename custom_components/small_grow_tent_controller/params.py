@@ -0,0 +1,136 @@
+"""
+Parameter bus — the coordinator-owned registry of number entity values.
+
+Storage:  .storage/small_grow_tent_controller.params.<entry_id>
+Schema:   {"values": {"<key>": float, ...}}
+
+The coordinator reads every tunable straight from here and writes adapted
+values (RLS, identification, ambient tracking, stage target resets) with
+set() / set_many() — no number.set_value service dispatch, no per-value
+Store write and no round-trip through hass.states on the next poll.
+
+Number entities subscribe to their key: a coordinator write updates the
+entity's state, and a user change on the entity (service call / UI) is
+pushed into the bus.  Change listeners get each set() / set_many() batch
+once, after all of its values are in place — the coordinator derives its
+versioned model snapshot from them.  All values share one store file whose writes are
+coalesced, so a burst of updates costs one save.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_STORAGE_VERSION = 1
+# Coalescing window for the shared store — coordinator writes arrive every
+# poll (ambient) or every minute (RLS); one save per window is plenty
+_SAVE_DELAY_S = 30
+
+
+class ParameterBus:
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store(hass, _STORAGE_VERSION, f"{DOMAIN}.params.{entry_id}")
+        self._values: dict[str, float] = {}
+        self._limits: dict[str, tuple[float, float]] = {}
+        self._listeners: dict[str, Callable[[float], None]] = {}
+        self._change_listeners: list[Callable[[dict[str, float]], None]] = []
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        if isinstance(data, dict) and isinstance(data.get("values"), dict):
+            for key, val in data["values"].items():
+                try:
+                    self._values[key] = float(val)
+                except (TypeError, ValueError):
+                    pass
+        self._notify(dict(self._values))
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def get(self, key: str, default: float) -> float:
+        return self._values.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+
+    def set(self, key: str, value: float) -> bool:
+        """Set one value, notify its entity and queue a save.
+
+        Values are clamped to the subscribed entity's range.  Returns False
+        (and does nothing) when the value is unchanged.
+        """
+        if not self._set(key, value):
+            return False
+        self._notify({key: self._values[key]})
+        return True
+
+    def set_many(self, values: dict[str, float]) -> None:
+        """Set several values — one change notification and one coalesced save."""
+        changed = {key: self._values[key] for key, value in values.items() if self._set(key, value)}
+        if changed:
+            self._notify(changed)
+
+    def _set(self, key: str, value: float) -> bool:
+        value = float(value)
+        if key in self._limits:
+            lo, hi = self._limits[key]
+            value = max(lo, min(hi, value))
+        if self._values.get(key) == value:
+            return False
+        self._values[key] = value
+        listener = self._listeners.get(key)
+        if listener is not None:
+            listener(value)
+        self._schedule_save()
+        return True
+
+    # ── Entity subscription ─────────────────────────────────────────────────
+
+    def subscribe(
+        self,
+        key: str,
+        min_v: float,
+        max_v: float,
+        listener: Callable[[float], None],
+    ) -> Callable[[], None]:
+        """Register the entity that displays key.  Returns an unsubscribe callable."""
+        self._limits[key]    = (min_v, max_v)
+        self._listeners[key] = listener
+
+        def _unsubscribe() -> None:
+            if self._listeners.get(key) is listener:
+                self._listeners.pop(key, None)
+
+        return _unsubscribe
+
+    def add_change_listener(self, listener: Callable[[dict[str, float]], None]) -> Callable[[], None]:
+        """Call listener with {key: value} of every changed batch (and on load)."""
+        self._change_listeners.append(listener)
+        return lambda: self._change_listeners.remove(listener)
+
+    def _notify(self, changed: dict[str, float]) -> None:
+        for listener in self._change_listeners:
+            listener(changed)
+
+    # ── Persistence ─────────────────────────────────────────────────────────
+
+    def _schedule_save(self) -> None:
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._snapshot, _SAVE_DELAY_S)
+
+    def _snapshot(self) -> dict[str, Any]:
+        self._save_pending = False
+        return {"values": dict(self._values)}
+
+    async def async_flush(self) -> None:
+        """Write now, replacing any pending delayed save."""
+        await self._store.async_save(self._snapshot())
@@ -0,0 +1,176 @@
+"""
+Decision reasons — a code plus its parameters, rendered to text on demand.
+
+Every _decide_* helper used to build its reason with an f-string, e.g.
+f"mpc: plan={best_actions[:2]} score={best_score:.3f}", on every device and
+every cycle, although the text is only read by an enabled debug sensor, the
+last-action entry or a debug log line.  The free text also could not be
+aggregated: answering "how often did the dew floor fire this week" meant
+parsing log lines.
+
+A Reason is a Code and the values its template needs.  Building one is a
+tuple; str() formats the template each time something asks for it.  Each
+decision branch has its own code, so counting codes tells the branches apart;
+parameters only carry values (a device action, a plan, a temperature).
+Tags are the bracketed qualifiers appended by later logic (a safety hold,
+the exhaust fallback, the night exhaust profile).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+
+class Code(StrEnum):
+    AUTO                 = "auto"
+    OVERRIDE             = "override"
+    OVERRIDE_DISABLED    = "override_disabled"
+    OVERRIDE_DAY_ON      = "override_day_on"
+    OVERRIDE_NIGHT_ON    = "override_night_on"
+    DAY_ON_NIGHT_WINDOW  = "day_on_night_window"
+    NIGHT_ON_DAY_WINDOW  = "night_on_day_window"
+    HEATER_MAX_RUN       = "heater_max_run"
+    # Safety trips outside the decisions (cycle and watchdog)
+    HEATER_LOCKOUT       = "heater_lockout"
+    SENSOR_DROPOUT       = "sensor_dropout"
+    EXHAUST_SAFETY       = "exhaust_safety"
+    DRYING_NEUTRAL       = "drying_neutral"
+    DISTURBANCE_NEUTRAL  = "disturbance_neutral"
+    HARD_LIMIT_TEMP_LOW  = "hard_limit_temp_below_min"
+    HARD_LIMIT_TEMP_HIGH = "hard_limit_temp_above_max"
+    HARD_LIMIT_RH_HIGH   = "hard_limit_rh_above_max"
+    HARD_LIMIT_RH_LOW    = "hard_limit_rh_below_min"
+    # Night dew-point protection
+    NIGHT_FORCE_OFF      = "night_force_off"
+    NIGHT_RH_ABOVE_MAX   = "night_rh_above_max"
+    NIGHT_RH_OK          = "night_rh_ok"
+    NIGHT_PROFILE_ON     = "night_profile_on"
+    NIGHT_AUTO_EXHAUST   = "night_auto_exhaust"
+    NIGHT_AT_DEW_TARGET  = "night_at_dew_target"
+    NIGHT_COOLDOWN       = "night_cooldown"
+    NIGHT_PULSE_PLAN     = "night_pulse_plan"
+    NIGHT_PULSE_END      = "night_pulse_end"
+    DEW_FLOOR            = "dew_floor"
+    # MPC
+    MPC_PLAN             = "mpc_plan"
+    MPC_PLAN_SCORED      = "mpc_plan_scored"
+    RH_BELOW_TARGET      = "rh_below_target"
+    RH_ABOVE_TARGET      = "rh_above_target"
+    RH_IN_BAND           = "rh_in_band"
+    # VPD chase — one code per branch, the action is the parameter
+    VPD_LOW_TEMP_LOW     = "vpd_low_temp_low"
+    VPD_LOW_TEMP_HIGH    = "vpd_low_temp_high"
+    VPD_LOW_TEMP_OK      = "vpd_low_temp_ok"
+    VPD_HIGH_TEMP_HIGH   = "vpd_high_temp_high"
+    VPD_HIGH_TEMP_LOW    = "vpd_high_temp_low"
+    VPD_HIGH_TEMP_OK     = "vpd_high_temp_ok"
+    VPD_IN_BAND          = "vpd_in_band"
+    VPD_IN_BAND_RH_LOW   = "vpd_in_band_rh_low"
+    VPD_IN_BAND_RH_HIGH  = "vpd_in_band_rh_high"
+    VPD_IN_BAND_RH_OK    = "vpd_in_band_rh_ok"
+    # Light and circulation
+    LIGHT_DRYING_OFF     = "light_drying_off"
+    LIGHT_STARTUP        = "light_startup"
+    LIGHT_NIGHT_WINDOW   = "light_night_window"
+    LIGHT_DAY_WINDOW     = "light_day_window"
+    LIGHT_SCHEDULE_OK    = "light_schedule_ok"
+    LIGHT_NOT_CONFIGURED = "light_not_configured"
+    LIGHT_STATE_UNKNOWN  = "light_state_unknown"
+    LIGHT_SCHEDULE       = "light_schedule"
+    CIRC_AUTO            = "circ_auto"
+    CIRC_DRYING_OFF      = "circ_drying_off"
+    CIRC_AUTO_ON         = "circ_auto_on"
+
+
+class Tag(StrEnum):
+    SAFETY_BLOCKED_OFF = "safety_blocked_off"
+    SAFETY_FORCED_ON   = "safety_forced_on"
+    FALLBACK_EXHAUST   = "fallback_exhaust"
+    NIGHT_PROFILE_ON   = "night_profile_on"
+    DEW_FLOOR_ONLY     = "dew_floor_only"
+
+
+# str.format templates, filled positionally from Reason.params
+_TEMPLATES: dict[Code, str] = {
+    Code.AUTO:                 "auto",
+    Code.OVERRIDE:             "override:{0}",
+    Code.OVERRIDE_DISABLED:    "override:{0} (disabled)",
+    Code.OVERRIDE_DAY_ON:      "override:day_on (day window)",
+    Code.OVERRIDE_NIGHT_ON:    "override:night_on (night window)",
+    Code.DAY_ON_NIGHT_WINDOW:  "day_on: night window -> auto",
+    Code.NIGHT_ON_DAY_WINDOW:  "night_on: day window -> auto",
+    Code.HEATER_MAX_RUN:       "max_run_time_exceeded -> forced_off",
+    Code.HEATER_LOCKOUT:       "safety lockout active -> forced_off",
+    Code.SENSOR_DROPOUT:       "sensors unavailable -> forced_off",
+    Code.EXHAUST_SAFETY:       "safety threshold exceeded -> forced_on",
+    Code.DRYING_NEUTRAL:       "drying: in-band -> neutral",
+    Code.DISTURBANCE_NEUTRAL:  "disturbance: neutral",
+    Code.HARD_LIMIT_TEMP_LOW:  "hard_limit: temp_below_min -> {0}",
+    Code.HARD_LIMIT_TEMP_HIGH: "hard_limit: temp_above_max -> {0}",
+    Code.HARD_LIMIT_RH_HIGH:   "hard_limit: rh_above_max -> {0}",
+    Code.HARD_LIMIT_RH_LOW:    "hard_limit: rh_below_min -> {0}",
+    Code.NIGHT_FORCE_OFF:      "night: force_off",
+    Code.NIGHT_RH_ABOVE_MAX:   "night: rh_above_max -> on",
+    Code.NIGHT_RH_OK:          "night: rh_ok -> off",
+    Code.NIGHT_PROFILE_ON:     "night: profile=on",
+    Code.NIGHT_AUTO_EXHAUST:   "night: auto want_exhaust={0}",
+    Code.NIGHT_AT_DEW_TARGET:  "night: at/above dew target -> off",
+    Code.NIGHT_COOLDOWN:       "night: cooldown",
+    Code.NIGHT_PULSE_PLAN:     "night: pulse plan on={0}s off={1}s",
+    Code.NIGHT_PULSE_END:      "night: pulse end -> cooldown {0}s",
+    Code.DEW_FLOOR:            "{0}: dew floor override (avg={1:.1f}°C <= floor={2:.1f}°C)",
+    Code.MPC_PLAN:             "{0}: plan={1}",
+    Code.MPC_PLAN_SCORED:      "{0}: plan={1} score={2:.3f}",
+    Code.RH_BELOW_TARGET:      "{0}: rh below target",
+    Code.RH_ABOVE_TARGET:      "{0}: rh above target",
+    Code.RH_IN_BAND:           "{0}: rh in band",
+    Code.VPD_LOW_TEMP_LOW:     "vpd_low: temp below target -> {0}",
+    Code.VPD_LOW_TEMP_HIGH:    "vpd_low: temp above target -> {0}",
+    Code.VPD_LOW_TEMP_OK:      "vpd_low: temp ok -> {0}",
+    Code.VPD_HIGH_TEMP_HIGH:   "vpd_high: temp above target -> {0}",
+    Code.VPD_HIGH_TEMP_LOW:    "vpd_high: temp below target -> {0}",
+    Code.VPD_HIGH_TEMP_OK:     "vpd_high: temp ok -> {0}",
+    Code.VPD_IN_BAND:          "vpd_inband -> {0}",
+    Code.VPD_IN_BAND_RH_LOW:   "vpd_inband: rh below target -> {0}",
+    Code.VPD_IN_BAND_RH_HIGH:  "vpd_inband: rh above target -> {0}",
+    Code.VPD_IN_BAND_RH_OK:    "vpd_inband: rh ok -> {0}",
+    Code.LIGHT_DRYING_OFF:     "drying -> force_off",
+    Code.LIGHT_STARTUP:        "startup_suppressed -> waiting_for_schedule",
+    Code.LIGHT_NIGHT_WINDOW:   "schedule_night_window -> turn_off",
+    Code.LIGHT_DAY_WINDOW:     "schedule_day_window -> turn_on",
+    Code.LIGHT_SCHEDULE_OK:    "schedule_ok -> no_change",
+    Code.LIGHT_NOT_CONFIGURED: "light_entity_not_configured",
+    Code.LIGHT_STATE_UNKNOWN:  "light_state_unknown",
+    Code.LIGHT_SCHEDULE:       "schedule",
+    Code.CIRC_AUTO:            "auto: {0}",
+    Code.CIRC_DRYING_OFF:      "auto:off (drying)",
+    Code.CIRC_AUTO_ON:         "auto:on (day/night)",
+}
+
+_TAG_TEXT: dict[Tag, str] = {
+    Tag.SAFETY_BLOCKED_OFF: "SAFETY: blocked_off",
+    Tag.SAFETY_FORCED_ON:   "SAFETY: forced_on",
+    Tag.FALLBACK_EXHAUST:   "fallback: exhaust",
+    Tag.NIGHT_PROFILE_ON:   "night profile: force_on",
+    Tag.DEW_FLOOR_ONLY:     "VPD Chase (No Heater): dew floor only",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Reason:
+    code:   Code
+    params: tuple[Any, ...] = ()
+    tags:   tuple[Tag, ...] = ()
+
+    def tagged(self, tag: Tag) -> Reason:
+        return Reason(self.code, self.params, self.tags + (tag,))
+
+    def __str__(self) -> str:
+        text = _TEMPLATES[self.code].format(*self.params)
+        for tag in self.tags:
+            text += f" [{_TAG_TEXT[tag]}]"
+        return text
+
+
+AUTO = Reason(Code.AUTO)
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import math
+from array import array
+from operator import mul
+
+# Covariance trace above which the estimator is considered wound up and its
+# covariance is reset.  With unit initial variance a healthy estimator stays
+# well below this; it is only reached when the regressors stop exciting some
+# direction and forgetting inflates it by 1/λ every poll.
+COV_TRACE_MAX = 1.0e3
+
+
+class UDRLS:
+    """Forgetting-factor recursive least squares in U-D factored form.
+
+    The covariance is kept as P = U·D·Uᵀ (U unit upper triangular, D diagonal)
+    and updated with Bierman's algorithm, so P stays symmetric positive
+    definite by construction instead of drifting through round-off as the
+    plain P − kφᵀP form does over months at λ close to 1.
+
+    All buffers are preallocated array('d') of fixed size n, so an update is
+    O(n²) with no allocation.  Pure Python, no numpy.
+    """
+
+    __slots__ = ("n", "init_var", "theta", "U", "D", "_f", "_g", "_b", "resets")
+
+    def __init__(self, theta: list[float], init_var: float = 1.0) -> None:
+        n = len(theta)
+        self.n        = n
+        self.init_var = init_var
+        self.theta    = array("d", theta)
+        self.U        = array("d", [0.0]) * (n * n)   # row-major, unit diagonal
+        self.D        = array("d", [0.0]) * n
+        self._f       = array("d", [0.0]) * n
+        self._g       = array("d", [0.0]) * n
+        self._b       = array("d", [0.0]) * n
+        self.resets   = 0
+        self.reset_covariance()
+
+    def reset_covariance(self) -> None:
+        """Restore P = init_var·I, keeping the current parameter estimate."""
+        n = self.n
+        for i in range(n * n):
+            self.U[i] = 0.0
+        for i in range(n):
+            self.U[i * n + i] = 1.0
+            self.D[i] = self.init_var
+
+    def predict(self, phi: list[float]) -> float:
+        """Model output φᵀθ."""
+        return sum(map(mul, phi, self.theta))
+
+    def trace(self) -> float:
+        """trace(P) = Σ_j D_j · Σ_{i≤j} U_ij²."""
+        n, U, D = self.n, self.U, self.D
+        return sum(D[j] * sum(U[i * n + j] ** 2 for i in range(j + 1)) for j in range(n))
+
+    def update(self, phi: list[float], y_obs: float, lam: float) -> tuple[float, bool]:
+        """One Bierman measurement update with forgetting factor lam.
+
+        Returns (innovation, reset) — innovation is y_obs − φᵀθ before the
+        update, reset is True when the blow-up guard restored the covariance
+        (the parameter step is then skipped for this observation).
+        """
+        n, U, D, f, g, b, theta = self.n, self.U, self.D, self._f, self._g, self._b, self.theta
+        innov = y_obs - self.predict(phi)
+
+        # f = Uᵀφ,  g = D·f
+        for j in range(n):
+            acc = phi[j]
+            for i in range(j):
+                acc += U[i * n + j] * phi[i]
+            f[j] = acc
+            g[j] = D[j] * acc
+
+        alpha = lam
+        for j in range(n):
+            alpha_prev = alpha
+            alpha = alpha_prev + f[j] * g[j]
+            D[j] *= alpha_prev / (alpha * lam)
+            b[j] = g[j]
+            mu = -f[j] / alpha_prev
+            for i in range(j):
+                idx = i * n + j
+                u_ij = U[idx]
+                U[idx] = u_ij + b[i] * mu
+                b[i] += u_ij * g[j]
+
+        # Blow-up guard: a non-positive or non-finite pivot, or a covariance
+        # that has wound up past COV_TRACE_MAX, means the factorisation can no
+        # longer be trusted — restart it from the prior and skip this step.
+        trace = self.trace()
+        if not (math.isfinite(trace) and trace < COV_TRACE_MAX and min(D) > 0.0 and math.isfinite(alpha)):
+            self.reset_covariance()
+            self.resets += 1
+            return innov, True
+
+        # Kalman gain K = b / alpha
+        scale = innov / alpha
+        for i in range(n):
+            theta[i] += b[i] * scale
+        return innov, False
+
+    def as_dict(self) -> dict:
+        """Compact JSON-able state — θ, D and the strict upper triangle of U."""
+        n, U = self.n, self.U
+        return {
+            "theta": list(self.theta),
+            "d":     list(self.D),
+            "u":     [U[i * n + j] for i in range(n) for j in range(i + 1, n)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, n: int, init_var: float = 1.0) -> UDRLS | None:
+        """Rebuild an estimator saved by as_dict.  None if it does not fit n."""
+        try:
+            theta = [float(v) for v in data["theta"]]
+            d     = [float(v) for v in data["d"]]
+            u     = [float(v) for v in data["u"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if len(theta) != n or len(d) != n or len(u) != n * (n - 1) // 2:
+            return None
+        if not all(math.isfinite(v) for v in theta + d + u) or min(d) <= 0.0:
+            return None
+        est = cls(theta, init_var)
+        est.D[:] = array("d", d)
+        it = iter(u)
+        for i in range(n):
+            for j in range(i + 1, n):
+                est.U[i * n + j] = next(it)
+        return est
+
+
+
+# Forgetting factors run alongside the user-selected one: a fast bank member
+# that follows a seasonal drift or a changed setup within hours, and a slow
+# one that averages over days while the tent is steady.
+BANK_LAMBDAS = (0.995, 0.9999)
+# Smoothing of the innovation variance the bank ranks its members by —
+# 1/360 is an effective window of about an hour at the 10 s poll.
+INNOV_VAR_BETA = 1.0 / 360.0
+
+
+class RLSBank:
+    """Several UDRLS estimators of one model that differ only in λ.
+
+    Every member sees the same regressor and observation, so one update()
+    call advances the whole bank and each extra member costs one O(n²)
+    Bierman step.  Each member keeps an exponentially weighted variance of
+    its pre-update innovation (its one-step prediction error); best() is the
+    member with the lowest.  A member that has not scored yet (variance inf)
+    never beats one that has, and ties go to the lower index — the user's λ.
+    """
+
+    __slots__ = ("lambdas", "members", "innov_var", "innov")
+
+    def __init__(self, theta: list[float], lambdas: tuple[float, ...], init_var: float = 1.0) -> None:
+        self.lambdas   = array("d", lambdas)
+        self.members   = [UDRLS(theta, init_var) for _ in lambdas]
+        self.innov_var = array("d", [math.inf]) * len(lambdas)
+        self.innov     = array("d", [0.0]) * len(lambdas)
+
+    @staticmethod
+    def lambda_set(user_lam: float) -> tuple[float, ...]:
+        """The user's λ first, then BANK_LAMBDAS, without duplicates."""
+        return tuple(dict.fromkeys((round(user_lam, 6),) + BANK_LAMBDAS))
+
+    def retune(self, lambdas: tuple[float, ...]) -> None:
+        """Switch to a new λ set, keeping every member whose λ is still in it.
+
+        Added members start from the current best estimate with the prior
+        covariance and no score.
+        """
+        if tuple(self.lambdas) == lambdas:
+            return
+        old = {lam: i for i, lam in enumerate(self.lambdas)}
+        seed = list(self.members[self.best()].theta)
+        init_var = self.members[0].init_var
+        members, var = [], []
+        for lam in lambdas:
+            i = old.get(lam)
+            members.append(self.members[i] if i is not None else UDRLS(seed, init_var))
+            var.append(self.innov_var[i] if i is not None else math.inf)
+        self.lambdas   = array("d", lambdas)
+        self.members   = members
+        self.innov_var = array("d", var)
+        self.innov     = array("d", [0.0]) * len(lambdas)
+
+    def update(self, phi: list[float], y_obs: float) -> bool:
+        """Advance every member by one observation.  True if any member reset."""
+        var, innovs = self.innov_var, self.innov
+        any_reset = False
+        for i, est in enumerate(self.members):
+            innov, reset = est.update(phi, y_obs, self.lambdas[i])
+            any_reset |= reset
+            innovs[i] = innov
+            sq = innov * innov
+            var[i] = sq if var[i] == math.inf else var[i] + INNOV_VAR_BETA * (sq - var[i])
+        return any_reset
+
+    def best(self) -> int:
+        """Index of the member with the lowest recent innovation variance."""
+        var = self.innov_var
+        best = 0
+        for i in range(1, len(var)):
+            if var[i] < var[best]:
+                best = i
+        return best
+
+    def clamp(self, bounds: tuple[tuple[float, float], ...]) -> None:
+        """Clamp every member's θ to the per-parameter (lo, hi) bounds."""
+        for est in self.members:
+            theta = est.theta
+            for i, (lo, hi) in enumerate(bounds):
+                theta[i] = max(lo, min(hi, theta[i]))
+
+    def as_dict(self) -> dict:
+        return {
+            "lambdas":   list(self.lambdas),
+            "innov_var": [v if math.isfinite(v) else None for v in self.innov_var],
+            "members":   [est.as_dict() for est in self.members],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, n: int, init_var: float = 1.0) -> RLSBank | None:
+        """Rebuild a bank saved by as_dict.  None if any member does not fit n."""
+        try:
+            lambdas = tuple(float(v) for v in data["lambdas"])
+            var     = [math.inf if v is None else float(v) for v in data["innov_var"]]
+            members = [UDRLS.from_dict(m, n, init_var) for m in data["members"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not lambdas or len(var) != len(lambdas) or len(members) != len(lambdas) or None in members:
+            return None
+        bank = cls.__new__(cls)
+        bank.lambdas   = array("d", lambdas)
+        bank.members   = members
+        bank.innov_var = array("d", var)
+        bank.innov     = array("d", [0.0]) * len(lambdas)
+        return bank
+
+    @classmethod
+    def seeded(cls, est: UDRLS, lambdas: tuple[float, ...]) -> RLSBank:
+        """A bank whose members all start as copies of est (θ and covariance)."""
+        bank = cls(list(est.theta), lambdas, est.init_var)
+        for member in bank.members:
+            member.D[:] = est.D
+            member.U[:] = est.U
+        return bank
+
+
+class InnovationCusum:
+    """Two-sided CUSUM on standardised RLS innovations — flags a plant change.
+
+    The innovation is divided by a slow (≈ one day) RMS baseline and clipped
+    to ±Z_CLIP, so a single sensor spike cannot trip the test on its own; an
+    alarm needs a run of consistently biased one-step predictions, which is
+    what a new heater, a moved tent or a season change produces before RLS
+    has caught up.  O(1) per sample, no history kept.
+    """
+
+    # Baseline smoothing — ~8640 polls, one day at the 10 s poll
+    BASE_BETA = 1.0 / 8640.0
+    # Samples before the baseline is trusted enough to alarm (~1 h)
+    WARMUP    = 360
+    # Allowance k and decision threshold h in baseline standard deviations.
+    # k=1 ignores shifts under 2σ; h=20 with |z| ≤ 5 needs at least five
+    # consecutive clipped samples, and for Gaussian innovations the
+    # in-control run length is far beyond the life of the installation.
+    K         = 1.0
+    H         = 20.0
+    Z_CLIP    = 5.0
+
+    __slots__ = ("base_var", "n", "g_pos", "g_neg")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.base_var = 0.0
+        self.n        = 0
+        self.g_pos    = 0.0
+        self.g_neg    = 0.0
+
+    def update(self, innov: float) -> bool:
+        """Feed one innovation.  True when the CUSUM crosses H (then re-arms)."""
+        sq = innov * innov
+        self.n += 1
+        base = self.base_var
+        if self.n <= self.WARMUP:
+            # Warm-up: a plain running mean settles the baseline quickly
+            self.base_var = base + (sq - base) / self.n
+            return False
+        self.base_var = base + self.BASE_BETA * (sq - base)
+        if base <= 0.0:
+            return False
+        z = max(-self.Z_CLIP, min(self.Z_CLIP, innov / math.sqrt(base)))
+        self.g_pos = max(0.0, self.g_pos + z - self.K)
+        self.g_neg = max(0.0, self.g_neg - z - self.K)
+        if self.g_pos > self.H or self.g_neg > self.H:
+            self.g_pos = self.g_neg = 0.0
+            return True
+        return False
+
+    @property
+    def statistic(self) -> float:
+        return max(self.g_pos, self.g_neg)
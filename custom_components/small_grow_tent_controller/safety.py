@@ -0,0 +1,263 @@
+"""
+Safety watchdog — the protective rules, evaluated outside the control cycle.
+
+The control cycle enforces heater max-run, the sensor-dropout heater shutoff
+and the exhaust safety thresholds too, but only after the light, override
+and circulation decisions, and only when the cycle gets to run: a poll queued
+behind an MPC executor job or an identification waits, and so does its
+safety response.  The watchdog reacts to the events themselves:
+
+  * heater max-run — a timer armed for heater_on_since + heater_max_run_s
+    whenever the heater is seen on, cancelled when it reports off (not when
+    the plug drops off the network, which it often does with the relay
+    closed);
+  * sensor dropout — every temperature / RH report is checked, and the heater
+    is switched off as soon as all sensors of either kind are invalid;
+  * exhaust safety — the same reports are averaged and the exhaust forced on
+    when the safety override is enabled and a threshold is exceeded.
+
+It applies the same rules with the same bookkeeping as the cycle (lockout,
+on-time, action log), so whichever of the two sees a condition first trips
+it and the other finds it already handled.  Trips request a refresh so the
+entities catch up at once.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.util import dt as dt_util
+
+from .climate_math import avg, safe_float
+from .const import (
+    CONF_EXHAUST_SAFETY_MAX_RH,
+    CONF_EXHAUST_SAFETY_MAX_TEMP_C,
+    CONF_EXHAUST_SWITCH,
+    CONF_HEATER_SWITCH,
+    CONF_USE_EXHAUST,
+    CONF_USE_HEATER,
+)
+from .reasons import Code, Reason
+
+if TYPE_CHECKING:
+    from .coordinator import GrowTentCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SafetyWatchdog:
+    def __init__(self, coordinator: GrowTentCoordinator) -> None:
+        self._coordinator = coordinator
+        self._hass        = coordinator.hass
+        self._heater_eid  = coordinator._get_option(CONF_HEATER_SWITCH) if coordinator._use(CONF_USE_HEATER) else None
+        self._exhaust_eid = coordinator._get_option(CONF_EXHAUST_SWITCH) if coordinator._use(CONF_USE_EXHAUST) else None
+        self._temp_eids, self._rh_eids = coordinator._sensor_eids()
+        self._max_run_cancel: CALLBACK_TYPE | None = None
+        self._max_run_deadline: datetime | None = None
+        # Trips in flight — a burst of sensor reports must not queue several
+        self._pending: set[str] = set()
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to the heater and sensor entities; stops with the entry."""
+        entry = self._coordinator.entry
+        if self._heater_eid:
+            entry.async_on_unload(
+                async_track_state_change_event(self._hass, [self._heater_eid], self._handle_heater_event)
+            )
+        sensors = self._temp_eids + self._rh_eids
+        if sensors:
+            entry.async_on_unload(
+                async_track_state_change_event(self._hass, sensors, self._handle_sensor_event)
+            )
+        entry.async_on_unload(self._cancel_max_run)
+        self.async_arm_heater()
+
+    # ── Heater max-run ───────────────────────────────────────────────────────
+
+    @callback
+    def async_arm_heater(self) -> None:
+        """(Re)arm the max-run timer from the heater's current state.
+
+        Called on every heater state change and at the end of each control
+        cycle, which is where heater_on_since and heater_max_run_s move.
+        """
+        deadline = self._heater_deadline()
+        if deadline == self._max_run_deadline:
+            return
+        self._cancel_max_run()
+        if deadline is None:
+            return
+        self._max_run_deadline = deadline
+        delay = max(0.0, (deadline - dt_util.now()).total_seconds())
+        self._max_run_cancel = async_call_later(self._hass, delay, self._handle_max_run_timer)
+
+    def _heater_deadline(self) -> datetime | None:
+        coord = self._coordinator
+        ctrl  = coord.control
+        max_run_s = float(coord.params.get("heater_max_run_s", 0.0) or 0.0)
+        if (
+            max_run_s <= 0
+            or self._heater_off()
+            or ctrl.heater_on_since is None
+            or not coord.settings.controller
+            # A manual On override is exempt, as in the control cycle
+            or coord.settings.heater_mode != "Auto"
+        ):
+            return None
+        return ctrl.heater_on_since + timedelta(seconds=max_run_s)
+
+    @callback
+    def _cancel_max_run(self) -> None:
+        if self._max_run_cancel is not None:
+            self._max_run_cancel()
+        self._max_run_cancel   = None
+        self._max_run_deadline = None
+
+    @callback
+    def _handle_heater_event(self, event: Event) -> None:
+        # Same on-time bookkeeping as the cycle, but from the device's own
+        # reports — an off/on between two cycles restarts the count, an
+        # unavailable/unknown spell does not
+        ctrl = self._coordinator.control
+        new  = event.data.get("new_state")
+        if new is not None and new.state == "on":
+            if ctrl.heater_on_since is None:
+                ctrl.heater_on_since = dt_util.now()
+        elif new is None or new.state == "off":
+            ctrl.heater_on_since = None
+        self.async_arm_heater()
+
+    @callback
+    def _handle_max_run_timer(self, _now: datetime) -> None:
+        self._max_run_cancel   = None
+        self._max_run_deadline = None
+        deadline = self._heater_deadline()
+        if deadline is None:
+            return
+        if deadline > dt_util.now():
+            # heater_max_run_s was raised since arming
+            self.async_arm_heater()
+            return
+        coord = self._coordinator
+        hold  = float(coord.params.get("heater_hold_s", 60.0))
+        coord.control.heater_max_lockout_until = dt_util.now() + timedelta(seconds=hold)
+        self._trip(
+            self._heater_eid, False,
+            "Heater OFF · SAFETY TRIP max run time exceeded (watchdog)",
+            Reason(Code.HEATER_MAX_RUN),
+        )
+
+    # ── Sensor dropout / exhaust safety ─────────────────────────────────────
+
+    @callback
+    def _handle_sensor_event(self, event: Event) -> None:
+        coord = self._coordinator
+        if not coord.settings.controller:
+            return
+        ctrl  = coord.control
+        now   = dt_util.now()
+        avg_t = avg(self._readings(
+            self._temp_eids, ctrl.last_good_temp, ctrl.last_good_at_temp,
+            coord.params.get("anomaly_max_delta_temp_c", 3.0), now,
+        ))
+        avg_r = avg(self._readings(
+            self._rh_eids, ctrl.last_good_rh, ctrl.last_good_at_rh,
+            coord.params.get("anomaly_max_delta_rh", 10.0), now,
+        ))
+
+        if avg_t is None or avg_r is None:
+            if self._heater_on():
+                self._trip(
+                    self._heater_eid, False,
+                    "Heater OFF · sensors unavailable safety shutoff (watchdog)",
+                    Reason(Code.SENSOR_DROPOUT),
+                )
+            return
+
+        if (
+            self._exhaust_eid
+            and coord.settings.exhaust_safety_override
+            and self._is_on(self._exhaust_eid) is False
+            and (
+                avg_t >= coord.params.get(CONF_EXHAUST_SAFETY_MAX_TEMP_C, 30.0)
+                or avg_r >= coord.params.get(CONF_EXHAUST_SAFETY_MAX_RH, 75.0)
+            )
+        ):
+            self._trip(
+                self._exhaust_eid, True,
+                f"Exhaust ON · SAFETY threshold exceeded ({avg_t:.1f}°C {avg_r:.1f}%, watchdog)",
+                Reason(Code.EXHAUST_SAFETY),
+            )
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+
+    def _readings(
+        self, entity_ids: list[str], last_good: dict, last_good_at: dict,
+        max_delta: float, now: datetime,
+    ) -> list[float | None]:
+        """Current readings, a spike replaced by the cycle's last good value.
+
+        A lighter version of the cycle's anomaly filter — it only reads the
+        filter's state, so one bad report cannot force the exhaust on.  The
+        allowed jump scales with the time since the last good value, as in
+        the cycle, so a real change after a slow poll is not held back.
+        """
+        coord  = self._coordinator
+        values = []
+        for i, eid in enumerate(entity_ids):
+            st  = self._hass.states.get(eid)
+            val = None if st is None else safe_float(st.state)
+            prev = last_good.get(i)
+            if val is not None and prev is not None:
+                _, allowed = coord._spike_allowance(max_delta, last_good_at.get(i), now)
+                if abs(val - prev) > allowed:
+                    val = prev
+            values.append(val)
+        return values
+
+    def _is_on(self, entity_id: str | None) -> bool | None:
+        st = self._hass.states.get(entity_id) if entity_id else None
+        return None if st is None else st.state == "on"
+
+    def _heater_on(self) -> bool:
+        return self._is_on(self._heater_eid) is True
+
+    def _heater_off(self) -> bool:
+        """Reported off (or gone) — unavailable/unknown may still be heating."""
+        st = self._hass.states.get(self._heater_eid) if self._heater_eid else None
+        return st is None or st.state == "off"
+
+    def _trip(self, entity_id: str, turn_on: bool, action: str, reason: Reason) -> None:
+        if entity_id in self._pending:
+            return
+        self._pending.add(entity_id)
+        self._hass.async_create_task(self._async_trip(entity_id, turn_on, action, reason))
+
+    async def _async_trip(
+        self, entity_id: str, turn_on: bool, action: str, reason: Reason,
+    ) -> None:
+        coord = self._coordinator
+        ctrl  = coord.control
+        try:
+            # Blocking, like the cycle's own safety trips
+            await coord._async_switch(entity_id, turn_on, blocking=True)
+        finally:
+            self._pending.discard(entity_id)
+        now = dt_util.now()
+        if entity_id == self._heater_eid:
+            device = "heater"
+            ctrl.last_heater_change = now
+            ctrl.heater_on_since    = None
+            self._cancel_max_run()
+        else:
+            device = "exhaust"
+            ctrl.last_exhaust_change = now
+            coord._increment_toggle("exhaust")
+        coord._record_action(action)
+        coord._count_action(device, reason)
+        _LOGGER.warning("%s: %s", coord.entry.title, action)
+        await coord.async_request_refresh()
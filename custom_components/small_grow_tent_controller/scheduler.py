@@ -0,0 +1,104 @@
+"""
+Wake-up scheduler — re-runs the control cycle the moment a decision can change.
+
+The heater pulse plan asks for widths such as 10 s on / 50 s off, and the
+hold times make a blocked toggle eligible at a known instant.  Checked only
+when the next cycle happens to run, a pulse ends up to a whole poll late and
+a held device waits out the rest of the poll after its hold has expired.
+
+The scheduler keeps those instants in a priority queue and one
+async_call_later timer armed for the earliest.  When it fires, every entry
+that is due is dropped and the coordinator runs a cycle, which sees the
+expired pulse / cooldown / hold and acts on it.  Entries are keyed, so
+moving a deadline replaces the old one rather than adding a second wake-up;
+replaced entries are discarded lazily when they reach the head of the queue.
+"""
+from __future__ import annotations
+
+import heapq
+from datetime import datetime
+from typing import Callable, Hashable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+# Fire this much after the deadline, so the cycle's clock reads past it
+_WAKE_SLACK_S = 0.05
+
+
+class WakeScheduler:
+    def __init__(self, hass: HomeAssistant, on_wake: Callable[[], None]) -> None:
+        self._hass    = hass
+        self._on_wake = on_wake
+        # (when, seq, key) — seq breaks ties between keys that do not compare
+        self._heap: list[tuple[datetime, int, Hashable]] = []
+        self._seq  = 0
+        # key → its current deadline; heap entries that disagree are stale
+        self._due: dict[Hashable, datetime] = {}
+        self._cancel: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+
+    @callback
+    def schedule(self, key: Hashable, when: datetime) -> None:
+        """Wake at `when`, replacing any earlier deadline under `key`."""
+        if self._due.get(key) == when:
+            return
+        self._due[key] = when
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, key))
+        self._arm()
+
+    @callback
+    def cancel(self, key: Hashable) -> None:
+        if self._due.pop(key, None) is not None:
+            self._arm()
+
+    def next_wake(self) -> datetime | None:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def _arm(self) -> None:
+        when = self.next_wake()
+        if when == self._armed_at:
+            return
+        self._disarm()
+        if when is None:
+            return
+        self._armed_at = when
+        delay = max(0.0, (when - dt_util.now()).total_seconds()) + _WAKE_SLACK_S
+        self._cancel = async_call_later(self._hass, delay, self._handle_timer)
+
+    def _disarm(self) -> None:
+        if self._cancel is not None:
+            self._cancel()
+        self._cancel   = None
+        self._armed_at = None
+
+    @callback
+    def _handle_timer(self, _now: datetime) -> None:
+        self._cancel   = None
+        self._armed_at = None
+        now   = dt_util.now()
+        fired = False
+        heap  = self._heap
+        while heap and heap[0][0] <= now:
+            when, _, key = heapq.heappop(heap)
+            if self._due.get(key) == when:
+                del self._due[key]
+                fired = True
+        self._arm()
+        if fired:
+            self._on_wake()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop every pending wake-up (entry unload)."""
+        self._disarm()
+        self._heap.clear()
+        self._due.clear()
@@ -32,6 +32,11 @@ from .const import (
 MODE_OPTIONS = ["Auto", "On", "Off"]
 
 
+def _publish(entity: SelectEntity, key: str, value: str) -> None:
+    """Push the selected option into the coordinator's live settings."""
+    entity.hass.data[DOMAIN][entity.entry.entry_id].settings.publish(key, value)
+
+
 def _opt(entry: ConfigEntry, key: str, default):
     if key in entry.options:
         return entry.options[key]
@@ -84,6 +89,7 @@ class StageSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in self._attr_options:
             self._current = last.state
+        _publish(self, "stage", self._current)
         self.async_write_ha_state()
 
     @property
@@ -94,6 +100,7 @@ class StageSelect(SelectEntity, RestoreEntity):
         if option not in self._attr_options:
             return
         self._current = option
+        _publish(self, "stage", option)
         self.async_write_ha_state()
 
 
@@ -115,6 +122,7 @@ class DeviceModeSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in MODE_OPTIONS:
             self._current = last.state
+        _publish(self, self._key, self._current)
         self.async_write_ha_state()
 
     @property
@@ -125,6 +133,7 @@ class DeviceModeSelect(SelectEntity, RestoreEntity):
         if option not in MODE_OPTIONS:
             return
         self._current = option
+        _publish(self, self._key, option)
         self.async_write_ha_state()
 
 class NightModeSelect(SelectEntity, RestoreEntity):
@@ -145,6 +154,7 @@ class NightModeSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in NIGHT_MODE_OPTIONS:
             self._current = last.state
+        _publish(self, CONF_NIGHT_MODE, self._current)
         self.async_write_ha_state()
 
     @property
@@ -155,6 +165,7 @@ class NightModeSelect(SelectEntity, RestoreEntity):
         if option not in NIGHT_MODE_OPTIONS:
             return
         self._current = option
+        _publish(self, CONF_NIGHT_MODE, option)
         self.async_write_ha_state()
 
 class ExhaustModeSelect(SelectEntity, RestoreEntity):
@@ -174,6 +185,7 @@ class ExhaustModeSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in EXHAUST_MODE_OPTIONS:
             self._current = last.state
+        _publish(self, "exhaust_mode", self._current)
         self.async_write_ha_state()
 
     @property
@@ -184,6 +196,7 @@ class ExhaustModeSelect(SelectEntity, RestoreEntity):
         if option not in EXHAUST_MODE_OPTIONS:
             return
         self._current = option
+        _publish(self, "exhaust_mode", option)
         self.async_write_ha_state()
 
 class DayModeSelect(SelectEntity, RestoreEntity):
@@ -204,6 +217,7 @@ class DayModeSelect(SelectEntity, RestoreEntity):
         last = await self.async_get_last_state()
         if last and last.state in DAY_MODE_OPTIONS:
             self._current = last.state
+        _publish(self, CONF_DAY_MODE, self._current)
         self.async_write_ha_state()
 
     @property
@@ -214,4 +228,5 @@ class DayModeSelect(SelectEntity, RestoreEntity):
         if option not in DAY_MODE_OPTIONS:
             return
         self._current = option
+        _publish(self, CONF_DAY_MODE, option)
         self.async_write_ha_state()
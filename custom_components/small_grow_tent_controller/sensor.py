@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import time
+from typing import Any
+
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -60,7 +63,31 @@ SENSORS = [
     ("mpc_r2_temp",  "MPC Model R² Temp",  None,  None,  True),
     ("mpc_r2_rh",    "MPC Model R² RH",    None,  None,  True),
     ("mpc_last_identified",  "MPC Last Identified",   None, None, True),
+    ("mpc_model_version",    "MPC Model Version",     None, None, True),
+    # Effective ambient MPC plans against (filtered lung room / weather, or
+    # the MPC Ambient numbers as fallback) — see ambient.py
+    ("mpc_temp_amb",         "MPC Effective Ambient Temp", SensorDeviceClass.TEMPERATURE, "°C", False),
+    ("mpc_rh_amb",           "MPC Effective Ambient RH",   SensorDeviceClass.HUMIDITY,    "%",  False),
     ("debug_ambient_source", "MPC Ambient Source",    None, None, True),
+    # RLS estimator bank — forgetting factor and innovation variance of the
+    # member currently feeding MPC
+    ("debug_rls_lambda_t",    "RLS Active λ Temp",          None, None, True),
+    ("debug_rls_lambda_r",    "RLS Active λ RH",            None, None, True),
+    ("debug_rls_innov_var_t", "RLS Innovation Variance Temp", None, None, True),
+    ("debug_rls_innov_var_r", "RLS Innovation Variance RH",   None, None, True),
+    ("debug_rls_change_stat", "RLS Change Statistic",         None, None, True),
+    # Switch service call duration of each device's last completed command
+    ("debug_heater_latency_ms",       "Heater Actuation Latency",       None, "ms", True),
+    ("debug_exhaust_latency_ms",      "Exhaust Actuation Latency",      None, "ms", True),
+    ("debug_humidifier_latency_ms",   "Humidifier Actuation Latency",   None, "ms", True),
+    ("debug_dehumidifier_latency_ms", "Dehumidifier Actuation Latency", None, "ms", True),
+    ("debug_circulation_latency_ms",  "Circulation Actuation Latency",  None, "ms", True),
+    ("debug_light_latency_ms",        "Light Actuation Latency",        None, "ms", True),
+    # Duration of the last control cycle — per-phase p50/p95/max, poll period
+    # and jitter are attributes (CycleTimingSensor)
+    ("debug_cycle_ms",                "Cycle Time",                     None, "ms", True),
+    # Watchdog interval chosen for the next cycle (adaptive, 3–60 s)
+    ("debug_poll_interval_s",         "Poll Interval",                  SensorDeviceClass.DURATION, "s", True),
     # Disturbance detection — disturbance_active is a BinarySensor (see binary_sensor.py)
     ("debug_disturbance_reason",       "Disturbance Reason",          None, None, True),
     ("debug_disturbance_remaining_s",  "Disturbance Hold Remaining",  None, "s",  True),
@@ -78,6 +105,14 @@ SENSORS = [
     ("exhaust_toggles",      "Exhaust Toggles",      None, None, False),
     ("humidifier_toggles",   "Humidifier Toggles",   None, None, False),
     ("dehumidifier_toggles", "Dehumidifier Toggles", None, None, False),
+    # Device duty cycles — 100 while on, 0 while off.  MEASUREMENT so the
+    # recorder keeps hourly means long after raw states are purged; those
+    # means are the duty cycles used by long-window MPC identification.
+    ("heater_duty_pct",      "Heater Duty Cycle",    None, "%",  False),
+    ("exhaust_duty_pct",     "Exhaust Duty Cycle",   None, "%",  False),
+    ("humidifier_duty_pct",  "Humidifier Duty Cycle",   None, "%",  False),
+    ("dehumidifier_duty_pct", "Dehumidifier Duty Cycle", None, "%",  False),
+    ("light_duty_pct",       "Light Duty Cycle",     None, "%",  False),
     # Total polls with valid sensor readings — hidden diagnostic, useful for VPD band context
     # (was written to the data dict every cycle but never exposed as a sensor entity until now)
     ("vpd_polls_total",      "VPD Polls Total",      None, None, True),
@@ -85,10 +120,48 @@ SENSORS = [
 
 # Numeric sensors that should be recorded in long-term statistics
 _MEASUREMENT_KEYS  = {"avg_temp_c", "avg_rh", "vpd_kpa", "dew_point_c",
-                       "vpd_pct_in_band", "vpd_pct_in_band_hours", "vpd_out_of_band_s"}
+                       "vpd_pct_in_band", "vpd_pct_in_band_hours", "vpd_out_of_band_s",
+                       "heater_duty_pct", "exhaust_duty_pct", "humidifier_duty_pct",
+                       "dehumidifier_duty_pct", "light_duty_pct",
+                       "mpc_temp_amb", "mpc_rh_amb"}
 _TOTAL_INCR_KEYS   = {"heater_toggles", "exhaust_toggles",
                        "humidifier_toggles", "dehumidifier_toggles"}
 
+# ── State-write policy ───────────────────────────────────────────────────────
+# Every coordinator update reaches every sensor, and each changed state is a
+# recorder row.  A sensor only writes when its value changed; the tables
+# below additionally hold back changes that are too small or too frequent to
+# matter.  A held-back change is still written once it is _MAX_HOLD_S old, so
+# a slow drift or a counter is never left stale for long, and a change to or
+# from unknown (None) is always written at once.
+
+# Numeric changes smaller than this are held back
+_SIGNIFICANCE = {
+    "avg_temp_c": 0.05, "avg_rh": 0.2, "vpd_kpa": 0.005, "dew_point_c": 0.05,
+    "leaf_temp_c": 0.05, "mpc_temp_amb": 0.05, "mpc_rh_amb": 0.2,
+    "temp_sensor_1_c": 0.05, "temp_sensor_2_c": 0.05, "temp_sensor_3_c": 0.05,
+    "rh_sensor_1": 0.2, "rh_sensor_2": 0.2, "rh_sensor_3": 0.2,
+    "target_vpd_implied": 0.005, "target_conflict_pct": 0.5, "target_implied_rh": 0.5,
+    "debug_heater_error_c": 0.05, "debug_heater_target_c": 0.05,
+    "debug_mpc_score": 0.01, "debug_mpc_pred_temp": 0.05,
+    "debug_mpc_pred_rh": 0.2, "debug_mpc_pred_vpd": 0.005,
+    "debug_cycle_ms": 10.0,
+    "debug_heater_latency_ms": 20.0, "debug_exhaust_latency_ms": 20.0,
+    "debug_humidifier_latency_ms": 20.0, "debug_dehumidifier_latency_ms": 20.0,
+    "debug_circulation_latency_ms": 20.0, "debug_light_latency_ms": 20.0,
+}
+# Changes closer together than this many seconds are held back — mostly the
+# keys that tick every cycle (clocks, running durations, countdowns)
+_MIN_INTERVAL_S = {
+    "debug_local_time": 60.0, "debug_local_tod": 60.0,
+    "debug_heater_on_for_s": 30.0, "vpd_out_of_band_s": 30.0,
+    "debug_disturbance_remaining_s": 10.0,
+    "debug_cycle_ms": 60.0,
+    "debug_rls_innov_var_t": 60.0, "debug_rls_innov_var_r": 60.0,
+    "debug_rls_change_stat": 30.0,
+}
+_MAX_HOLD_S = 300.0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -96,8 +169,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    # Sensors that also carry attributes
+    classes = {"debug_cycle_ms": CycleTimingSensor, "last_action": LastActionSensor}
     entities = [
-        GrowTentSensor(entry, coordinator, key, name, devcls, unit, is_debug)
+        classes.get(key, GrowTentSensor)(
+            entry, coordinator, key, name, devcls, unit, is_debug
+        )
         for key, name, devcls, unit, is_debug in SENSORS
     ]
     # Add grow journal sensor (store already loaded by __init__.py)
@@ -130,6 +207,74 @@ class GrowTentSensor(CoordinatorEntity, SensorEntity):
         if is_debug:
             self._attr_entity_registry_enabled_default = False
 
+        # Last written value and availability — see the state-write policy
+        self._value: Any = (coordinator.data or {}).get(key)
+        self._written_available = coordinator.last_update_success
+        self._written_at = time.monotonic()
+        self._significance = _SIGNIFICANCE.get(key, 0.0)
+        self._min_interval = _MIN_INTERVAL_S.get(key, 0.0)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        value = (self.coordinator.data or {}).get(self.key)
+        now   = time.monotonic()
+        if not self._should_write(value, now):
+            return
+        self._value = value
+        self._written_available = self.coordinator.last_update_success
+        self._written_at = now
+        self.async_write_ha_state()
+
+    def _should_write(self, value: Any, now: float) -> bool:
+        if self.coordinator.last_update_success != self._written_available:
+            return True
+        old = self._value
+        if value == old:
+            return False
+        if value is None or old is None:
+            return True
+        age = now - self._written_at
+        if age >= _MAX_HOLD_S:
+            return True
+        if age < self._min_interval:
+            return False
+        if (
+            self._significance
+            and isinstance(value, (int, float)) and isinstance(old, (int, float))
+            and abs(value - old) < self._significance
+        ):
+            return False
+        return True
+
     @property
     def native_value(self):
-        return (self.coordinator.data or {}).get(self.key)
+        return self._value
+
+
+class CycleTimingSensor(GrowTentSensor):
+    """Last cycle duration, with the rolling timing statistics as attributes."""
+
+    # Rebuilt every cycle — not worth a recorder row each time.  Only the
+    # attributes are excluded; the state is recorded like any other sensor
+    # (at most once a minute, see _MIN_INTERVAL_S)
+    _unrecorded_attributes = frozenset({
+        "phases_ms", "cycle_ms", "poll_period_ms", "poll_jitter_ms",
+        "cycles_over_budget", "budget_ms",
+    })
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return self.coordinator.timing.as_attributes()
+
+
+class LastActionSensor(GrowTentSensor):
+    """Last switch command, with per-reason command counts as attributes."""
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {
+            "actions_by_reason": {
+                device: dict(counts.most_common())
+                for device, counts in self.coordinator.control.action_counts.items()
+            },
+        }
@@ -0,0 +1,60 @@
+"""
+Live settings published by the integration's own switch, select and time
+entities.
+
+Each entity holds its authoritative value in memory; it pushes that value
+here when it restores and whenever it changes, and the coordinator reads
+plain attributes instead of looking up and parsing entity state strings
+every poll.  Number values take the same route through the parameter bus
+(params.py).
+
+Attribute names are the entities' unique_id suffixes.  The defaults are what
+the coordinator assumed when an entity did not exist (device disabled, or
+platforms not yet set up on the first refresh).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import time
+from typing import Any, Callable
+
+from .const import DEFAULT_STAGE, DAY_MODE_VPD, NIGHT_MODE_DEW
+
+
+@dataclass(slots=True)
+class Settings:
+    # Switches
+    controller:               bool = True
+    vpd_chase_enabled:        bool = True
+    rls_enabled:              bool = False
+    mpc_auto_identify_weekly: bool = False
+    exhaust_safety_override:  bool = False
+    disturbance_active:       bool = False
+    # Selects
+    stage:             str = DEFAULT_STAGE
+    night_mode:        str = NIGHT_MODE_DEW
+    day_mode:          str = DAY_MODE_VPD
+    light_mode:        str = "Auto"
+    circulation_mode:  str = "Auto"
+    exhaust_mode:      str = "Auto"
+    heater_mode:       str = "Auto"
+    humidifier_mode:   str = "Auto"
+    dehumidifier_mode: str = "Auto"
+    # Light schedule — must match the defaults in time.py
+    light_on:  time = time(9, 0, 0)
+    light_off: time = time(21, 0, 0)
+    # Called with the key after a value changes
+    on_change: Callable[[str], None] | None = None
+
+    def publish(self, key: str, value: Any) -> None:
+        """Set one setting from its entity; notifies on_change if it moved."""
+        if key not in _KEYS:
+            raise KeyError(key)
+        if getattr(self, key) == value:
+            return
+        setattr(self, key, value)
+        if self.on_change is not None:
+            self.on_change(key)
+
+
+_KEYS = frozenset(f.name for f in fields(Settings) if f.name != "on_change")
@@ -0,0 +1,70 @@
+"""
+Per-cycle snapshot of the external entity states the controller reads.
+
+One poll reads the same switch from several places — the override and auto
+decisions, the structured log line, the duty columns and the RLS / lag
+history.  Each hass.states lookup could see a different value (a device
+reporting back between two reads, or a non-blocking switch call landing
+mid-cycle), so the coordinator takes one pass over every configured
+sensor, switch and ambient entity at the start of the cycle and all
+consumers read from that.
+
+Switch commands issued during the cycle are recorded on top of the snapshot:
+is_on() answers with the commanded state, so the readers after actuation
+(log line, duty, RLS inputs) agree with what the controller just did rather
+than with whenever the device happens to report.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable
+
+from homeassistant.core import HomeAssistant, State
+
+from .climate_math import safe_float
+
+
+class StateSnapshot:
+    __slots__ = ("_hass", "_states", "_commanded")
+
+    def __init__(self, hass: HomeAssistant, entity_ids: Iterable[str] = ()) -> None:
+        self._hass = hass
+        self._states: dict[str, State | None] = {}
+        self._commanded: dict[str, bool] = {}
+        get = hass.states.get
+        for eid in entity_ids:
+            if eid and eid not in self._states:
+                self._states[eid] = get(eid)
+
+    def get(self, entity_id: str) -> State | None:
+        """State as of the snapshot.  Entities outside the initial pass are
+        read on first use and then held for the rest of the cycle."""
+        try:
+            return self._states[entity_id]
+        except KeyError:
+            st = self._states[entity_id] = self._hass.states.get(entity_id)
+            return st
+
+    def get_float(self, entity_id: str) -> float | None:
+        st = self.get(entity_id)
+        return None if st is None else safe_float(st.state)
+
+    def is_on(self, entity_id: str | None) -> bool | None:
+        if not entity_id:
+            return None
+        if entity_id in self._commanded:
+            return self._commanded[entity_id]
+        return self.reported(entity_id)
+
+    def reported(self, entity_id: str | None) -> bool | None:
+        """Switch state as the device reported it, ignoring this cycle's commands."""
+        st = self.get(entity_id) if entity_id else None
+        return None if st is None else st.state == "on"
+
+    def last_updated(self, entity_id: str) -> datetime | None:
+        st = self.get(entity_id)
+        return None if st is None else st.last_updated
+
+    def command(self, entity_id: str, turn_on: bool) -> None:
+        """Record a switch command issued this cycle."""
+        self._commanded[entity_id] = turn_on
@@ -70,14 +70,20 @@ class _StoredSwitch(SwitchEntity):
         self._state_dict = state_dict   # shared mutable dict - all switches for this entry
         self._attr_unique_id   = f"{entry.entry_id}_{unique_suffix}"
         self._attr_device_info = device_info_for_entry(entry)
+        self._settings_key     = unique_suffix
         self._is_on = bool(state_dict.get(self._store_key, self._default_on))
 
     async def async_added_to_hass(self) -> None:
         # State was already loaded into state_dict during async_setup_entry;
         # just apply it and write HA state.
         self._is_on = bool(self._state_dict.get(self._store_key, self._default_on))
+        self._publish()
         self.async_write_ha_state()
 
+    def _publish(self) -> None:
+        """Push the current value into the coordinator's live settings."""
+        self.hass.data[DOMAIN][self.entry.entry_id].settings.publish(self._settings_key, self._is_on)
+
     async def _save(self) -> None:
         """Persist the current value atomically.
 
@@ -95,11 +101,13 @@ class _StoredSwitch(SwitchEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         self._is_on = True
+        self._publish()
         await self._save()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         self._is_on = False
+        self._publish()
         await self._save()
         self.async_write_ha_state()
 
@@ -120,6 +128,7 @@ class ControllerSwitch(_StoredSwitch):
             self._is_on = bool(self._state_dict["is_on"])
         else:
             self._is_on = self._default_on
+        self._publish()
         self.async_write_ha_state()
 
 
@@ -161,7 +170,9 @@ class RlsSwitch(_StoredSwitch):
 
 
 class MpcAutoIdentifySwitch(_StoredSwitch):
-    """When ON, automatically re-identifies the MPC model once per week."""
+    """When ON, automatically re-identifies the MPC model when the RLS change
+    detector sees the plant change — or once per week while RLS is off.
+    Name and store key keep "weekly" so entity IDs and settings carry over."""
 
     _store_key  = "mpc_auto_identify_weekly"
     _default_on = False
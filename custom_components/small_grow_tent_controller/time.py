@@ -11,7 +11,8 @@ from homeassistant.helpers.storage import Store
 from .device_info import device_info_for_entry
 from .const import DOMAIN, CONF_USE_LIGHT
 
-# Must match _DEFAULT_LIGHT_ON / _DEFAULT_LIGHT_OFF in coordinator.py
+# Must match _DEFAULT_LIGHT_ON / _DEFAULT_LIGHT_OFF in coordinator.py and the
+# light_on / light_off defaults in settings.py
 TIMES = [
     ("light_on", "Light On Time", time(9, 0, 0)),
     ("light_off", "Light Off Time", time(21, 0, 0)),
@@ -51,13 +52,19 @@ class GrowTime(TimeEntity):
                 self._value = time(int(hh), int(mm), int(ss))
             except Exception:
                 pass
+        self._publish()
         self.async_write_ha_state()
 
+    def _publish(self) -> None:
+        """Push the current value into the coordinator's live settings."""
+        self.hass.data[DOMAIN][self.entry.entry_id].settings.publish(self.key, self._value)
+
     @property
     def native_value(self):
         return self._value
 
     async def async_set_value(self, value: time):
         self._value = value
+        self._publish()
         await self.store.async_save({"value": value.strftime("%H:%M:%S")})
         self.async_write_ha_state()
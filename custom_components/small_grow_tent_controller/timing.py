@@ -0,0 +1,118 @@
+"""
+Per-phase timing of the control cycle.
+
+A cycle that runs long on a slow host (a Raspberry Pi busy with the
+recorder, an MPC solve on a loaded executor) delays the next one and, with
+it, every reaction the controller makes.  The total alone does not say
+where the time went, so the cycle marks its phase boundaries with lap():
+each lap closes the phase that just ran.  Completed cycles feed rolling
+windows per phase, and the cycle-start interval feeds a window of its own,
+with a smoothed jitter (the RFC 3550 interarrival estimator).
+
+A cycle longer than CYCLE_BUDGET_S logs a WARNING naming its slowest
+phases, at most once per WARN_EVERY_S.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+
+_LOGGER = logging.getLogger(__name__)
+
+# Cycles kept per rolling window — about an hour at the default 10 s poll
+WINDOW = 360
+# A cycle taking longer than this is reported
+CYCLE_BUDGET_S = 2.0
+# ... but no more than once per this many seconds
+WARN_EVERY_S = 600.0
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    idx = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _summary(window: deque[float]) -> dict[str, float]:
+    ordered = sorted(window)
+    return {
+        "p50": round(_percentile(ordered, 0.50), 1),
+        "p95": round(_percentile(ordered, 0.95), 1),
+        "max": round(ordered[-1], 1),
+    }
+
+
+class CycleTimer:
+    def __init__(self, title: str) -> None:
+        self._title = title
+        # phase → last WINDOW durations, ms
+        self._phases: dict[str, deque[float]] = {}
+        self._total:  deque[float] = deque(maxlen=WINDOW)
+        self._period: deque[float] = deque(maxlen=WINDOW)
+        self._jitter_ms = 0.0
+        # This cycle
+        self._start:   float | None = None
+        self._mark:    float = 0.0
+        self._current: dict[str, float] = {}
+        # Previous cycle start and period, for the period / jitter windows
+        self._last_start:  float | None = None
+        self._last_period: float | None = None
+        self._last_warn:   float | None = None
+        self.over_budget = 0
+
+    def begin(self) -> None:
+        now = time.monotonic()
+        if self._last_start is not None:
+            period = (now - self._last_start) * 1000.0
+            self._period.append(period)
+            if self._last_period is not None:
+                self._jitter_ms += (abs(period - self._last_period) - self._jitter_ms) / 16.0
+            self._last_period = period
+        self._last_start = now
+        self._start = self._mark = now
+        self._current = {}
+
+    def lap(self, phase: str) -> None:
+        """Close `phase`: everything since the previous lap (or begin) ran in it."""
+        now = time.monotonic()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._mark) * 1000.0
+        self._mark = now
+
+    def end(self) -> float:
+        """Close the cycle; returns its duration in ms."""
+        if self._start is None:
+            return 0.0
+        now   = time.monotonic()
+        total = (now - self._start) * 1000.0
+        self._start = None
+        self._total.append(total)
+        for phase, ms in self._current.items():
+            window = self._phases.get(phase)
+            if window is None:
+                window = self._phases[phase] = deque(maxlen=WINDOW)
+            window.append(ms)
+        if total > CYCLE_BUDGET_S * 1000.0:
+            self.over_budget += 1
+            if self._last_warn is None or now - self._last_warn >= WARN_EVERY_S:
+                self._last_warn = now
+                slowest = sorted(self._current.items(), key=lambda kv: kv[1], reverse=True)[:3]
+                _LOGGER.warning(
+                    "%s: control cycle took %.0f ms (budget %.0f ms) — slowest phases: %s",
+                    self._title, total, CYCLE_BUDGET_S * 1000.0,
+                    ", ".join(f"{name} {ms:.0f} ms" for name, ms in slowest),
+                )
+        return round(total, 1)
+
+    def as_attributes(self) -> dict:
+        attrs: dict = {
+            "phases_ms": {name: _summary(w) for name, w in self._phases.items() if w},
+            "cycles_over_budget": self.over_budget,
+            "budget_ms": CYCLE_BUDGET_S * 1000.0,
+        }
+        if self._total:
+            attrs["cycle_ms"] = _summary(self._total)
+        if self._period:
+            attrs["poll_period_ms"] = _summary(self._period)
+            attrs["poll_jitter_ms"] = round(self._jitter_ms, 1)
+        return attrs